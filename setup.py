@@ -31,7 +31,7 @@ setup(
     
     # Archivos de datos
     package_data={
-        "triptafittings.data.presets": ["*.csv"],
+        "triptafittings.data.presets": ["*.csv", "*.json"],
         "": ["*.svg", "*.xml"],
     },
     
@@ -57,6 +57,10 @@ setup(
     
     # Dependencias opcionales para desarrollo
     extras_require={
+        # Acelera PresetTable (columnas vectorizadas); sin NumPy se usa array('d')
+        "numpy": [
+            "numpy",
+        ],
         "dev": [
             "pytest",
             "pytest-cov",
@@ -71,6 +75,7 @@ setup(
         "console_scripts": [
             "triptafittings-test=tools.run_tests:main",
             "triptafittings-diagnose=tools.diagnose_plugin:main",
+            "triptafittings-generate=triptafittings.cli:main",
         ],
     },
     
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Generación masiva de modelos desde la línea de comandos.
+
+Expone el comando ``triptafittings-generate``, que selecciona presets por
+componente, rangos de tamaño y estándar, genera los modelos con
+``UserInterface.generate_models`` y escribe un JSON por modelo junto con
+un ``manifest.json``.  No necesita la GUI de FreeCAD: se usan los
+generadores de geometría en forma de diccionario.
+
+Ejemplo::
+
+    triptafittings-generate -c ferrule -s 1:3 -s 6 -o salida --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import __version__
+from .core.batch import GenerationRequest
+from .core.data_manager import DataManager
+from .core.export import EXPORT_FORMATS, export_models
+from .generators.factory import GENERATORS
+from .ui.interface import UserInterface
+
+MANIFEST_NAME = "manifest.json"
+
+# Rango de tamaños cerrado en pulgadas; ``None`` = sin límite
+SizeRange = Tuple[Optional[float], Optional[float]]
+
+
+def parse_size_range(text: str) -> SizeRange:
+    """Convierte ``"3"``, ``"1.5:4"``, ``":2"`` o ``"6:"`` en un rango cerrado.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        Si el texto no es un número o rango válido.
+    """
+    try:
+        if ":" not in text:
+            value = float(text)
+            return value, value
+        low, high = text.split(":", 1)
+        bounds = (float(low) if low.strip() else None,
+                  float(high) if high.strip() else None)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tamaño o rango inválido: {text!r}")
+    if None not in bounds and bounds[0] > bounds[1]:
+        raise argparse.ArgumentTypeError(f"Rango vacío: {text!r}")
+    return bounds
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Crea el parser de argumentos de ``triptafittings-generate``."""
+    parser = argparse.ArgumentParser(
+        prog="triptafittings-generate",
+        description="Genera modelos de TriptaFittings a partir de los presets.",
+    )
+    parser.add_argument(
+        "-c", "--component", action="append", choices=sorted(GENERATORS),
+        help="Componente a generar (repetible; por defecto todos)",
+    )
+    parser.add_argument(
+        "-s", "--size", action="append", type=parse_size_range, metavar="RANGO",
+        help="Tamaño o rango en pulgadas: 3, 1.5:4, :2, 6: (repetible; por defecto todos)",
+    )
+    parser.add_argument(
+        "--standard", action="append",
+        help="Estándar de los presets, ej. 'DIN 32676 A' (repetible)",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, required=True,
+        help="Directorio de salida",
+    )
+    parser.add_argument(
+        "-e", "--export", action="append", type=str.upper, choices=sorted(EXPORT_FORMATS),
+        metavar="FORMATO",
+        help="Exportar además a STEP, STL o DXF (repetible; STEP requiere FreeCAD)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Procesos de generación (1 = secuencial)",
+    )
+    parser.add_argument(
+        "--threads", action="store_true",
+        help="Usar hilos en lugar de procesos (STEP siempre usa hilos)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        help="Directorio con los CSV de presets (por defecto los del paquete)",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return parser
+
+
+def select_requests(
+    manager: DataManager,
+    components: Sequence[str],
+    sizes: Optional[Sequence[SizeRange]] = None,
+    standards: Optional[Sequence[str]] = None,
+) -> List[GenerationRequest]:
+    """Construye las solicitudes ``(componente, tamaño)`` que cumplen los filtros.
+
+    Parameters
+    ----------
+    manager:
+        Gestor de datos con el catálogo.
+    components:
+        Componentes a incluir.
+    sizes:
+        Rangos de tamaño aceptados (``None`` = todos).
+    standards:
+        Estándares aceptados (``None`` = todos).
+    """
+    requests: List[GenerationRequest] = []
+    for component in components:
+        for preset in manager.get_presets_by_type(component):
+            if standards and preset.standard not in standards:
+                continue
+            if sizes and not any(
+                (low is None or preset.size >= low) and (high is None or preset.size <= high)
+                for low, high in sizes
+            ):
+                continue
+            requests.append((component, preset.size))
+    return requests
+
+
+def write_outputs(
+    output_dir: Path, report: Dict[str, Any], options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Escribe un JSON por modelo y el manifiesto del lote.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Contenido del manifiesto escrito.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    entries = []
+    for model in report["models"]:
+        payload = json.dumps(model, indent=2, sort_keys=True, default=str).encode("utf-8")
+        file_name = f"{model['name']}.json"
+        (output_dir / file_name).write_bytes(payload)
+        parameters = model.get("parameters", {})
+        entries.append({
+            "name": model["name"],
+            "component": model["component"],
+            "size": parameters.get("Size"),
+            "dn": parameters.get("DN"),
+            "standard": parameters.get("Standard"),
+            "file": file_name,
+            "sha256": hashlib.sha256(payload).hexdigest(),
+        })
+
+    manifest = {
+        "generator": "triptafittings",
+        "version": __version__,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "options": options,
+        "total": report["total"],
+        "models": entries,
+        "failures": report["failures"],
+    }
+    (output_dir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, default=str), encoding="utf-8"
+    )
+    return manifest
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Punto de entrada de ``triptafittings-generate``.
+
+    Returns
+    -------
+    int
+        ``0`` si todos los modelos se generaron, ``1`` si hubo fallos o
+        ninguna solicitud.
+    """
+    args = build_parser().parse_args(argv)
+    if args.workers < 1:
+        print("❌ --workers debe ser al menos 1", file=sys.stderr)
+        return 1
+
+    components = args.component or sorted(GENERATORS)
+    ui = UserInterface(data_manager=DataManager(args.data_dir))
+    if not ui.data_manager.ensure_loaded():
+        print("❌ No se pudieron cargar los presets", file=sys.stderr)
+        return 1
+
+    requests = select_requests(ui.data_manager, components, args.size, args.standard)
+    if not requests:
+        print("⚠️  Ningún preset coincide con los filtros", file=sys.stderr)
+        return 1
+
+    report = ui.generate_models(
+        requests, workers=args.workers, use_processes=not args.threads
+    )
+    options = {
+        "components": components,
+        "sizes": args.size,
+        "standards": args.standard,
+        "workers": args.workers,
+    }
+    manifest = write_outputs(args.output, report, options)
+
+    print(f"✅ {len(manifest['models'])}/{report['total']} modelos escritos en {args.output}")
+    for failure in report["failures"]:
+        print(f"❌ {failure['component']} {failure['size']}: {failure['error']}", file=sys.stderr)
+
+    export_failures: List[Dict[str, Any]] = []
+    if args.export:
+        exported = export_models(
+            report["models"], args.output, args.export,
+            workers=args.workers, use_processes=not args.threads,
+        )
+        export_failures = exported["failures"]
+        print(f"✅ {exported['written']} archivos exportados, "
+              f"{exported['skipped']} ya estaban al día")
+        for failure in export_failures:
+            print(f"❌ {failure['name']} {failure['format']}: {failure['error']}", file=sys.stderr)
+    return 1 if report["failures"] or export_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Generación de modelos por lotes.
+
+Reparte la generación de muchos presets entre un pool de hilos o de
+procesos y entrega los resultados a medida que terminan.  Un fallo en un
+elemento se reporta en su ``GenerationResult`` sin detener el lote.
+"""
+from __future__ import annotations
+
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from ..data.preset import Preset
+from ..generators.cache import GeometryCache
+from ..generators.factory import generate_geometry
+
+# Solicitud de generación: (componente, tamaño en pulgadas)
+GenerationRequest = Tuple[str, float]
+
+
+class GenerationResult(NamedTuple):
+    """Resultado de generar un elemento del lote."""
+
+    index: int
+    request: GenerationRequest
+    model: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """``True`` si el modelo se generó correctamente."""
+        return self.error is None
+
+
+def run_batch(
+    jobs: Iterable[Tuple[int, GenerationRequest, Preset]],
+    workers: Optional[int] = None,
+    use_processes: bool = False,
+    cache: Optional[GeometryCache] = None,
+) -> Iterator[GenerationResult]:
+    """Genera la geometría de cada preset y entrega los resultados al terminar.
+
+    Parameters
+    ----------
+    jobs:
+        Tuplas ``(índice, solicitud, preset)``.
+    workers:
+        Número de trabajadores.  ``None`` usa el valor por defecto del
+        pool; ``1`` o menos genera en el hilo actual sin pool.
+    use_processes:
+        Usa ``ProcessPoolExecutor`` en lugar de hilos.  Conviene cuando la
+        generación es intensiva en CPU (sólidos reales); para la geometría
+        basada en diccionarios un pool de hilos es suficiente.
+    cache:
+        Cache de geometría opcional.  Con procesos cada trabajador usa
+        su propia memoria y comparte solo el nivel de disco.
+
+    Yields
+    ------
+    GenerationResult
+        En orden de finalización, no de solicitud.
+    """
+    jobs = list(jobs)
+    if workers is not None and workers <= 1:
+        for index, request, preset in jobs:
+            yield _generate_one(index, request, preset, cache)
+        return
+
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    executor: Executor = executor_class(max_workers=workers)
+    futures: Dict[Any, Tuple[int, GenerationRequest]] = {}
+    try:
+        for index, request, preset in jobs:
+            futures[executor.submit(generate_geometry, preset, cache)] = (index, request)
+        for future in as_completed(futures):
+            index, request = futures[future]
+            try:
+                yield GenerationResult(index, request, model=future.result())
+            except Exception as e:
+                yield GenerationResult(index, request, error=str(e))
+    finally:
+        # Si el consumidor abandona la iteración se cancela lo pendiente
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _generate_one(
+    index: int,
+    request: GenerationRequest,
+    preset: Preset,
+    cache: Optional[GeometryCache],
+) -> GenerationResult:
+    """Genera un único elemento capturando su error."""
+    try:
+        return GenerationResult(index, request, model=generate_geometry(preset, cache))
+    except Exception as e:
+        return GenerationResult(index, request, error=str(e))
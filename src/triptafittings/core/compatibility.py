@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Índice de compatibilidad entre componentes de una unión sanitaria
+
+Dos componentes se acoplan cuando comparten una *interfaz*: las cotas que
+definen el contacto entre ellos, sin importar el estándar del catálogo.
+Ferrule y Gasket se acoplan por el asiento de la abrazadera (FlangeOD y
+diámetro del asiento C2/BeadC2), así que un Gasket de otro estándar con
+las mismas cotas también es válido.
+
+CompatibilityIndex agrupa los presets por (interfaz, cotas) una sola vez,
+con las cotas discretizadas en celdas de INTERFACE_RESOLUTION_MM;
+responder "qué se acopla con X" es leer la celda de X y sus vecinas y
+comparar solo esos pocos presets. Agregar un componente con catálogo
+(abrazaderas, extremos de tubo) es declarar sus columnas en INTERFACES.
+"""
+
+import itertools
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    from ..data.preset import Preset
+except ImportError:
+    # Para ejecución directa del script
+    import sys
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from data.preset import Preset
+
+# Interfaz -> componente -> atributos de Preset que la definen (en orden)
+INTERFACES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    # Cara de la brida contra la junta, apretada por la abrazadera
+    'clamp_seat': {
+        'ferrule': ('flange_od_mm', 'c2_mm'),
+        'gasket': ('flange_od_mm', 'bead_c2_mm'),
+    },
+}
+
+# Cotas que difieren menos que esto (mm) se consideran iguales. También es
+# el ancho de las celdas del índice: dos cotas iguales caen en la misma
+# celda o en celdas contiguas
+INTERFACE_RESOLUTION_MM = 0.01
+
+# Unión sanitaria clamp: componente -> cantidad por unión
+SANITARY_CONNECTION: Dict[str, int] = {
+    'ferrule': 2,
+    'gasket': 1,
+    'clamp': 1,
+}
+
+Key = Tuple[str, Tuple[int, ...]]
+
+
+def _equal(first: Sequence[float], second: Sequence[float]) -> bool:
+    """True si las cotas de dos interfaces coinciden dentro de la tolerancia"""
+    return all(abs(a - b) < INTERFACE_RESOLUTION_MM for a, b in zip(first, second))
+
+
+class BOMLine(NamedTuple):
+    """Línea de una lista de materiales"""
+    component: str
+    quantity: int
+    preset: Optional[Preset]  # None si el componente no tiene catálogo
+    description: str
+
+
+class CompatibilityIndex:
+    """
+    Presets agrupados por interfaz para consultas de acoplamiento O(1)
+    """
+    
+    def __init__(self, presets: Iterable[Preset] = (),
+                 interfaces: Optional[Dict[str, Dict[str, Tuple[str, ...]]]] = None):
+        """
+        Construye el índice
+        
+        Args:
+            presets: Presets de cualquier componente y estándar
+            interfaces: Interfaces a indexar (por defecto INTERFACES)
+        """
+        self.interfaces = INTERFACES if interfaces is None else interfaces
+        self._buckets: Dict[Key, Dict[str, List[Tuple[int, Preset]]]] = {}
+        self._count = 0
+        self.add(presets)
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def add(self, presets: Iterable[Preset]) -> None:
+        """Agrega presets al índice (ej: los de otro estándar)"""
+        for preset in presets:
+            for key in self.keys(preset):
+                bucket = self._buckets.setdefault(key, {})
+                bucket.setdefault(preset.component_type, []).append((self._count, preset))
+            self._count += 1
+    
+    def keys(self, preset: Preset) -> List[Key]:
+        """Claves (interfaz, celdas) de un preset, una por interfaz que expone"""
+        return [(interface, tuple(math.floor(value / INTERFACE_RESOLUTION_MM) for value in values))
+                for interface, values in self._interface_values(preset)]
+    
+    def _interface_values(self, preset: Preset) -> List[Tuple[str, Tuple[float, ...]]]:
+        """Cotas de cada interfaz que expone ``preset``"""
+        values = []
+        for interface, components in self.interfaces.items():
+            attributes = components.get(preset.component_type)
+            if attributes:
+                values.append((interface, tuple(getattr(preset, a) for a in attributes)))
+        return values
+    
+    # ------------------------------------------------------------------
+    def mates(self, preset: Preset, component: Optional[str] = None) -> Dict[str, List[Preset]]:
+        """
+        Presets de otros componentes que comparten una interfaz con ``preset``
+        
+        Args:
+            preset: Preset consultado (no necesita estar en el índice)
+            component: Si se indica, solo se retornan los de ese componente
+        
+        Returns:
+            Diccionario componente -> presets que se acoplan, en el orden en
+            que se agregaron al índice
+        """
+        found: Dict[str, Dict[int, Preset]] = {}
+        for interface, values in self._interface_values(preset):
+            cells = [math.floor(value / INTERFACE_RESOLUTION_MM) for value in values]
+            # Una cota igual dentro de la tolerancia está en la celda o en una vecina
+            for offsets in itertools.product((-1, 0, 1), repeat=len(cells)):
+                key = (interface, tuple(c + o for c, o in zip(cells, offsets)))
+                for other, entries in self._buckets.get(key, {}).items():
+                    if other == preset.component_type or (component and other != component):
+                        continue
+                    attributes = self.interfaces[interface][other]
+                    for order, candidate in entries:
+                        if _equal(values, tuple(getattr(candidate, a) for a in attributes)):
+                            found.setdefault(other, {})[order] = candidate
+        return {other: [candidate for _, candidate in sorted(candidates.items())]
+                for other, candidates in found.items()}
+    
+    def best_mate(self, preset: Preset, component: str) -> Optional[Preset]:
+        """
+        Pareja preferida de ``preset`` entre los presets de ``component``
+        
+        Args:
+            preset: Preset consultado
+            component: Componente de la pareja
+        
+        Returns:
+            Preset del mismo estándar y tamaño, si no del mismo estándar, si
+            no cualquiera; None si no hay ninguno compatible
+        """
+        candidates = self.mates(preset, component).get(component, [])
+        if not candidates:
+            return None
+        
+        def rank(candidate: Preset) -> int:
+            same_standard = candidate.standard == preset.standard
+            return 0 if same_standard and candidate.size == preset.size else (
+                1 if same_standard else 2)
+        return min(candidates, key=rank)
+    
+    def are_compatible(self, first: Preset, second: Preset) -> bool:
+        """True si dos presets de distinto componente comparten una interfaz"""
+        if first.component_type == second.component_type:
+            return False
+        second_values = dict(self._interface_values(second))
+        return any(interface in second_values and _equal(values, second_values[interface])
+                   for interface, values in self._interface_values(first))
+    
+    def unmatched(self, component: str, mate_component: str) -> List[Preset]:
+        """Presets de ``component`` sin ninguna pareja de ``mate_component``"""
+        seen = set()
+        unmatched = []
+        for bucket in self._buckets.values():
+            for _, preset in bucket.get(component, ()):
+                if preset not in seen:
+                    seen.add(preset)
+                    if not self.mates(preset, mate_component):
+                        unmatched.append(preset)
+        return unmatched
+    
+    # ------------------------------------------------------------------
+    def connection_bom(self, preset: Preset) -> List[BOMLine]:
+        """
+        Lista de materiales de una unión sanitaria clamp que usa ``preset``
+        
+        La unión son dos Ferrule, un Gasket y una abrazadera
+        (SANITARY_CONNECTION). El otro componente es el ``best_mate`` de
+        ``preset``. No hay catálogo de abrazaderas: la abrazadera se describe
+        por el FlangeOD que debe abrazar y su línea no tiene preset.
+        
+        Args:
+            preset: Ferrule o Gasket de la unión
+        
+        Returns:
+            Líneas de Ferrule, Gasket y abrazadera
+        
+        Raises:
+            ValueError: Si el componente no forma parte de la unión o falta
+                su pareja
+        """
+        if preset.component_type == 'ferrule':
+            ferrule = preset
+            gasket = self.best_mate(ferrule, 'gasket')
+        elif preset.component_type == 'gasket':
+            gasket = preset
+            ferrule = self.best_mate(gasket, 'ferrule')
+        else:
+            raise ValueError(f"{preset.component_type} no forma parte de una unión clamp")
+        if ferrule is None or gasket is None:
+            missing = 'Gasket' if gasket is None else 'Ferrule'
+            raise ValueError(f"No hay {missing} compatible con {preset}")
+        
+        return [
+            BOMLine('ferrule', SANITARY_CONNECTION['ferrule'], ferrule, ferrule.get_name()),
+            BOMLine('gasket', SANITARY_CONNECTION['gasket'], gasket, gasket.get_name()),
+            BOMLine('clamp', SANITARY_CONNECTION['clamp'], None,
+                    f"Abrazadera clamp para brida Ø{ferrule.flange_od_mm:g} mm"),
+        ]
+    
+    def assembly_bom(self, presets: Sequence[Preset]) -> List[BOMLine]:
+        """
+        Lista de materiales agregada de varias uniones (una por preset)
+        
+        Las líneas iguales se suman; el orden es el de primera aparición.
+        
+        Args:
+            presets: Ferrule o Gasket de cada unión
+        
+        Returns:
+            Líneas con las cantidades totales
+        
+        Raises:
+            ValueError: Si alguna unión no se puede completar (ver
+                ``connection_bom``)
+        """
+        totals: Dict[Tuple[str, Optional[Preset], str], int] = {}
+        for preset in presets:
+            for line in self.connection_bom(preset):
+                key = (line.component, line.preset, line.description)
+                totals[key] = totals.get(key, 0) + line.quantity
+        return [BOMLine(component, quantity, preset, description)
+                for (component, preset, description), quantity in totals.items()]
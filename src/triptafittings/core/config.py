@@ -7,9 +7,41 @@ such as units, supported standards and export options.
 """
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
+import atexit
 import json
-from typing import Any, Dict
+import os
+import logging
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Callback notified on changes: ``callback(key, old_value, new_value)``.
+#: ``old_value``/``new_value`` are ``None`` for added/removed keys.
+ChangeCallback = Callable[[str, Any, Any], None]
+
+
+def default_config_dir() -> Path:
+    """Return the per-user configuration directory of TriptaFittings.
+
+    ``%APPDATA%`` on Windows, ``~/Library/Application Support`` on macOS
+    and ``$XDG_CONFIG_HOME`` (or ``~/.config``) elsewhere, plus
+    ``triptafittings``.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.join(
+            os.path.expanduser("~"), "AppData", "Roaming")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+            os.path.expanduser("~"), ".config")
+    return Path(base) / "triptafittings"
 
 
 class ConfigurationManager:
@@ -21,6 +53,25 @@ class ConfigurationManager:
         Path to the configuration file.  If ``None`` a file named
         ``triptafittings_config.json`` is created in the current
         working directory.
+    write_behind:
+        If ``True`` ``set_setting`` only marks the configuration as dirty
+        and the file is written once ``debounce`` seconds after the last
+        change (and on interpreter exit).  Otherwise every change outside
+        a :meth:`batch` is written immediately.
+    debounce:
+        Quiet period, in seconds, before a write-behind flush.
+    reload_interval:
+        If set, reads check the file's mtime at most once every
+        ``reload_interval`` seconds and reload it when another process
+        changed it.  ``None`` disables the check.
+    create:
+        If ``True`` a missing file is created with the defaults on load.
+        Otherwise the defaults stay in memory and the file is only
+        written by the first change.
+
+    Writes are atomic: the JSON is written to a temporary file in the
+    same directory and moved over the configuration file with
+    ``os.replace``.
     """
 
     DEFAULT_CONFIG: Dict[str, Any] = {
@@ -34,44 +85,268 @@ class ConfigurationManager:
         "documentation_language": "en",
     }
 
-    def __init__(self, config_file: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        config_file: str | Path | None = None,
+        write_behind: bool = False,
+        debounce: float = 0.5,
+        reload_interval: float | None = None,
+        create: bool = True,
+    ) -> None:
         self.config_file = Path(config_file) if config_file else Path(
             "triptafittings_config.json"
         )
         self.config: Dict[str, Any] = {}
+        self.write_behind = write_behind
+        self.debounce = debounce
+
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._batch_depth = 0
+        self._timer: Optional[threading.Timer] = None
+
+        self.reload_interval = reload_interval
+        self._mtime_ns: Optional[int] = None
+        self._next_check = 0.0
+        self._subscribers: List[ChangeCallback] = []
+
+        self.create = create
         self.load_configuration()
+        if write_behind:
+            atexit.register(self.flush)
 
     # ------------------------------------------------------------------
     def load_configuration(self) -> None:
         """Load configuration from disk or create defaults.
 
-        If the file does not exist it is created with the default
-        configuration.
+        If the file does not exist the default configuration is used and,
+        if ``create`` is set, written to disk.
         """
 
         try:
             with self.config_file.open("r", encoding="utf-8") as fh:
                 self.config = json.load(fh)
+            self._mtime_ns = self._stat_mtime()
         except FileNotFoundError:
             self.config = self.DEFAULT_CONFIG.copy()
-            # Ensure parent directory exists before saving
-            if not self.config_file.parent.exists():
-                self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            self.save_configuration()
+            if self.create:
+                self.save_configuration()
 
     # ------------------------------------------------------------------
     def save_configuration(self) -> None:
-        """Persist current configuration to disk."""
-        with self.config_file.open("w", encoding="utf-8") as fh:
-            json.dump(self.config, fh, indent=2)
+        """Persist current configuration to disk atomically."""
+        with self._lock:
+            self._cancel_timer()
+            payload = json.dumps(self.config, indent=2)
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=self.config_file.name, dir=str(self.config_file.parent)
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(payload)
+                    # Contents on disk before the rename: after a crash the
+                    # file is either the old or the new version, never empty
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                os.replace(tmp_name, self.config_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            self._dirty = False
+            self._mtime_ns = self._stat_mtime()
 
     # ------------------------------------------------------------------
     def get_setting(self, key: str, default: Any | None = None) -> Any:
         """Return a configuration value."""
+        if self.reload_interval is not None:
+            self.check_for_changes()
         return self.config.get(key, default)
 
     # ------------------------------------------------------------------
     def set_setting(self, key: str, value: Any) -> None:
-        """Update a configuration value and save to disk."""
-        self.config[key] = value
+        """Update a configuration value and save to disk.
+
+        Inside :meth:`batch` or in write-behind mode the write is deferred.
+        """
+        with self._lock:
+            old = self.config.get(key)
+            self.config[key] = value
+            self._dirty = True
+            deferred = bool(self._batch_depth)
+        if old != value:
+            self._notify([(key, old, value)])
+        if not deferred:
+            self._commit()
+
+    # ------------------------------------------------------------------
+    def subscribe(self, callback: ChangeCallback) -> Callable[[], None]:
+        """Register ``callback(key, old, new)`` for configuration changes.
+
+        Callbacks run for ``set_setting`` calls and for changes picked up
+        from disk by :meth:`check_for_changes`.
+
+        Returns
+        -------
+        Callable[[], None]
+            Function that removes the subscription.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    # ------------------------------------------------------------------
+    def check_for_changes(self, force: bool = False) -> bool:
+        """Reload the file if another writer changed it.
+
+        The ``stat`` call is throttled to once per ``reload_interval``
+        seconds unless ``force`` is given.  Local unsaved changes take
+        precedence, so a dirty configuration is never reloaded.
+
+        Returns
+        -------
+        bool
+            ``True`` if the configuration was reloaded.
+        """
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+        self._next_check = now + (self.reload_interval or 0.0)
+
+        mtime_ns = self._stat_mtime()
+        if mtime_ns is None or mtime_ns == self._mtime_ns:
+            return False
+        try:
+            with self.config_file.open("r", encoding="utf-8") as fh:
+                config = json.load(fh)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not reload %s: %s", self.config_file, e)
+            return False
+
+        with self._lock:
+            if self._dirty:
+                return False
+            old_config, self.config = self.config, config
+            self._mtime_ns = mtime_ns
+        changes = [
+            (key, old_config.get(key), config.get(key))
+            for key in {**old_config, **config}
+            if old_config.get(key) != config.get(key)
+        ]
+        self._notify(changes)
+        return True
+
+    # ------------------------------------------------------------------
+    @contextmanager
+    def batch(self) -> Iterator["ConfigurationManager"]:
+        """Group several ``set_setting`` calls into a single write.
+
+        Batches may be nested; the write happens when the outermost one
+        exits (immediately, or debounced in write-behind mode).
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                pending = self._batch_depth == 0 and self._dirty
+            if pending:
+                self._commit()
+
+    # ------------------------------------------------------------------
+    def flush(self) -> None:
+        """Write pending changes now, if there are any."""
+        with self._lock:
+            self._cancel_timer()
+            if not self._dirty:
+                return
         self.save_configuration()
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Flush pending changes and stop write-behind scheduling."""
+        self.flush()
+        if self.write_behind:
+            atexit.unregister(self.flush)
+            self.write_behind = False
+
+    # ------------------------------------------------------------------
+    def _commit(self) -> None:
+        """Write now or (re)start the debounce timer."""
+        if not self.write_behind:
+            self.save_configuration()
+            return
+        with self._lock:
+            self._cancel_timer()
+            self._timer = threading.Timer(self.debounce, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _notify(self, changes: List[tuple]) -> None:
+        """Call subscribers; a failing callback does not stop the others."""
+        if not changes:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            for key, old, new in changes:
+                try:
+                    callback(key, old, new)
+                except Exception:
+                    logger.exception("Configuration subscriber failed for %r", key)
+
+    def _stat_mtime(self) -> Optional[int]:
+        """Return the file's mtime in ns, or ``None`` if it is missing."""
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _cancel_timer(self) -> None:
+        """Cancel a scheduled write-behind flush (lock must be held)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+# Shared managers per configuration file (see get_shared_config)
+_shared_configs: Dict[str, ConfigurationManager] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_config(
+    config_file: str | Path | None = None, reload_interval: float = 2.0
+) -> ConfigurationManager:
+    """Return the process-wide ``ConfigurationManager`` for a file.
+
+    The dialog, generators and exporters share this instance, so settings
+    are read from memory.  It uses write-behind saving and checks the
+    file's mtime at most once every ``reload_interval`` seconds.  Reading
+    never writes: the file is created by the first ``set_setting``.
+
+    Parameters
+    ----------
+    config_file:
+        Configuration file, ``config.json`` in :func:`default_config_dir`
+        by default.
+    reload_interval:
+        Throttle for the mtime check, used when the instance is created.
+    """
+    path = Path(config_file) if config_file else default_config_dir() / "config.json"
+    key = str(path.resolve())
+    with _shared_lock:
+        manager = _shared_configs.get(key)
+        if manager is None:
+            manager = ConfigurationManager(
+                path, write_behind=True, reload_interval=reload_interval, create=False
+            )
+            _shared_configs[key] = manager
+        return manager
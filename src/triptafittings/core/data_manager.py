@@ -4,20 +4,48 @@ Gestor de datos para TriptaFittings
 Punto central para gestionar presets de Ferrule y Gasket
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 import logging
+import os
+import threading
 from pathlib import Path
 
 try:
+    from .compatibility import BOMLine, CompatibilityIndex
+    from ..data.catalog import CatalogRegistry
     from ..data.csv_loader import CSVLoader
-    from ..data.preset import Preset
+    from ..data.preset import Preset, COMPONENT_FIELDS
+    from ..data.preset_cache import PresetCache, Signature
+    from ..data.preset_table import PresetTable
+    from ..data.sorted_index import SortedIndex
+    from ..data.validation import ValidationReport, validate_catalog
 except ImportError:
     # Para ejecución directa del script
     import sys
     import os
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from core.compatibility import BOMLine, CompatibilityIndex
+    from data.catalog import CatalogRegistry
     from data.csv_loader import CSVLoader
-    from data.preset import Preset
+    from data.preset import Preset, COMPONENT_FIELDS
+    from data.preset_cache import PresetCache, Signature
+    from data.preset_table import PresetTable
+    from data.sorted_index import SortedIndex
+    from data.validation import ValidationReport, validate_catalog
+
+
+class ReloadDiff(NamedTuple):
+    """Cambios aplicados por una recarga incremental"""
+    files: List[str]                        # CSV re-parseados
+    added: List[Preset]
+    removed: List[Preset]
+    changed: List[Tuple[Preset, Preset]]    # (anterior, nuevo)
+    
+    @property
+    def is_empty(self) -> bool:
+        """Indica si la recarga no modificó ningún preset"""
+        return not (self.added or self.removed or self.changed)
 
 
 class DataManager:
@@ -26,17 +54,38 @@ class DataManager:
     Maneja la carga, cacheo y búsqueda de presets
     """
     
-    def __init__(self, data_directory: str = None):
+    # Diferencia máxima (pulgadas) para considerar iguales dos tamaños
+    SIZE_TOLERANCE = 1e-6
+    
+    # Atributo de CSVLoader con la ruta del CSV y función de carga de cada componente
+    _COMPONENT_FILES = {
+        'ferrule': ('ferrule_csv', 'load_ferrule_data'),
+        'gasket': ('gasket_csv', 'load_gasket_data'),
+    }
+    
+    def __init__(self, data_directory: str = None, load_workers: Optional[int] = 1,
+                 use_processes: bool = False):
         """
         Inicializa el gestor de datos
         
         Args:
             data_directory: Directorio donde están los archivos CSV
+            load_workers: Archivos cargados en paralelo (1 = secuencial, el
+                valor por defecto; None = uno por archivo). El parseo es
+                Python puro y con hilos no se acelera por el GIL: los hilos
+                solo convienen si la lectura es lenta (unidades de red)
+            use_processes: Parsear en un pool de procesos (catálogos
+                grandes) en lugar de hilos
         """
         self.logger = logging.getLogger(__name__)
         
         # Inicializar cargador CSV
         self.csv_loader = CSVLoader(data_directory)
+        self.load_workers = load_workers
+        self.use_processes = use_processes
+        
+        # Catálogos de otros estándares, cargados al consultarlos
+        self._catalog: Optional[CatalogRegistry] = None
         
         # Cache de presets para búsquedas rápidas
         self._ferrule_presets: List[Preset] = []
@@ -48,9 +97,89 @@ class DataManager:
         self._gasket_by_size: Dict[float, Preset] = {}
         self._gasket_by_dn: Dict[str, Preset] = {}
         
+        # Tablas columnares construidas bajo demanda (ver get_preset_table)
+        self._tables: Dict[str, PresetTable] = {}
+        
+        # Índices ordenados por (componente, columna) (ver get_sorted_index)
+        self._sorted_indices: Dict[Tuple[str, str], SortedIndex] = {}
+        
+        # Índice de compatibilidad del catálogo por defecto (se construye al
+        # cargar) y de otros estándares (ver get_compatibility_index)
+        self._compatibility = CompatibilityIndex()
+        self._standard_compatibility: Dict[Tuple[str, ...], CompatibilityIndex] = {}
+        
+        # Vistas derivadas memorizadas (tamaños/DN disponibles) y generación
+        # de carga a la que pertenecen
+        self._views: Dict[Tuple[str, Optional[str]], list] = {}
+        self._generation = 0
+        
+        # Firma de cada CSV al cargarlo, para recargar solo los modificados
+        self._file_signatures: Dict[str, Optional[Signature]] = {}
+        
         # Estado de carga
         self._loaded = False
         self._load_errors = []
+        self._load_lock = threading.RLock()
+        self._warm_up_thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Indica si los presets ya fueron cargados"""
+        return self._loaded
+    
+    @property
+    def generation(self) -> int:
+        """
+        Contador que cambia cada vez que se reemplazan los datos cargados
+        
+        Permite a los llamadores saber si las listas que guardaron
+        (tamaños, DN, presets) siguen vigentes.
+        """
+        return self._generation
+    
+    def ensure_loaded(self) -> bool:
+        """
+        Carga los datos en la primera consulta
+        
+        Es seguro llamarlo desde varios hilos: solo uno realiza la carga y
+        los demás esperan a que termine.
+        
+        Returns:
+            True si los datos están disponibles
+        """
+        if self._loaded:
+            return True
+        with self._load_lock:
+            if self._loaded:
+                return True
+            self.logger.debug("Datos no cargados. Llamando a load_all_data()")
+            return self.load_all_data()
+    
+    def warm_up(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Precarga los datos, opcionalmente en un hilo en segundo plano
+        
+        Args:
+            background: Si es True, la carga se hace en un hilo daemon
+            
+        Returns:
+            El hilo de precarga, o None si la carga fue síncrona o innecesaria
+        """
+        if self._loaded:
+            return None
+        if not background:
+            self.ensure_loaded()
+            return None
+        
+        with self._load_lock:
+            if self._warm_up_thread is None or not self._warm_up_thread.is_alive():
+                self._warm_up_thread = threading.Thread(
+                    target=self.ensure_loaded,
+                    name="TriptaFittings-warm-up",
+                    daemon=True,
+                )
+                self._warm_up_thread.start()
+            return self._warm_up_thread
     
     def load_all_data(self) -> bool:
         """
@@ -59,20 +188,42 @@ class DataManager:
         Returns:
             True si la carga fue exitosa, False en caso contrario
         """
+        with self._load_lock:
+            return self._load_all_data()
+    
+    def _load_all_data(self) -> bool:
+        """Carga los datos; debe llamarse con ``_load_lock`` adquirido"""
         self.logger.info("Iniciando carga de todos los datos de presets")
         
+        # Los archivos son independientes: pueden cargarse en paralelo (ver
+        # ``load_workers``) y los resultados se combinan en el orden de ``jobs``
+        jobs = [(component.capitalize(), getattr(self.csv_loader, load))
+                for component, (_, load) in self._COMPONENT_FILES.items()]
+        # Firmas tomadas antes de parsear: una edición concurrente se
+        # detecta en la próxima recarga
+        signatures = {component: self._file_signature(component)
+                      for component in self._COMPONENT_FILES}
+        results = self._run_load_jobs([load for _, load in jobs])
+        
+        errors = [str(result) for result in results if isinstance(result, Exception)]
+        if errors:
+            for error in errors:
+                self.logger.error(f"Error al cargar datos: {error}")
+            self._load_errors.extend(errors)
+            return False
+        
         try:
-            # Cargar datos de Ferrule
-            self._ferrule_presets = self.csv_loader.load_ferrule_data()
-            self.logger.info(f"Cargados {len(self._ferrule_presets)} presets de Ferrule")
-            
-            # Cargar datos de Gasket
-            self._gasket_presets = self.csv_loader.load_gasket_data()
-            self.logger.info(f"Cargados {len(self._gasket_presets)} presets de Gasket")
+            self._ferrule_presets, self._gasket_presets = results
+            self._file_signatures = signatures
+            for (label, _), presets in zip(jobs, results):
+                self.logger.info(f"Cargados {len(presets)} presets de {label}")
             
             # Construir índices de búsqueda
             self._build_search_indices()
             
+            # Compartir el catálogo por defecto con el registro de estándares
+            self._adopt_into_catalog()
+            
             # Validar compatibilidad entre Ferrule y Gasket
             self._validate_compatibility()
             
@@ -85,8 +236,46 @@ class DataManager:
             self.logger.error(f"Error al cargar datos: {e}")
             return False
     
+    def _run_load_jobs(self, loads: List[Callable[[], List[Preset]]]) -> List[Any]:
+        """
+        Ejecuta funciones de carga independientes, en paralelo si corresponde
+        
+        Args:
+            loads: Funciones sin argumentos que retornan listas de presets
+            
+        Returns:
+            Lista alineada con ``loads``: presets o la excepción producida
+        """
+        workers = self.load_workers or len(loads)
+        if workers <= 1 or len(loads) <= 1:
+            results = []
+            for load in loads:
+                try:
+                    results.append(load())
+                except Exception as e:
+                    results.append(e)
+            return results
+        
+        pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        pool: Executor = pool_class(max_workers=min(workers, len(loads)))
+        try:
+            futures = [pool.submit(load) for load in loads]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+            return results
+        finally:
+            pool.shutdown(wait=True)
+    
     def _build_search_indices(self):
         """Construye índices optimizados para búsquedas rápidas"""
+        # Las tablas columnares, índices ordenados y vistas se reconstruyen
+        # con los nuevos datos
+        self._invalidate_derived()
+        
         # Índices para Ferrule
         for preset in self._ferrule_presets:
             self._ferrule_by_size[preset.size] = preset
@@ -99,19 +288,28 @@ class DataManager:
         
         self.logger.debug(f"Índices construidos: {len(self._ferrule_by_size)} Ferrule, {len(self._gasket_by_size)} Gasket")
     
+    def _invalidate_derived(self):
+        """Descarta las estructuras derivadas y avanza la generación"""
+        self._tables = {}
+        self._sorted_indices = {}
+        self._standard_compatibility = {}
+        self._views = {}
+        self._generation += 1
+    
     def _validate_compatibility(self):
-        """Valida que existan presets compatibles entre Ferrule y Gasket"""
-        ferrule_sizes = set(self._ferrule_by_size.keys())
-        gasket_sizes = set(self._gasket_by_size.keys())
+        """Construye el índice de compatibilidad y avisa de presets sin pareja"""
+        self._compatibility = CompatibilityIndex(self._ferrule_presets + self._gasket_presets)
         
-        missing_gaskets = ferrule_sizes - gasket_sizes
-        missing_ferrules = gasket_sizes - ferrule_sizes
+        missing_gaskets = self._compatibility.unmatched('ferrule', 'gasket')
+        missing_ferrules = self._compatibility.unmatched('gasket', 'ferrule')
         
         if missing_gaskets:
-            self.logger.warning(f"Faltan presets de Gasket para tamaños: {missing_gaskets}")
+            self.logger.warning(
+                f"Faltan presets de Gasket para tamaños: {sorted(p.size for p in missing_gaskets)}")
         
         if missing_ferrules:
-            self.logger.warning(f"Faltan presets de Ferrule para tamaños: {missing_ferrules}")
+            self.logger.warning(
+                f"Faltan presets de Ferrule para tamaños: {sorted(p.size for p in missing_ferrules)}")
     
     def get_preset_by_size(self, component: str, size: float) -> Optional[Preset]:
         """
@@ -124,20 +322,24 @@ class DataManager:
         Returns:
             Preset correspondiente o None si no se encuentra
         """
-        if not self._loaded:
-            self.logger.warning("Datos no cargados. Llamando a load_all_data()")
-            if not self.load_all_data():
-                return None
+        if not self.ensure_loaded():
+            return None
         
         component = component.lower()
         
         if component == 'ferrule':
-            return self._ferrule_by_size.get(size)
+            preset = self._ferrule_by_size.get(size)
         elif component == 'gasket':
-            return self._gasket_by_size.get(size)
+            preset = self._gasket_by_size.get(size)
         else:
             self.logger.error(f"Tipo de componente inválido: {component}")
             return None
+        
+        if preset is None:
+            # Tolerar diferencias de redondeo (1.5 vs 1.5000001)
+            preset = self.get_sorted_index(component, 'Size').nearest(
+                size, self.SIZE_TOLERANCE)
+        return preset
     
     def get_preset_by_dn(self, component: str, dn: str) -> Optional[Preset]:
         """
@@ -150,10 +352,8 @@ class DataManager:
         Returns:
             Preset correspondiente o None si no se encuentra
         """
-        if not self._loaded:
-            self.logger.warning("Datos no cargados. Llamando a load_all_data()")
-            if not self.load_all_data():
-                return None
+        if not self.ensure_loaded():
+            return None
         
         component = component.lower()
         
@@ -169,63 +369,78 @@ class DataManager:
         """
         Obtiene la lista de tamaños disponibles
         
+        La lista se calcula una vez por generación de carga (ver
+        ``generation``) y se comparte entre llamadas: no debe modificarse.
+        
         Args:
             component: Tipo de componente específico ('ferrule', 'gasket') o None para ambos
             
         Returns:
             Lista de tamaños disponibles ordenados
         """
-        if not self._loaded:
-            self.logger.warning("Datos no cargados. Llamando a load_all_data()")
-            if not self.load_all_data():
-                return []
-        
-        if component is None:
-            # Combinar tamaños de ambos componentes
-            all_sizes = set(self._ferrule_by_size.keys()) | set(self._gasket_by_size.keys())
-        elif component.lower() == 'ferrule':
-            all_sizes = set(self._ferrule_by_size.keys())
-        elif component.lower() == 'gasket':
-            all_sizes = set(self._gasket_by_size.keys())
-        else:
-            self.logger.error(f"Tipo de componente inválido: {component}")
+        if not self.ensure_loaded():
             return []
         
-        return sorted(list(all_sizes))
+        key = ('sizes', component.lower() if component else None)
+        sizes = self._views.get(key)
+        if sizes is None:
+            if component is None:
+                # Combinar tamaños de ambos componentes
+                all_sizes = set(self._ferrule_by_size.keys()) | set(self._gasket_by_size.keys())
+            elif component.lower() == 'ferrule':
+                all_sizes = set(self._ferrule_by_size.keys())
+            elif component.lower() == 'gasket':
+                all_sizes = set(self._gasket_by_size.keys())
+            else:
+                self.logger.error(f"Tipo de componente inválido: {component}")
+                return []
+            
+            sizes = sorted(all_sizes)
+            self._views[key] = sizes
+        return sizes
     
     def get_available_dns(self, component: str = None) -> List[str]:
         """
         Obtiene la lista de DNs disponibles
         
+        La lista se calcula una vez por generación de carga (ver
+        ``generation``) y se comparte entre llamadas: no debe modificarse.
+        
         Args:
             component: Tipo de componente específico ('ferrule', 'gasket') o None para ambos
             
         Returns:
             Lista de DNs disponibles ordenados
         """
-        if not self._loaded:
-            self.logger.warning("Datos no cargados. Llamando a load_all_data()")
-            if not self.load_all_data():
-                return []
-        
-        if component is None:
-            # Combinar DNs de ambos componentes
-            all_dns = set(self._ferrule_by_dn.keys()) | set(self._gasket_by_dn.keys())
-        elif component.lower() == 'ferrule':
-            all_dns = set(self._ferrule_by_dn.keys())
-        elif component.lower() == 'gasket':
-            all_dns = set(self._gasket_by_dn.keys())
-        else:
-            self.logger.error(f"Tipo de componente inválido: {component}")
+        if not self.ensure_loaded():
             return []
         
-        # Ordenar DNs numéricamente
-        return sorted(all_dns, key=lambda x: int(x[2:]))  # Extraer número de 'DN40' -> 40
+        key = ('dns', component.lower() if component else None)
+        dns = self._views.get(key)
+        if dns is None:
+            if component is None:
+                # Combinar DNs de ambos componentes
+                all_dns = set(self._ferrule_by_dn.keys()) | set(self._gasket_by_dn.keys())
+            elif component.lower() == 'ferrule':
+                all_dns = set(self._ferrule_by_dn.keys())
+            elif component.lower() == 'gasket':
+                all_dns = set(self._gasket_by_dn.keys())
+            else:
+                self.logger.error(f"Tipo de componente inválido: {component}")
+                return []
+            
+            # Ordenar DNs numéricamente
+            dns = sorted(all_dns, key=lambda x: int(x[2:]))  # Extraer número de 'DN40' -> 40
+            self._views[key] = dns
+        return dns
     
     def get_compatible_presets(self, size: float) -> Tuple[Optional[Preset], Optional[Preset]]:
         """
         Obtiene presets compatibles de Ferrule y Gasket para un tamaño dado
         
+        El Gasket es la pareja del Ferrule en el índice de compatibilidad
+        (mismo asiento de abrazadera), no solo el del mismo tamaño.
+        
         Args:
             size: Tamaño en pulgadas
             
@@ -233,9 +448,72 @@ class DataManager:
             Tupla (ferrule_preset, gasket_preset) - uno puede ser None
         """
         ferrule = self.get_preset_by_size('ferrule', size)
-        gasket = self.get_preset_by_size('gasket', size)
+        if ferrule is None:
+            return None, self.get_preset_by_size('gasket', size)
         
-        return ferrule, gasket
+        return ferrule, self._compatibility.best_mate(ferrule, 'gasket')
+    
+    def get_compatibility_index(self, standards: Optional[List[str]] = None
+                                ) -> Optional[CompatibilityIndex]:
+        """
+        Obtiene el índice de compatibilidad entre componentes
+        
+        Args:
+            standards: Estándares del registro de catálogos a incluir (None =
+                solo el catálogo por defecto, construido al cargar). Los
+                estándares pedidos se cargan si hace falta
+            
+        Returns:
+            CompatibilityIndex o None si no hay datos
+        """
+        if not self.ensure_loaded():
+            return None
+        if standards is None:
+            return self._compatibility
+        
+        key = tuple(standards)
+        index = self._standard_compatibility.get(key)
+        if index is None:
+            index = CompatibilityIndex()
+            for standard in standards:
+                for component in self.catalog.components(standard):
+                    index.add(self.catalog.get_presets(standard, component))
+            self._standard_compatibility[key] = index
+        return index
+    
+    def get_mates(self, preset: Preset, component: Optional[str] = None) -> Dict[str, List[Preset]]:
+        """
+        Presets que se acoplan con ``preset`` (ver ``CompatibilityIndex.mates``)
+        
+        Args:
+            preset: Preset consultado
+            component: Restringe el resultado a un componente
+            
+        Returns:
+            Diccionario componente -> presets compatibles
+        """
+        if not self.ensure_loaded():
+            return {}
+        return self._compatibility.mates(preset, component)
+    
+    def get_connection_bom(self, size: float, component: str = 'ferrule') -> List[BOMLine]:
+        """
+        Lista de materiales de una unión sanitaria clamp de un tamaño
+        
+        Args:
+            size: Tamaño en pulgadas
+            component: Componente desde el que se arma la unión
+            
+        Returns:
+            Líneas de la unión (dos Ferrule, un Gasket, una abrazadera)
+            
+        Raises:
+            ValueError: Si no hay preset del tamaño o la unión no se completa
+        """
+        preset = self.get_preset_by_size(component, size)
+        if preset is None:
+            raise ValueError(f"No hay preset de {component} para el tamaño {size}")
+        return self._compatibility.connection_bom(preset)
     
     def get_all_presets(self, component: str = None) -> List[Preset]:
         """
@@ -247,10 +525,8 @@ class DataManager:
         Returns:
             Lista de todos los presets
         """
-        if not self._loaded:
-            self.logger.warning("Datos no cargados. Llamando a load_all_data()")
-            if not self.load_all_data():
-                return []
+        if not self.ensure_loaded():
+            return []
         
         if component is None:
             return self._ferrule_presets + self._gasket_presets
@@ -262,6 +538,133 @@ class DataManager:
             self.logger.error(f"Tipo de componente inválido: {component}")
             return []
     
+    def get_preset_table(self, component: str) -> Optional[PresetTable]:
+        """
+        Obtiene la tabla columnar de un componente
+        
+        La tabla se construye en la primera llamada y se conserva hasta la
+        próxima carga de datos.
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            
+        Returns:
+            PresetTable del componente o None si no hay datos
+        """
+        if not self.ensure_loaded():
+            return None
+        
+        component = component.lower()
+        table = self._tables.get(component)
+        if table is None:
+            if component == 'ferrule':
+                presets = self._ferrule_presets
+            elif component == 'gasket':
+                presets = self._gasket_presets
+            else:
+                self.logger.error(f"Tipo de componente inválido: {component}")
+                return None
+            table = PresetTable.from_presets(component, presets)
+            self._tables[component] = table
+        return table
+    
+    def find_presets_in_range(self, component: str, column: str,
+                              low: float = None, high: float = None) -> List[Preset]:
+        """
+        Busca presets cuyo valor de una columna está en un rango
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            column: Columna del CSV (ej: 'TubeID_mm') o 'Size'
+            low: Límite inferior inclusivo (None = sin límite)
+            high: Límite superior inclusivo (None = sin límite)
+            
+        Returns:
+            Lista de presets en el rango, en el orden del catálogo
+        """
+        table = self.get_preset_table(component)
+        if table is None:
+            return []
+        return table.presets(table.filter_range(column, low, high))
+    
+    def get_sorted_index(self, component: str, column: str = 'Size') -> Optional[SortedIndex]:
+        """
+        Obtiene un índice ordenado de presets por una columna numérica
+        
+        Permite consultas O(log n) de valor más cercano, piso/techo y
+        tolerancia (ver ``SortedIndex``). Se construye en la primera llamada.
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            column: 'Size' o columna del CSV (ej: 'TubeID_mm', 'FlangeOD_mm')
+            
+        Returns:
+            SortedIndex de presets o None si no hay datos
+            
+        Raises:
+            ValueError: Si la columna no existe para el componente
+        """
+        if not self.ensure_loaded():
+            return None
+        
+        component = component.lower()
+        key = (component, column)
+        index = self._sorted_indices.get(key)
+        if index is None:
+            if component == 'ferrule':
+                presets = self._ferrule_presets
+            elif component == 'gasket':
+                presets = self._gasket_presets
+            else:
+                self.logger.error(f"Tipo de componente inválido: {component}")
+                return None
+            
+            attributes = dict(COMPONENT_FIELDS[component], Size='size')
+            if column not in attributes:
+                raise ValueError(f"Columna desconocida para {component}: {column}")
+            attribute = attributes[column]
+            index = SortedIndex((getattr(p, attribute), p) for p in presets)
+            self._sorted_indices[key] = index
+        return index
+    
+    def find_nearest_preset(self, component: str, value: float, column: str = 'Size',
+                            tolerance: float = None) -> Optional[Preset]:
+        """
+        Busca el preset con el valor más cercano en una columna
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            value: Valor buscado (ej: diámetro interior medido en mm)
+            column: 'Size' o columna del CSV (ej: 'TubeID_mm')
+            tolerance: Distancia máxima aceptada (None = sin límite)
+            
+        Returns:
+            Preset más cercano o None si no hay dentro de la tolerancia
+        """
+        index = self.get_sorted_index(component, column)
+        if index is None:
+            return None
+        return index.nearest(value, tolerance)
+    
+    def match_presets(self, component: str, values: List[float], column: str = 'TubeID_mm',
+                      tolerance: float = None) -> List[Optional[Preset]]:
+        """
+        Asigna a cada valor medido su preset más cercano
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            values: Valores medidos (ej: diámetros de tubería en mm)
+            column: Columna del CSV contra la que se compara
+            tolerance: Distancia máxima aceptada (None = sin límite)
+            
+        Returns:
+            Lista alineada con ``values`` (None donde no hay coincidencia)
+        """
+        index = self.get_sorted_index(component, column)
+        if index is None:
+            return [None] * len(values)
+        return index.nearest_many(values, tolerance)
+    
     def get_data_summary(self) -> Dict[str, Any]:
         """
         Obtiene un resumen de los datos cargados
@@ -284,8 +687,8 @@ class DataManager:
             'errors': self._load_errors,
             'ferrule_count': len(self._ferrule_presets),
             'gasket_count': len(self._gasket_presets),
-            'available_sizes': self.get_available_sizes(),
-            'available_dns': self.get_available_dns(),
+            'available_sizes': list(self.get_available_sizes()),
+            'available_dns': list(self.get_available_dns()),
             'total_presets': len(self._ferrule_presets) + len(self._gasket_presets)
         }
     
@@ -298,27 +701,250 @@ class DataManager:
         """
         return self.csv_loader.validate_data_integrity()
     
-    def reload_data(self) -> bool:
+    def validate_catalog(self) -> Dict[str, ValidationReport]:
+        """
+        Evalúa todas las reglas de validación sobre los presets cargados
+        
+        Incluye las reglas por fila, el crecimiento con el tamaño y el
+        emparejamiento Ferrule/Gasket (ver ``data.validation``).
+        
+        Returns:
+            Diccionario componente -> ValidationReport (vacío si no hay datos)
+        """
+        ferrules = self.get_preset_table('ferrule')
+        gaskets = self.get_preset_table('gasket')
+        if ferrules is None or gaskets is None:
+            return {}
+        return validate_catalog(ferrules, gaskets)
+    
+    def reload_data(self, full: bool = True) -> bool:
         """
-        Recarga todos los datos desde los archivos CSV
+        Recarga los datos desde los archivos CSV
+        
+        Descarta todo y vuelve a leer todos los archivos. Para re-parsear
+        solo los modificados usar ``full=False`` o ``reload_changed``.
         
+        Args:
+            full: Si es False y los datos ya estaban cargados, recarga solo
+                los archivos modificados
+            
         Returns:
             True si la recarga fue exitosa
         """
+        if not full and self._loaded:
+            return self.reload_changed() is not None
+        
         self.logger.info("Recargando datos de presets")
         
-        # Limpiar cache
-        self._ferrule_presets = []
-        self._gasket_presets = []
-        self._ferrule_by_size.clear()
-        self._ferrule_by_dn.clear()
-        self._gasket_by_size.clear()
-        self._gasket_by_dn.clear()
-        self._loaded = False
-        self._load_errors.clear()
+        with self._load_lock:
+            # Limpiar cache
+            self._ferrule_presets = []
+            self._gasket_presets = []
+            self._ferrule_by_size.clear()
+            self._ferrule_by_dn.clear()
+            self._gasket_by_size.clear()
+            self._gasket_by_dn.clear()
+            self._invalidate_derived()
+            self._catalog = None
+            self._file_signatures = {}
+            self._loaded = False
+            self._load_errors.clear()
+            
+            # Recargar
+            return self._load_all_data()
+    
+    def reload_changed(self) -> Optional[ReloadDiff]:
+        """
+        Re-parsea solo los CSV modificados desde la última carga
+        
+        Un archivo se considera modificado si cambió su tamaño o su mtime y
+        además su contenido (sha256); tocar un archivo sin editarlo no lo
+        recarga. Los índices por tamaño y DN se actualizan solo en las
+        entradas afectadas y la generación avanza únicamente si hubo cambios.
         
-        # Recargar
-        return self.load_all_data()
+        Returns:
+            Diferencias aplicadas, o None si algún archivo no pudo cargarse
+            (en ese caso se conservan los datos anteriores y el error queda
+            en ``_load_errors``)
+        """
+        if not self._loaded:
+            return ReloadDiff([], [], [], []) if self.load_all_data() else None
+        
+        with self._load_lock:
+            signatures = {component: self._file_signature(component)
+                          for component in self._COMPONENT_FILES}
+            stale = [component for component, signature in signatures.items()
+                     if not self._same_content(signature, self._file_signatures.get(component))]
+            for component, signature in signatures.items():
+                if component not in stale:
+                    # Archivo tocado pero sin editar: recordar el nuevo mtime
+                    self._file_signatures[component] = signature
+            if not stale:
+                self.logger.debug("Recarga: ningún archivo de presets cambió")
+                return ReloadDiff([], [], [], [])
+            
+            self.logger.info(f"Recargando presets modificados: {', '.join(stale)}")
+            loads = [getattr(self.csv_loader, self._COMPONENT_FILES[component][1])
+                     for component in stale]
+            results = self._run_load_jobs(loads)
+            
+            errors = [str(result) for result in results if isinstance(result, Exception)]
+            if errors:
+                for error in errors:
+                    self.logger.error(f"Error al recargar datos: {error}")
+                self._load_errors.extend(errors)
+                return None
+            
+            diff = ReloadDiff([], [], [], [])
+            for component, presets in zip(stale, results):
+                diff.files.append(getattr(self.csv_loader, self._COMPONENT_FILES[component][0]))
+                self._patch_component(component, presets, diff)
+                self._file_signatures[component] = signatures[component]
+            
+            if not diff.is_empty:
+                self._invalidate_derived()
+                self._adopt_into_catalog()
+                self._validate_compatibility()
+            self.logger.info(
+                f"Recarga incremental: {len(diff.added)} agregados, "
+                f"{len(diff.removed)} eliminados, {len(diff.changed)} modificados")
+            return diff
+    
+    def _patch_component(self, component: str, presets: List[Preset], diff: ReloadDiff):
+        """
+        Reemplaza los presets de un componente actualizando solo los índices afectados
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            presets: Presets recién parseados
+            diff: Diferencias donde se acumulan los cambios
+        """
+        if component == 'ferrule':
+            by_size, by_dn = self._ferrule_by_size, self._ferrule_by_dn
+        else:
+            by_size, by_dn = self._gasket_by_size, self._gasket_by_dn
+        
+        new_by_size = {preset.size: preset for preset in presets}
+        outdated = []
+        for size, old in list(by_size.items()):
+            new = new_by_size.get(size)
+            if new is None:
+                diff.removed.append(old)
+                del by_size[size]
+                outdated.append(old)
+            elif new != old:
+                diff.changed.append((old, new))
+                outdated.append(old)
+        for old in outdated:
+            if by_dn.get(old.dn) is old:
+                del by_dn[old.dn]
+        
+        for size, new in new_by_size.items():
+            old = by_size.get(size)
+            if old is None:
+                diff.added.append(new)
+            if old is None or old != new:
+                by_size[size] = new
+                by_dn[new.dn] = new
+        
+        # La lista usa los mismos objetos que los índices: los presets sin
+        # cambios conservan su identidad
+        presets = [by_size[preset.size] for preset in presets]
+        if component == 'ferrule':
+            self._ferrule_presets = presets
+        else:
+            self._gasket_presets = presets
+    
+    @staticmethod
+    def _same_content(current: Optional[Signature], previous: Optional[Signature]) -> bool:
+        """Indica si dos firmas corresponden al mismo contenido (tamaño y sha256)"""
+        if current is None or previous is None:
+            return False
+        return (current[0], current[2]) == (previous[0], previous[2])
+    
+    def _file_signature(self, component: str) -> Optional[Signature]:
+        """Firma actual del CSV de un componente, o None si no se puede leer"""
+        path = self.csv_loader.data_directory / getattr(
+            self.csv_loader, self._COMPONENT_FILES[component][0])
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        previous = self._file_signatures.get(component)
+        if previous is not None and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+            return previous
+        return stat.st_size, stat.st_mtime_ns, PresetCache.content_hash(path)
+    
+    @property
+    def catalog(self) -> CatalogRegistry:
+        """Registro de catálogos por estándar (lee solo el manifiesto)"""
+        if self._catalog is None:
+            with self._load_lock:
+                if self._catalog is None:
+                    self._catalog = CatalogRegistry(self.csv_loader)
+                    if self._loaded:
+                        self._adopt_into_catalog()
+        return self._catalog
+    
+    def _adopt_into_catalog(self):
+        """Entrega al registro los presets ya cargados por load_all_data"""
+        if self._catalog is None:
+            return
+        sources = ((self.csv_loader.ferrule_csv, self._ferrule_presets),
+                   (self.csv_loader.gasket_csv, self._gasket_presets))
+        for path, presets in sources:
+            try:
+                self._catalog.adopt(path, presets)
+            except ValueError as e:
+                self.logger.warning(f"Catálogo por defecto no compartido: {e}")
+    
+    def get_available_standards(self) -> List[str]:
+        """
+        Retorna los estándares declarados en el manifiesto de catálogos
+        
+        No carga ningún archivo de presets.
+        """
+        return self.catalog.standards()
+    
+    def get_presets_by_standard(self, standard: str, component: str) -> List[Preset]:
+        """
+        Retorna los presets de un componente en un estándar
+        
+        Los archivos del estándar se cargan en la primera consulta.
+        
+        Args:
+            standard: Nombre del estándar (ej: 'DIN 32676 A')
+            component: Tipo de componente ('ferrule' o 'gasket')
+            
+        Returns:
+            Lista de presets (vacía si el estándar no existe o falla la carga)
+        """
+        try:
+            return self.catalog.get_presets(standard, component)
+        except (OSError, ValueError) as e:
+            self._load_errors.append(str(e))
+            self.logger.error(f"Error al cargar catálogo {standard}: {e}")
+            return []
+    
+    def get_preset_by_standard(self, standard: str, component: str,
+                               size: float) -> Optional[Preset]:
+        """
+        Busca un preset por (estándar, componente, tamaño)
+        
+        Args:
+            standard: Nombre del estándar
+            component: Tipo de componente ('ferrule' o 'gasket')
+            size: Tamaño en pulgadas
+            
+        Returns:
+            Preset correspondiente o None si no se encuentra
+        """
+        try:
+            return self.catalog.get_preset(standard, component, size)
+        except (OSError, ValueError) as e:
+            self._load_errors.append(str(e))
+            self.logger.error(f"Error al cargar catálogo {standard}: {e}")
+            return None
     
     def get_presets_by_type(self, component_type: str) -> List[Preset]:
         """
@@ -330,10 +956,8 @@ class DataManager:
         Returns:
             Lista de presets del tipo especificado
         """
-        if not self._loaded:
-            self.logger.warning("Datos no cargados. Llamando a load_all_data()")
-            if not self.load_all_data():
-                return []
+        if not self.ensure_loaded():
+            return []
         
         if component_type.lower() == 'ferrule':
             return self._ferrule_presets.copy()
@@ -354,15 +978,32 @@ class DataManager:
         Returns:
             Preset correspondiente o None si no se encuentra
         """
-        if not self._loaded:
-            self.logger.warning("Datos no cargados. Llamando a load_all_data()")
-            if not self.load_all_data():
-                return None
+        return self.get_preset_by_size(component_type, size)
+
+
+# Gestores compartidos por directorio de datos (ver get_shared_data_manager)
+_shared_managers: Dict[Optional[str], DataManager] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_data_manager(data_directory: str = None) -> DataManager:
+    """
+    Retorna el DataManager compartido del proceso para un directorio
+    
+    Los comandos del workbench, ``UserInterface`` y el diálogo usan esta
+    instancia para que el catálogo se lea una sola vez, en la primera
+    consulta o al precargarlo con ``warm_up()``.
+    
+    Args:
+        data_directory: Directorio de los CSV o None para el del paquete
         
-        if component_type.lower() == 'ferrule':
-            return self._ferrule_by_size.get(size)
-        elif component_type.lower() == 'gasket':
-            return self._gasket_by_size.get(size)
-        else:
-            self.logger.error(f"Tipo de componente inválido: {component_type}")
-            return None
+    Returns:
+        Instancia compartida de DataManager (sin cargar necesariamente)
+    """
+    key = str(Path(data_directory).resolve()) if data_directory else None
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            manager = DataManager(data_directory)
+            _shared_managers[key] = manager
+        return manager
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""Exportación de modelos generados a STEP, STL y DXF.
+
+Cada modelo (diccionario de ``generate_geometry``, ver ``ModelManager``)
+se exporta en un trabajador de un pool de hilos, o de procesos si se pide
+y no hay STEP en el lote.  Dentro del trabajador la malla se tesela una
+sola vez y la comparten todos los formatos de malla (hoy STL); STEP
+necesita FreeCAD y DXF escribe el perfil 2D.
+
+Cada ejecución escribe ``export_manifest.json`` con el hash de contenido
+de cada modelo y el sha256 de cada archivo.  Al re-exportar, los archivos
+cuyo modelo tiene el mismo hash de contenido y cuyo sha256 en disco
+coincide con el del manifiesto anterior no se vuelven a escribir.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .. import __version__
+from .config import ConfigurationManager, get_shared_config
+from ..data.preset import Preset
+from ..generators.mesh import Mesh, stl_bytes, tessellate
+from ..generators.mesh_cache import LOD_PRESETS, MeshCache
+from ..generators.profiles import get_profile_template
+
+EXPORT_MANIFEST = "export_manifest.json"
+
+# Formato -> extensión de archivo
+EXPORT_FORMATS: Dict[str, str] = {
+    "STEP": ".step",
+    "STL": ".stl",
+    "DXF": ".dxf",
+}
+
+# Versión de los escritores; cambiarla fuerza a re-exportar todo
+EXPORTER_VERSION = "1"
+
+# Precisión de malla por defecto: el nivel de detalle fino
+EXPORT_LINEAR_DEFLECTION, EXPORT_ANGULAR_DEFLECTION = LOD_PRESETS["export"]
+
+
+def model_preset(model: Dict[str, Any]) -> Preset:
+    """Reconstruye el ``Preset`` a partir de los parámetros de un modelo."""
+    parameters = model["parameters"]
+    return Preset.from_values(
+        model["component"], parameters["Size"], parameters["DN"],
+        parameters["Standard"], parameters,
+    )
+
+
+def model_hash(model: Dict[str, Any]) -> str:
+    """Hash sha256 del contenido que determina los archivos exportados."""
+    payload = json.dumps(
+        {
+            "exporter": EXPORTER_VERSION,
+            "component": model["component"],
+            "parameters": model["parameters"],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def normalize_formats(formats: Iterable[str]) -> List[str]:
+    """Valida los formatos y los retorna en mayúsculas, sin repetir.
+
+    Raises
+    ------
+    ValueError
+        Si algún formato no está soportado.
+    """
+    result = []
+    for fmt in formats:
+        fmt = fmt.upper()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Formato de exportación no soportado: {fmt}. "
+                f"Formatos válidos: {sorted(EXPORT_FORMATS)}"
+            )
+        if fmt not in result:
+            result.append(fmt)
+    return result
+
+
+# --- Escritores ---------------------------------------------------------------
+def step_bytes(preset: Preset) -> bytes:
+    """STEP del sólido revolucionado (requiere FreeCAD)."""
+    solid = get_profile_template(preset.component_type, preset.standard).build_solid(preset)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.step")
+        solid.exportStep(path)
+        with open(path, "rb") as file:
+            return file.read()
+
+
+def dxf_bytes(preset: Preset) -> bytes:
+    """DXF R12 con el perfil ``(r, z)`` como polilínea cerrada en mm."""
+    points = get_profile_template(preset.component_type, preset.standard).dimension(preset)
+    lines = [
+        "0", "SECTION", "2", "HEADER",
+        "9", "$ACADVER", "1", "AC1009",
+        "9", "$INSUNITS", "70", "4",
+        "0", "ENDSEC",
+        "0", "SECTION", "2", "ENTITIES",
+        "0", "POLYLINE", "8", preset.get_name(), "66", "1", "70", "1",
+        "10", "0.0", "20", "0.0", "30", "0.0",
+    ]
+    for r, z in points:
+        lines += ["0", "VERTEX", "8", preset.get_name(),
+                  "10", repr(r), "20", repr(z), "30", "0.0"]
+    lines += ["0", "SEQEND", "0", "ENDSEC", "0", "EOF"]
+    return ("\n".join(lines) + "\n").encode("ascii", "replace")
+
+
+def stl_file_bytes(preset: Preset, mesh: Mesh) -> bytes:
+    """STL binario de la malla, con el nombre del preset en el encabezado."""
+    return stl_bytes(mesh, preset.get_name().encode("ascii", "replace"))
+
+
+# Escritores a partir de la malla compartida y a partir del preset
+_MESH_WRITERS: Dict[str, Callable[[Preset, Mesh], bytes]] = {
+    "STL": stl_file_bytes,
+}
+
+_SOLID_WRITERS: Dict[str, Callable[[Preset], bytes]] = {
+    "STEP": step_bytes,
+    "DXF": dxf_bytes,
+}
+
+
+# --- Trabajador -----------------------------------------------------------------
+def export_model(
+    model: Dict[str, Any],
+    output_dir: str,
+    formats: Sequence[str],
+    previous: Optional[Dict[str, Any]] = None,
+    linear_deflection: float = EXPORT_LINEAR_DEFLECTION,
+    angular_deflection: float = EXPORT_ANGULAR_DEFLECTION,
+    mesh_cache: Optional[MeshCache] = None,
+) -> Dict[str, Any]:
+    """Exporta un modelo en los formatos indicados.
+
+    Función de módulo para poder enviarla a un ``ProcessPoolExecutor``.
+
+    Parameters
+    ----------
+    model:
+        Modelo generado (``name``, ``component``, ``parameters``).
+    output_dir:
+        Directorio de salida.
+    formats:
+        Formatos normalizados (ver ``normalize_formats``).
+    previous:
+        Entrada del modelo en el manifiesto anterior, si existe.
+    linear_deflection, angular_deflection:
+        Precisión de la malla de los formatos de malla.
+    mesh_cache:
+        Cache de mallas opcional; evita re-teselar entre ejecuciones.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Entrada del manifiesto con ``files`` por formato, y las listas
+        ``written``, ``skipped`` y ``errors`` (``{formato: mensaje}``).
+    """
+    digest = model_hash(model)
+    entry: Dict[str, Any] = {
+        "name": model["name"],
+        "component": model["component"],
+        "content_hash": digest,
+        "files": {},
+        "written": [],
+        "skipped": [],
+        "errors": {},
+    }
+    try:
+        preset = model_preset(model)
+    except (KeyError, TypeError, ValueError) as e:
+        entry["errors"] = {fmt: f"Modelo inválido: {e}" for fmt in formats}
+        return entry
+    mesh: Optional[Mesh] = None
+    deflection = [linear_deflection, angular_deflection]
+    old_files = previous["files"] if previous and previous.get("content_hash") == digest else {}
+
+    for fmt in formats:
+        file_name = model["name"] + EXPORT_FORMATS[fmt]
+        path = Path(output_dir) / file_name
+        old = old_files.get(fmt)
+        if (old and old.get("file") == file_name
+                and (fmt not in _MESH_WRITERS or old.get("deflection") == deflection)
+                and _file_sha256(path) == old.get("sha256")):
+            entry["files"][fmt] = old
+            entry["skipped"].append(fmt)
+            continue
+        try:
+            if fmt in _MESH_WRITERS:
+                # Una sola malla para todos los formatos de malla
+                if mesh is None and mesh_cache is not None:
+                    mesh = mesh_cache.get_mesh(preset, "export", linear_deflection,
+                                               angular_deflection)
+                elif mesh is None:
+                    mesh = tessellate(preset, linear_deflection, angular_deflection)
+                payload = _MESH_WRITERS[fmt](preset, mesh)
+            else:
+                payload = _SOLID_WRITERS[fmt](preset)
+        except Exception as e:  # El resto de formatos continúa
+            entry["errors"][fmt] = str(e)
+            continue
+        _write_atomic(path, payload)
+        entry["files"][fmt] = {
+            "file": file_name,
+            "sha256": hashlib.sha256(payload).hexdigest(),
+            "bytes": len(payload),
+        }
+        if fmt in _MESH_WRITERS:
+            entry["files"][fmt]["deflection"] = deflection
+        entry["written"].append(fmt)
+    return entry
+
+
+def _file_sha256(path: Path) -> Optional[str]:
+    """sha256 de un archivo, o ``None`` si no existe."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 16), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Escribe ``payload`` en un temporal y lo renombra sobre ``path``."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _failed_entry(model: Dict[str, Any], formats: Sequence[str], error: Exception) -> Dict[str, Any]:
+    """Entrada de un modelo cuyo trabajador falló por completo."""
+    return {"name": model["name"], "component": model.get("component"), "files": {},
+            "written": [], "skipped": [], "errors": {fmt: str(error) for fmt in formats}}
+
+
+# --- Lote ---------------------------------------------------------------------------
+def read_manifest(output_dir: str | Path) -> Dict[str, Dict[str, Any]]:
+    """Entradas del manifiesto de exportación existente, por nombre de modelo."""
+    try:
+        with open(Path(output_dir) / EXPORT_MANIFEST, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return {entry["name"]: entry for entry in manifest.get("models", [])
+            if isinstance(entry, dict) and "name" in entry}
+
+
+def export_models(
+    models: Iterable[Dict[str, Any]],
+    output_dir: str | Path,
+    formats: Iterable[str] | None = None,
+    workers: Optional[int] = None,
+    use_processes: bool = False,
+    force: bool = False,
+    linear_deflection: float = EXPORT_LINEAR_DEFLECTION,
+    angular_deflection: float = EXPORT_ANGULAR_DEFLECTION,
+    mesh_cache: Optional[MeshCache] = None,
+) -> Dict[str, Any]:
+    """Exporta un lote de modelos y escribe el manifiesto.
+
+    Parameters
+    ----------
+    models:
+        Modelos generados (por ejemplo ``ModelManager.list_models()``).
+    output_dir:
+        Directorio de salida (se crea si no existe).
+    formats:
+        Formatos a escribir: ``STEP``, ``STL`` y/o ``DXF``.  ``None`` usa
+        ``export_formats`` de la configuración compartida
+        (``get_shared_config``).
+    workers:
+        Trabajadores del pool.  ``None`` usa el valor por defecto del
+        pool; ``1`` o menos exporta en el proceso actual.
+    use_processes:
+        Usa un pool de procesos para los formatos de malla (el teselado
+        es intensivo en CPU).  Se ignora si el lote incluye STEP: los
+        procesos hijos no pueden importar ``FreeCAD`` y, dentro de FreeCAD,
+        relanzarían el ejecutable.  Solo la línea de comandos lo activa.
+    force:
+        Reescribe todos los archivos del lote aunque estén al día.
+    linear_deflection, angular_deflection:
+        Precisión de la malla para los formatos de malla (por defecto el
+        nivel de detalle ``"export"``).
+    mesh_cache:
+        Cache de mallas compartido.  Con procesos cada trabajador recibe
+        una copia que comparte solo el nivel de disco.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Contenido del manifiesto escrito.  ``models`` está ordenado por
+        nombre e incluye los modelos de exportaciones anteriores al mismo
+        directorio; ``written``, ``skipped`` y ``failures`` (``{"name",
+        "format", "error"}``) se refieren solo a este lote.
+    """
+    if formats is None:
+        formats = get_shared_config().get_setting(
+            "export_formats", ConfigurationManager.DEFAULT_CONFIG["export_formats"])
+    formats = normalize_formats(formats)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = read_manifest(output_dir)
+    # Un modelo por nombre (el último gana, como en ``ModelManager``)
+    unique = {model["name"]: model for model in models}
+    jobs = [(model, None if force else previous.get(name))
+            for name, model in sorted(unique.items())]
+    options = (str(output_dir), formats)
+    mesh_options = (linear_deflection, angular_deflection, mesh_cache)
+
+    entries = []
+    if workers is not None and workers <= 1:
+        for model, old in jobs:
+            try:
+                entries.append(export_model(model, *options, old, *mesh_options))
+            except Exception as e:
+                entries.append(_failed_entry(model, formats, e))
+    else:
+        # STEP siempre en el proceso actual, donde está cargado FreeCAD
+        in_process = not use_processes or "STEP" in formats
+        executor_class = ThreadPoolExecutor if in_process else ProcessPoolExecutor
+        executor: Executor = executor_class(max_workers=workers)
+        try:
+            futures = [executor.submit(export_model, model, *options, old, *mesh_options)
+                       for model, old in jobs]
+            # Se recorren en el orden de ``jobs``: manifiesto determinista
+            for (model, _), future in zip(jobs, futures):
+                try:
+                    entries.append(future.result())
+                except Exception as e:
+                    entries.append(_failed_entry(model, formats, e))
+        finally:
+            executor.shutdown(wait=True)
+
+    failures = [
+        {"name": entry["name"], "format": fmt, "error": error}
+        for entry in entries for fmt, error in entry.pop("errors").items()
+    ]
+    # El manifiesto conserva los modelos que no se exportaron en este lote y,
+    # si el modelo no cambió, los archivos de otros formatos.  Un trabajador
+    # que falló por completo no tiene ``content_hash``: su entrada anterior
+    # sigue describiendo los archivos en disco y el error va solo a
+    # ``failures``
+    merged = dict(previous)
+    for entry in entries:
+        if "content_hash" not in entry:
+            continue
+        old = previous.get(entry["name"])
+        if old and old.get("content_hash") == entry.get("content_hash"):
+            entry["files"] = {**old.get("files", {}), **entry["files"]}
+        merged[entry["name"]] = entry
+    manifest = {
+        "generator": "triptafittings",
+        "version": __version__,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "formats": formats,
+        "written": sum(len(entry["written"]) for entry in entries),
+        "skipped": sum(len(entry["skipped"]) for entry in entries),
+        "models": [
+            {key: value for key, value in entry.items() if key not in ("written", "skipped")}
+            for _, entry in sorted(merged.items())
+        ],
+        "failures": failures,
+    }
+    _write_atomic(
+        output_dir / EXPORT_MANIFEST,
+        json.dumps(manifest, indent=2, default=str).encode("utf-8"),
+    )
+    return manifest
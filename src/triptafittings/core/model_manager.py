@@ -7,15 +7,65 @@ Este módulo mantiene un registro en memoria de los modelos generados
 """
 from __future__ import annotations
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
+
+from .model_registry import ModelRegistry
+
+# Campos con índice secundario: nombre del filtro -> función que extrae la
+# clave del modelo (``None`` si el modelo no la tiene).
+INDEXED_FIELDS = {
+    "component": lambda model: model.get("component"),
+    "size": lambda model: _parameter(model, "Size", float),
+    "dn": lambda model: _parameter(model, "DN"),
+    "standard": lambda model: _parameter(model, "Standard"),
+}
+
+
+def _parameter(model: Dict[str, Any], key: str, convert=None) -> Any:
+    """Extrae un parámetro de ``model["parameters"]`` si existe."""
+    value = (model.get("parameters") or {}).get(key)
+    if value is None or convert is None:
+        return value
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        return value
 
 
 class ModelManager:
-    """Gestiona los modelos generados en una sesión."""
+    """Gestiona los modelos generados en una sesión.
+
+    Además del registro por nombre mantiene índices secundarios por
+    componente, tamaño, DN y estándar (ver ``INDEXED_FIELDS``).  Cada índice
+    asocia una clave con un ``dict`` usado como conjunto ordenado de
+    nombres, por lo que los listados filtrados y las limpiezas por
+    componente cuestan tiempo proporcional al resultado y conservan el
+    orden de registro.
+
+    Parameters
+    ----------
+    registry: Optional[ModelRegistry]
+        Registro persistente opcional.  Si se indica, los modelos guardados
+        se recuperan al construir el gestor y cada cambio se anexa al log
+        en segundo plano; las lecturas se sirven siempre desde memoria.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, registry: Optional[ModelRegistry] = None) -> None:
         # Diccionario indexado por nombre de modelo
         self._models: Dict[str, Dict[str, Any]] = {}
+        # campo -> clave -> {nombre: None}
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self._registry = registry
+        if registry is not None:
+            for name, model in registry.replay().items():
+                self._store(name, model)
+            if registry.needs_compaction(len(self._models)):
+                registry.compact(self._models.values())
+
+    def __len__(self) -> int:
+        return len(self._models)
 
     def add_model(self, model: Dict[str, Any]) -> str:
         """Agrega un modelo al gestor.
@@ -31,25 +81,85 @@ class ModelManager:
         str
             Nombre con el que se almacenó el modelo.
         """
+        name = self._validate(model)
+        self._store(name, model)
+        if self._registry is not None:
+            self._registry.record_add([model])
+        return name
+
+    def add_models(self, models: Iterable[Dict[str, Any]]) -> List[str]:
+        """Agrega varios modelos de una vez.
+
+        Todos los modelos se validan antes de registrar ninguno, de modo que
+        un modelo inválido no deja el registro a medias.
+
+        Returns
+        -------
+        List[str]
+            Nombres con los que se almacenaron los modelos.
+        """
+        models = list(models)
+        names = [self._validate(model) for model in models]
+        for name, model in zip(names, models):
+            self._store(name, model)
+        if self._registry is not None and models:
+            self._registry.record_add(models)
+        return names
+
+    @staticmethod
+    def _validate(model: Dict[str, Any]) -> str:
+        """Valida la estructura mínima de un modelo y retorna su nombre."""
         name = model.get("name")
         if not name:
             raise ValueError("El modelo debe contener un nombre")
         if "component" not in model:
             raise ValueError("El modelo debe indicar su componente")
-        self._models[name] = model
         return name
 
-    def list_models(self, component: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_models(
+        self,
+        component: Optional[str] = None,
+        size: Optional[float] = None,
+        dn: Optional[str] = None,
+        standard: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """Lista los modelos almacenados.
 
+        Los filtros se combinan con "y"; se recorre solo el grupo más
+        pequeño de los índices implicados.
+
         Parameters
         ----------
         component: Optional[str]
             Filtra por tipo de componente (ej. ``"ferrule"`` o ``"gasket"``).
+        size: Optional[float]
+            Filtra por tamaño en pulgadas (``parameters["Size"]``).
+        dn: Optional[str]
+            Filtra por diámetro nominal (``parameters["DN"]``).
+        standard: Optional[str]
+            Filtra por estándar (``parameters["Standard"]``).
         """
-        if component is None:
+        filters = {
+            "component": component,
+            "size": None if size is None else float(size),
+            "dn": dn,
+            "standard": standard,
+        }
+        buckets = [
+            self._indexes[field].get(key, {})
+            for field, key in filters.items()
+            if key is not None
+        ]
+        if not buckets:
             return list(self._models.values())
-        return [m for m in self._models.values() if m.get("component") == component]
+
+        buckets.sort(key=len)
+        smallest, others = buckets[0], buckets[1:]
+        return [
+            self._models[name]
+            for name in smallest
+            if all(name in bucket for bucket in others)
+        ]
 
     def remove_model(self, name: str) -> bool:
         """Elimina un modelo por nombre.
@@ -59,13 +169,55 @@ class ModelManager:
         bool
             ``True`` si el modelo existía y fue eliminado.
         """
-        return self._models.pop(name, None) is not None
+        model = self._models.pop(name, None)
+        if model is None:
+            return False
+        self._unindex(name, model)
+        if self._registry is not None:
+            self._registry.record_remove(name)
+        return True
 
     def clear(self, component: Optional[str] = None) -> None:
         """Elimina todos los modelos o solo los de cierto componente."""
         if component is None:
             self._models.clear()
+            for index in self._indexes.values():
+                index.clear()
         else:
-            to_delete = [k for k, v in self._models.items() if v.get("component") == component]
-            for key in to_delete:
-                del self._models[key]
+            for name in list(self._indexes["component"].get(component, ())):
+                self._unindex(name, self._models.pop(name))
+        if self._registry is not None:
+            self._registry.record_clear(component)
+
+    def close(self) -> None:
+        """Vuelca y cierra el registro persistente, si existe."""
+        if self._registry is not None:
+            self._registry.close()
+
+    def _store(self, name: str, model: Dict[str, Any]) -> None:
+        """Registra o reemplaza un modelo manteniendo los índices."""
+        previous = self._models.get(name)
+        self._models[name] = model
+        for field, extract in INDEXED_FIELDS.items():
+            key = extract(model)
+            if previous is not None:
+                old_key = extract(previous)
+                if old_key == key:
+                    continue
+                self._discard(field, old_key, name)
+            if key is not None:
+                self._indexes[field].setdefault(key, {})[name] = None
+
+    def _unindex(self, name: str, model: Dict[str, Any]) -> None:
+        """Quita un modelo de todos los índices secundarios."""
+        for field, extract in INDEXED_FIELDS.items():
+            self._discard(field, extract(model), name)
+
+    def _discard(self, field: str, key: Any, name: str) -> None:
+        """Quita ``name`` del grupo ``key`` y elimina grupos vacíos."""
+        bucket = self._indexes[field].get(key)
+        if bucket is None:
+            return
+        bucket.pop(name, None)
+        if not bucket:
+            del self._indexes[field][key]
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Registro persistente de modelos generados.
+
+Guarda las operaciones de ``ModelManager`` en un archivo JSON Lines de
+solo anexado para que el historial de modelos sobreviva a un cierre
+inesperado de FreeCAD.  Las escrituras se acumulan en memoria y un hilo
+las vuelca (con ``fsync``) cada ``flush_interval`` segundos, de modo que
+registrar un modelo no toca el disco.  Al iniciar, el log se reproduce y
+se compacta si contiene operaciones obsoletas.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class ModelRegistry:
+    """Log de solo anexado con las operaciones sobre modelos.
+
+    Cada línea es un registro JSON con la clave ``op``:
+
+    * ``{"op": "add", "model": {...}}``
+    * ``{"op": "remove", "name": "..."}``
+    * ``{"op": "clear", "component": "..." | null}``
+
+    Parameters
+    ----------
+    path: str | Path
+        Archivo del log (se crea al primer volcado).
+    flush_interval: float
+        Segundos entre volcados del hilo de escritura.
+    """
+
+    def __init__(self, path: str | Path, flush_interval: float = 1.0) -> None:
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+        # Serializa volcados y compactaciones sobre el archivo
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # Registros presentes en el archivo (para decidir la compactación)
+        self._records = 0
+
+        atexit.register(self.close)
+
+    # --- Lectura ------------------------------------------------------------
+    def replay(self) -> Dict[str, Dict[str, Any]]:
+        """Reconstruye los modelos vigentes a partir del log.
+
+        Las líneas que no son JSON válido (por ejemplo la última línea de
+        un volcado interrumpido) se ignoran.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Modelos por nombre, en orden de registro.
+        """
+        models: Dict[str, Dict[str, Any]] = {}
+        records = 0
+        try:
+            fh = self.path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            self._records = 0
+            return models
+
+        with fh:
+            for line_number, line in enumerate(fh, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    self._apply(models, record)
+                except (ValueError, KeyError, TypeError) as e:
+                    self.logger.warning(
+                        f"Registro inválido en {self.path}:{line_number}: {e}"
+                    )
+                    continue
+                records += 1
+
+        self._records = records
+        return models
+
+    @staticmethod
+    def _apply(models: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+        """Aplica una operación del log sobre ``models``."""
+        op = record["op"]
+        if op == "add":
+            model = record["model"]
+            models[model["name"]] = model
+        elif op == "remove":
+            models.pop(record["name"], None)
+        elif op == "clear":
+            component = record.get("component")
+            if component is None:
+                models.clear()
+            else:
+                for name in [n for n, m in models.items() if m.get("component") == component]:
+                    del models[name]
+        else:
+            raise ValueError(f"Operación desconocida: {op}")
+
+    def needs_compaction(self, live_models: int) -> bool:
+        """Indica si el log tiene más registros que modelos vigentes."""
+        return self._records > live_models
+
+    def compact(self, models: Iterable[Dict[str, Any]]) -> None:
+        """Reescribe el log con un único ``add`` por modelo vigente.
+
+        La escritura es atómica (archivo temporal + ``os.replace``); las
+        operaciones pendientes se vuelcan antes para no perderlas.
+        """
+        self.flush()
+        lines = [self._encode({"op": "add", "model": model}) for model in models]
+        with self._io_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=self.path.name, dir=str(self.path.parent))
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.writelines(lines)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            self._records = len(lines)
+        self.logger.info(f"Registro de modelos compactado: {len(lines)} modelos")
+
+    # --- Escritura ----------------------------------------------------------
+    def record_add(self, models: Iterable[Dict[str, Any]]) -> None:
+        """Encola el alta (o reemplazo) de modelos."""
+        self._enqueue([{"op": "add", "model": model} for model in models])
+
+    def record_remove(self, name: str) -> None:
+        """Encola la eliminación de un modelo."""
+        self._enqueue([{"op": "remove", "name": name}])
+
+    def record_clear(self, component: Optional[str] = None) -> None:
+        """Encola la limpieza de todos los modelos o de un componente."""
+        self._enqueue([{"op": "clear", "component": component}])
+
+    def flush(self) -> int:
+        """Vuelca las operaciones pendientes y hace ``fsync``.
+
+        Returns
+        -------
+        int
+            Número de registros escritos.
+        """
+        with self._io_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+            # La serialización ocurre aquí, fuera del camino interactivo
+            lines = [self._encode(record) for record in pending]
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a+b") as fh:
+                    # Un volcado interrumpido deja la última línea sin "\n";
+                    # sin este salto el primer registro nuevo quedaría pegado
+                    # a ella y replay descartaría ambos
+                    data = "".join(lines).encode("utf-8")
+                    if fh.seek(0, os.SEEK_END):
+                        fh.seek(-1, os.SEEK_END)
+                        if fh.read(1) != b"\n":
+                            data = b"\n" + data
+                    fh.write(data)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            except OSError:
+                # Conservar las operaciones para el siguiente intento
+                with self._pending_lock:
+                    self._pending[:0] = pending
+                raise
+            self._records += len(lines)
+            return len(lines)
+
+    def close(self) -> None:
+        """Detiene el hilo de escritura y vuelca lo pendiente."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        atexit.unregister(self.close)
+
+    def _enqueue(self, records: List[Dict[str, Any]]) -> None:
+        """Agrega registros a la cola y arranca el hilo si hace falta."""
+        if self._closed:
+            raise RuntimeError("El registro de modelos está cerrado")
+        with self._pending_lock:
+            self._pending.extend(records)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="TriptaFittings-ModelRegistry", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Bucle del hilo de escritura: vuelca cada ``flush_interval``."""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            try:
+                self.flush()
+            except OSError as e:
+                self.logger.error(f"No se pudo escribir {self.path}: {e}")
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> str:
+        """Serializa un registro como una línea JSON compacta."""
+        return json.dumps(record, separators=(",", ":"), default=str) + "\n"
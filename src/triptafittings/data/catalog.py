@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Registro de catálogos de presets por estándar
+Descubre los CSV declarados en presets/manifest.json y carga cada
+estándar solo cuando se consulta por primera vez
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from .csv_loader import CSVLoader
+    from .preset import Preset, VALID_COMPONENT_TYPES
+except ImportError:
+    # Para ejecución directa del script
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from data.csv_loader import CSVLoader
+    from data.preset import Preset, VALID_COMPONENT_TYPES
+
+
+MANIFEST_FILE = "presets/manifest.json"
+
+# Estándar de los CSV por defecto de CSVLoader (directorios sin manifiesto)
+DEFAULT_STANDARD = "DIN 32676 A"
+
+
+class CatalogEntry(NamedTuple):
+    """Archivo de presets declarado en el manifiesto"""
+    standard: str
+    component: str
+    path: str  # Relativa al directorio de datos (ej: 'presets/x.csv')
+
+
+class CatalogRegistry:
+    """
+    Índice de presets por (estándar, componente, tamaño)
+
+    Leer el manifiesto no parsea ningún CSV. Al consultar un estándar por
+    primera vez se cargan todos sus archivos (usando ``CSVLoader`` y su
+    cache binario); los demás estándares no se tocan.
+
+    Formato del manifiesto::
+
+        {"version": 1,
+         "catalogs": [{"standard": "DIN 32676 A", "component": "ferrule",
+                       "file": "ferrule_din32676A_1p5_to_12in.csv"}, ...]}
+
+    Las rutas ``file`` son relativas al directorio del manifiesto. Un
+    estándar y componente puede repartirse en varios archivos (ej: uno por
+    rango de tamaños); sus presets se concatenan en el orden del manifiesto
+    y un tamaño repetido entre archivos es un error.
+    """
+
+    def __init__(self, csv_loader: Optional[CSVLoader] = None):
+        """
+        Inicializa el registro leyendo el manifiesto
+
+        Args:
+            csv_loader: Cargador a usar (define el directorio de datos)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.csv_loader = csv_loader or CSVLoader()
+        self.entries: List[CatalogEntry] = self._read_manifest()
+
+        self._lock = threading.RLock()
+        self._loaded: Dict[str, bool] = {}
+        self._files: Dict[str, List[Preset]] = {}
+        self._presets: Dict[Tuple[str, str], List[Preset]] = {}
+        self._index: Dict[Tuple[str, str, float], Preset] = {}
+
+    def _read_manifest(self) -> List[CatalogEntry]:
+        """Lee el manifiesto o usa los archivos por defecto de CSVLoader"""
+        manifest_path = self.csv_loader.data_directory / MANIFEST_FILE
+        if not manifest_path.exists():
+            return [
+                CatalogEntry(DEFAULT_STANDARD, 'ferrule', self.csv_loader.ferrule_csv),
+                CatalogEntry(DEFAULT_STANDARD, 'gasket', self.csv_loader.gasket_csv),
+            ]
+
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+
+        base = Path(MANIFEST_FILE).parent
+        entries = []
+        for item in manifest.get('catalogs', []):
+            component = item['component'].lower()
+            if component not in VALID_COMPONENT_TYPES:
+                raise ValueError(f"Componente inválido en {manifest_path}: {component}")
+            entries.append(CatalogEntry(item['standard'], component,
+                                        (base / item['file']).as_posix()))
+        return entries
+
+    def standards(self) -> List[str]:
+        """Estándares declarados, en el orden del manifiesto (sin cargar datos)"""
+        return list(dict.fromkeys(entry.standard for entry in self.entries))
+
+    def components(self, standard: str) -> List[str]:
+        """Componentes disponibles para un estándar"""
+        return list(dict.fromkeys(entry.component for entry in self.entries
+                                  if entry.standard == standard))
+
+    def is_loaded(self, standard: str) -> bool:
+        """Indica si los presets de un estándar ya se cargaron"""
+        return self._loaded.get(standard, False)
+
+    def adopt(self, path: str, presets: List[Preset]) -> bool:
+        """
+        Registra presets ya cargados de un archivo del manifiesto
+
+        Permite a ``DataManager`` compartir el catálogo por defecto sin
+        volver a leerlo. Un estándar queda cargado cuando todos sus
+        archivos fueron adoptados o cargados.
+
+        Args:
+            path: Ruta del CSV relativa al directorio de datos
+            presets: Presets del archivo
+
+        Returns:
+            True si el archivo pertenece al manifiesto
+        """
+        for entry in self.entries:
+            if entry.path == Path(path).as_posix():
+                with self._lock:
+                    self._register(entry, presets)
+                    if all(e.path in self._files
+                           for e in self.entries if e.standard == entry.standard):
+                        self._loaded[entry.standard] = True
+                return True
+        return False
+
+    def ensure_standard(self, standard: str) -> bool:
+        """
+        Carga los archivos de un estándar si aún no se cargaron
+
+        Args:
+            standard: Nombre del estándar (ej: 'DIN 32676 A')
+
+        Returns:
+            True si el estándar está en el manifiesto
+
+        Raises:
+            FileNotFoundError: Si falta un archivo declarado
+            ValueError: Si un archivo contiene presets de otro estándar o
+                repite un tamaño de otro archivo del mismo componente
+        """
+        if self._loaded.get(standard):
+            return True
+        entries = [entry for entry in self.entries if entry.standard == standard]
+        if not entries:
+            return False
+
+        with self._lock:
+            if self._loaded.get(standard):
+                return True
+            pending = [entry for entry in entries if entry.path not in self._files]
+            for entry, presets in zip(pending, self._load_entries(pending)):
+                self._register(entry, presets)
+            self._loaded[standard] = True
+        return True
+
+    def get_presets(self, standard: str, component: str) -> List[Preset]:
+        """
+        Presets de un componente en un estándar (carga el estándar si hace falta)
+
+        Returns:
+            Copia de la lista de presets, vacía si no existe la combinación
+        """
+        if not self.ensure_standard(standard):
+            return []
+        return list(self._presets.get((standard, component.lower()), []))
+
+    def get_preset(self, standard: str, component: str, size: float) -> Optional[Preset]:
+        """
+        Busca un preset por (estándar, componente, tamaño) en O(1)
+
+        Returns:
+            Preset o None si no existe
+        """
+        if not self.ensure_standard(standard):
+            return None
+        return self._index.get((standard, component.lower(), float(size)))
+
+    def _load_entries(self, entries: List[CatalogEntry]) -> List[List[Preset]]:
+        """
+        Parsea archivos independientes en paralelo (hilos, dominado por E/S)
+
+        Returns:
+            Presets de cada archivo, en el orden de ``entries``
+
+        Raises:
+            Exception: La primera excepción en el orden de ``entries``
+        """
+        for entry in entries:
+            self.logger.info(f"Cargando catálogo {entry.standard} ({entry.component})")
+        if len(entries) <= 1:
+            return [self.csv_loader.load_file(entry.component, entry.path) for entry in entries]
+        with ThreadPoolExecutor(max_workers=len(entries)) as pool:
+            futures = [pool.submit(self.csv_loader.load_file, entry.component, entry.path)
+                       for entry in entries]
+            return [future.result() for future in futures]
+
+    def _register(self, entry: CatalogEntry, presets: List[Preset]):
+        """Indexa los presets de un archivo; requiere ``_lock``"""
+        for preset in presets:
+            if preset.standard != entry.standard:
+                raise ValueError(
+                    f"{entry.path}: preset {preset.get_name()} es {preset.standard}, "
+                    f"se esperaba {entry.standard}")
+
+        # Presets del componente en todos sus archivos, en orden del manifiesto
+        key = (entry.standard, entry.component)
+        files = {e.path: (presets if e.path == entry.path else self._files.get(e.path, []))
+                 for e in self.entries if (e.standard, e.component) == key}
+        index: Dict[Tuple[str, str, float], Preset] = {}
+        origin: Dict[float, str] = {}
+        for path, file_presets in files.items():
+            for preset in file_presets:
+                if preset.size in origin and origin[preset.size] != path:
+                    raise ValueError(
+                        f"{path}: el tamaño {preset.size}\" de {entry.component} "
+                        f"{entry.standard} ya está en {origin[preset.size]}")
+                origin[preset.size] = path
+                index[(entry.standard, entry.component, preset.size)] = preset
+
+        # Al recargar un archivo se descartan los tamaños que ya no existen
+        for previous in self._presets.get(key, []):
+            self._index.pop((entry.standard, entry.component, previous.size), None)
+        self._files[entry.path] = list(presets)
+        self._presets[key] = [preset for file_presets in files.values() for preset in file_presets]
+        self._index.update(index)
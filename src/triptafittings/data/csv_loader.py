@@ -6,18 +6,24 @@ Maneja la carga y validación de datos desde archivos CSV
 
 import csv
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 import logging
 
 try:
-    from .preset import Preset
+    from .preset import Preset, COMPONENT_FIELDS, _SIZE_PATTERN
+    from .preset_cache import PresetCache
+    from .preset_table import PresetTable
+    from .validation import ValidationReport, validate_catalog
 except ImportError:
     # Para ejecución directa del script
     import sys
     import os
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-    from data.preset import Preset
+    from data.preset import Preset, COMPONENT_FIELDS, _SIZE_PATTERN
+    from data.preset_cache import PresetCache
+    from data.preset_table import PresetTable
+    from data.validation import ValidationReport, validate_catalog
 
 
 class CSVLoader:
@@ -26,12 +32,16 @@ class CSVLoader:
     Maneja la validación de formato y conversión de datos
     """
     
-    def __init__(self, data_directory: str = None):
+    def __init__(self, data_directory: str = None, use_cache: bool = True,
+                 cache_dir: str = None):
         """
         Inicializa el cargador CSV
         
         Args:
             data_directory: Directorio donde están los archivos CSV
+            use_cache: Si es True, usa instantáneas binarias de los CSV
+            cache_dir: Directorio de las instantáneas (por defecto el cache
+                del usuario, ver ``default_cache_dir``)
         """
         if data_directory is None:
             # Obtener el directorio actual del módulo
@@ -46,6 +56,9 @@ class CSVLoader:
         # Archivos CSV esperados (en subdirectorio presets)
         self.ferrule_csv = "presets/ferrule_din32676A_1p5_to_12in.csv"
         self.gasket_csv = "presets/gasket_din32676A_1p5_to_12in.csv"
+        
+        # Cache binario opcional para evitar re-parsear CSV sin cambios
+        self.cache = PresetCache(cache_dir) if use_cache else None
     
     def load_ferrule_data(self) -> List[Preset]:
         """
@@ -58,90 +71,226 @@ class CSVLoader:
             FileNotFoundError: Si el archivo no existe
             ValueError: Si hay errores en el formato de datos
         """
-        csv_path = self.data_directory / self.ferrule_csv
+        return self._load_presets('ferrule', *self._component_source('ferrule'))
+    
+    def load_gasket_data(self) -> List[Preset]:
+        """
+        Carga los datos de Gasket desde el archivo CSV
+        
+        Returns:
+            Lista de objetos Preset para Gasket
+            
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            ValueError: Si hay errores en el formato de datos
+        """
+        return self._load_presets('gasket', *self._component_source('gasket'))
+    
+    def load_file(self, component: str, relative_path: str) -> List[Preset]:
+        """
+        Carga los presets de un componente desde un CSV arbitrario
+        
+        Usado por el registro de catálogos para archivos de otros estándares.
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            relative_path: Ruta del CSV relativa a data_directory
+            
+        Returns:
+            Lista de objetos Preset
+        """
+        component_type = component.lower()
+        _, validate_headers = self._component_source(component_type)
+        return self._load_presets(component_type, relative_path, validate_headers)
+    
+    def _load_presets(self, component_type: str, relative_path: str,
+                      validate_headers) -> List[Preset]:
+        """
+        Carga los presets de un componente, usando el cache binario si es válido
+        
+        Args:
+            component_type: Tipo de componente ('ferrule' o 'gasket')
+            relative_path: Ruta del CSV relativa a data_directory
+            validate_headers: Función que valida los headers del CSV
+            
+        Returns:
+            Lista de objetos Preset
+        """
+        label = component_type.capitalize()
+        csv_path = self.data_directory / relative_path
         
         if not csv_path.exists():
-            raise FileNotFoundError(f"Archivo de presets de Ferrule no encontrado: {csv_path}")
+            raise FileNotFoundError(f"Archivo de presets de {label} no encontrado: {csv_path}")
         
-        self.logger.info(f"Cargando datos de Ferrule desde: {csv_path}")
+        if self.cache is not None:
+            presets = self.cache.load(csv_path, component_type)
+            if presets is not None:
+                return presets
+            # Firma tomada antes de parsear para no cachear un archivo que cambia
+            signature = self.cache.signature(csv_path)
+        
+        self.logger.info(f"Cargando datos de {label} desde: {csv_path}")
         
         try:
-            presets = []
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
-                # Validar headers
-                self._validate_ferrule_headers(reader.fieldnames)
-                
-                for row_num, row in enumerate(reader, start=2):  # Empezar en 2 (header es 1)
-                    try:
-                        # Limpiar datos
-                        cleaned_row = self._clean_row_data(row)
-                        
-                        # Crear preset
-                        preset = Preset('ferrule', cleaned_row)
-                        presets.append(preset)
-                        
-                        self.logger.debug(f"Preset cargado: {preset}")
-                        
-                    except ValueError as e:
-                        self.logger.error(f"Error en fila {row_num}: {e}")
-                        raise ValueError(f"Error en fila {row_num}: {e}")
-            
-            self.logger.info(f"Cargados {len(presets)} presets de Ferrule")
-            return presets
+            presets = list(self._iter_csv_presets(component_type, csv_path, validate_headers))
+            self.logger.info(f"Cargados {len(presets)} presets de {label}")
             
         except Exception as e:
-            self.logger.error(f"Error al cargar archivo de Ferrule: {e}")
+            self.logger.error(f"Error al cargar archivo de {label}: {e}")
             raise
+        
+        if self.cache is not None:
+            self.cache.store(csv_path, component_type, presets, signature)
+        return presets
     
-    def load_gasket_data(self) -> List[Preset]:
+    def iter_presets(self, component: str, skip_invalid: bool = False) -> Iterator[Preset]:
         """
-        Carga los datos de Gasket desde el archivo CSV
+        Recorre los presets de un componente fila por fila
         
-        Returns:
-            Lista de objetos Preset para Gasket
+        Lee el CSV directamente (sin cache ni lista intermedia), por lo que
+        la memoria usada no depende del tamaño del catálogo.
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            skip_invalid: Si es True, las filas inválidas se registran y se
+                omiten en lugar de interrumpir la iteración
+            
+        Yields:
+            Objetos Preset validados, en el orden del archivo
             
         Raises:
             FileNotFoundError: Si el archivo no existe
-            ValueError: Si hay errores en el formato de datos
+            ValueError: Si el componente es inválido o hay errores de formato
         """
-        csv_path = self.data_directory / self.gasket_csv
+        component_type = component.lower()
+        relative_path, validate_headers = self._component_source(component_type)
+        csv_path = self.data_directory / relative_path
         
         if not csv_path.exists():
-            raise FileNotFoundError(f"Archivo de presets de Gasket no encontrado: {csv_path}")
+            raise FileNotFoundError(
+                f"Archivo de presets de {component_type.capitalize()} no encontrado: {csv_path}")
         
-        self.logger.info(f"Cargando datos de Gasket desde: {csv_path}")
+        yield from self._iter_csv_presets(component_type, csv_path, validate_headers,
+                                          skip_invalid)
+    
+    def iter_preset_chunks(self, component: str, chunk_size: int = 1000,
+                           skip_invalid: bool = False) -> Iterator[List[Preset]]:
+        """
+        Recorre los presets de un componente en lotes de tamaño fijo
         
-        try:
-            presets = []
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
-                # Validar headers
-                self._validate_gasket_headers(reader.fieldnames)
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
+            chunk_size: Presets por lote (el último puede ser menor)
+            skip_invalid: Omitir filas inválidas (ver ``iter_presets``)
+            
+        Yields:
+            Listas de hasta ``chunk_size`` presets
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size debe ser mayor que 0")
+        
+        chunk = []
+        for preset in self.iter_presets(component, skip_invalid):
+            chunk.append(preset)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def _component_source(self, component_type: str):
+        """Retorna (ruta relativa, validador de headers) de un componente"""
+        if component_type == 'ferrule':
+            return self.ferrule_csv, self._validate_ferrule_headers
+        if component_type == 'gasket':
+            return self.gasket_csv, self._validate_gasket_headers
+        raise ValueError(f"Tipo de componente inválido: {component_type}")
+    
+    def _iter_csv_presets(self, component_type: str, csv_path: Path, validate_headers,
+                          skip_invalid: bool = False) -> Iterator[Preset]:
+        """Parsea un CSV y produce sus presets uno a uno"""
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            
+            # Validar headers
+            validate_headers(reader.fieldnames)
+            
+            for row_num, row in enumerate(reader, start=2):  # Empezar en 2 (header es 1)
+                try:
+                    # Limpiar datos
+                    cleaned_row = self._clean_row_data(row)
+                    
+                    # Crear preset
+                    preset = Preset(component_type, cleaned_row)
+                    
+                except ValueError as e:
+                    self.logger.error(f"Error en fila {row_num}: {e}")
+                    if skip_invalid:
+                        continue
+                    raise ValueError(f"Error en fila {row_num}: {e}")
                 
-                for row_num, row in enumerate(reader, start=2):  # Empezar en 2 (header es 1)
-                    try:
-                        # Limpiar datos
-                        cleaned_row = self._clean_row_data(row)
-                        
-                        # Crear preset
-                        preset = Preset('gasket', cleaned_row)
-                        presets.append(preset)
-                        
-                        self.logger.debug(f"Preset cargado: {preset}")
-                        
-                    except ValueError as e:
-                        self.logger.error(f"Error en fila {row_num}: {e}")
-                        raise ValueError(f"Error en fila {row_num}: {e}")
+                self.logger.debug(f"Preset cargado: {preset}")
+                yield preset
+    
+    def load_table(self, component: str) -> PresetTable:
+        """
+        Lee el CSV de un componente directamente en una tabla columnar
+        
+        No crea objetos Preset ni valida fila a fila: los valores que no
+        son números se guardan como NaN para que ``data.validation`` los
+        reporte junto con el resto de reglas. La fila ``i`` de la tabla es
+        la línea ``i + 2`` del archivo.
+        
+        Args:
+            component: Tipo de componente ('ferrule' o 'gasket')
             
-            self.logger.info(f"Cargados {len(presets)} presets de Gasket")
-            return presets
+        Returns:
+            PresetTable con todas las filas del archivo
             
-        except Exception as e:
-            self.logger.error(f"Error al cargar archivo de Gasket: {e}")
-            raise
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            ValueError: Si el componente o los headers son inválidos
+        """
+        component_type = component.lower()
+        relative_path, validate_headers = self._component_source(component_type)
+        csv_path = self.data_directory / relative_path
+        
+        if not csv_path.exists():
+            raise FileNotFoundError(
+                f"Archivo de presets de {component_type.capitalize()} no encontrado: {csv_path}")
+        
+        fields = [column for column, _ in COMPONENT_FIELDS[component_type]]
+        sizes, dns, standards = [], [], []
+        columns = {column: [] for column in fields}
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            validate_headers(reader.fieldnames)
+            for row in reader:
+                match = _SIZE_PATTERN.search(row.get('Size') or '')
+                sizes.append(float(match.group(1)) if match else NAN)
+                dns.append((row.get('DN') or '').strip())
+                standards.append((row.get('Standard') or '').strip())
+                for column in fields:
+                    columns[column].append(_to_float(row.get(column)))
+        
+        return PresetTable(component_type, sizes, dns, standards, columns)
+    
+    def validate_files(self) -> Dict[str, ValidationReport]:
+        """
+        Valida los CSV de Ferrule y Gasket con todas las reglas en una pasada
+        
+        Returns:
+            Diccionario componente -> ValidationReport (filas de la tabla,
+            ver ``load_table``)
+        """
+        return validate_catalog(self.load_table('ferrule'), self.load_table('gasket'))
+    
+    def clear_cache(self):
+        """Elimina las instantáneas binarias de todos los CSV"""
+        if self.cache is None:
+            return
+        for relative_path in (self.ferrule_csv, self.gasket_csv):
+            self.cache.invalidate(self.data_directory / relative_path)
     
     def _validate_ferrule_headers(self, headers: List[str]):
         """Valida que los headers del CSV de Ferrule sean correctos"""
@@ -240,3 +389,14 @@ class CSVLoader:
             results['gasket']['errors'].append(str(e))
         
         return results
+
+
+NAN = float('nan')
+
+
+def _to_float(value: Optional[str]) -> float:
+    """Convierte una celda en float (NaN si está vacía o no es un número)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
@@ -4,16 +4,67 @@ Clase Preset para representar datos de Ferrule y Gasket
 Basado en estándares DIN 32676 A
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import re
+import sys
+
+
+# Columnas numéricas de cada tipo de componente: (columna CSV, atributo)
+FERRULE_FIELDS = (
+    ('FlangeOD_mm', 'flange_od_mm'),
+    ('C2_mm', 'c2_mm'),
+    ('TubeID_mm', 'tube_id_mm'),
+    ('PassageDia_mm', 'passage_dia_mm'),
+    ('HeightTube_mm', 'height_tube_mm'),
+    ('HeightProfile_mm', 'height_profile_mm'),
+    ('SeatLipWidth_mm', 'seat_lip_width_mm'),
+)
+
+GASKET_FIELDS = (
+    ('FlangeOD_mm', 'flange_od_mm'),
+    ('GasketOD_mm', 'gasket_od_mm'),
+    ('GasketID_mm', 'gasket_id_mm'),
+    ('BeadC2_mm', 'bead_c2_mm'),
+    ('ProfileH_mm', 'profile_h_mm'),
+    ('SeatLipWidth_mm', 'seat_lip_width_mm'),
+)
+
+COMPONENT_FIELDS = {
+    'ferrule': FERRULE_FIELDS,
+    'gasket': GASKET_FIELDS,
+}
+
+VALID_COMPONENT_TYPES = ('ferrule', 'gasket')
+
+# Patrón de tamaño como "1.5"" o "2"", compilado una sola vez
+_SIZE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Asignación interna que omite el bloqueo de __setattr__
+_set = object.__setattr__
 
 
 class Preset:
     """
     Clase para representar un preset de Ferrule o Gasket
     Contiene todos los parámetros necesarios para generar el modelo 3D
+    
+    Los presets son inmutables y usan ``__slots__``: no tienen ``__dict__``
+    por instancia, se pueden usar como claves de diccionario y los DN y
+    estándares se internan para compartir las cadenas entre presets.
     """
     
+    __slots__ = (
+        'component_type', 'size', 'dn', 'standard',
+        # Ferrule
+        'c2_mm', 'tube_id_mm', 'passage_dia_mm', 'height_tube_mm', 'height_profile_mm',
+        # Gasket
+        'gasket_od_mm', 'gasket_id_mm', 'bead_c2_mm', 'profile_h_mm',
+        # Comunes
+        'flange_od_mm', 'seat_lip_width_mm',
+        # Caches perezosos
+        '_params', '_key',
+    )
+    
     def __init__(self, component_type: str, data: Dict[str, Any]):
         """
         Inicializa un preset con los datos proporcionados
@@ -22,25 +73,53 @@ class Preset:
             component_type: Tipo de componente ('ferrule' o 'gasket')
             data: Diccionario con los datos del preset
         """
-        self.component_type = component_type.lower()
+        _set(self, 'component_type', component_type.lower())
         self._validate_component_type()
         
         # Validar y asignar datos
         self._validate_and_assign_data(data)
     
+    @classmethod
+    def from_values(cls, component_type: str, size: float, dn: str,
+                    standard: str, values: Dict[str, float]) -> 'Preset':
+        """
+        Reconstruye un preset a partir de valores ya validados
+        
+        Se utiliza para cargar presets desde caches binarios sin repetir
+        el parseo del tamaño ni las validaciones de coherencia.
+        
+        Args:
+            component_type: Tipo de componente ('ferrule' o 'gasket')
+            size: Tamaño en pulgadas
+            dn: DN del componente
+            standard: Estándar del preset
+            values: Diccionario columna CSV -> valor numérico
+            
+        Returns:
+            Preset con los atributos asignados
+        """
+        preset = cls.__new__(cls)
+        _set(preset, 'component_type', component_type.lower())
+        preset._validate_component_type()
+        _set(preset, 'size', float(size))
+        _set(preset, 'dn', cls._intern(dn))
+        _set(preset, 'standard', cls._intern(standard))
+        for column, attribute in COMPONENT_FIELDS[preset.component_type]:
+            _set(preset, attribute, float(values[column]))
+        return preset
+    
     def _validate_component_type(self):
         """Valida que el tipo de componente sea válido"""
-        valid_types = ['ferrule', 'gasket']
-        if self.component_type not in valid_types:
+        if self.component_type not in VALID_COMPONENT_TYPES:
             raise ValueError(f"Tipo de componente inválido: {self.component_type}. "
-                           f"Tipos válidos: {valid_types}")
+                           f"Tipos válidos: {list(VALID_COMPONENT_TYPES)}")
     
     def _validate_and_assign_data(self, data: Dict[str, Any]):
         """Valida y asigna los datos del preset"""
         # Campos comunes para ambos tipos
-        self.size = self._extract_size(data.get('Size', ''))
-        self.dn = data.get('DN', '')
-        self.standard = data.get('Standard', 'DIN 32676 A')
+        _set(self, 'size', self._extract_size(data.get('Size', '')))
+        _set(self, 'dn', self._intern(data.get('DN', '')))
+        _set(self, 'standard', self._intern(data.get('Standard', 'DIN 32676 A')))
         
         # Validar campos obligatorios
         if not self.size or not self.dn:
@@ -58,36 +137,32 @@ class Preset:
             return 0.0
         
         # Buscar patrón como "1.5"" o "2""
-        match = re.search(r'(\d+(?:\.\d+)?)', size_str)
+        match = _SIZE_PATTERN.search(size_str)
         if match:
             return float(match.group(1))
         return 0.0
     
     def _assign_ferrule_data(self, data: Dict[str, Any]):
         """Asigna datos específicos de Ferrule"""
-        self.flange_od_mm = self._validate_float(data.get('FlangeOD_mm', 0))
-        self.c2_mm = self._validate_float(data.get('C2_mm', 0))
-        self.tube_id_mm = self._validate_float(data.get('TubeID_mm', 0))
-        self.passage_dia_mm = self._validate_float(data.get('PassageDia_mm', 0))
-        self.height_tube_mm = self._validate_float(data.get('HeightTube_mm', 0))
-        self.height_profile_mm = self._validate_float(data.get('HeightProfile_mm', 0))
-        self.seat_lip_width_mm = self._validate_float(data.get('SeatLipWidth_mm', 0))
+        for column, attribute in FERRULE_FIELDS:
+            _set(self, attribute, self._validate_float(data.get(column, 0)))
         
         # Validar que los datos sean coherentes
         self._validate_ferrule_coherence()
     
     def _assign_gasket_data(self, data: Dict[str, Any]):
         """Asigna datos específicos de Gasket"""
-        self.flange_od_mm = self._validate_float(data.get('FlangeOD_mm', 0))
-        self.gasket_od_mm = self._validate_float(data.get('GasketOD_mm', 0))
-        self.gasket_id_mm = self._validate_float(data.get('GasketID_mm', 0))
-        self.bead_c2_mm = self._validate_float(data.get('BeadC2_mm', 0))
-        self.profile_h_mm = self._validate_float(data.get('ProfileH_mm', 0))
-        self.seat_lip_width_mm = self._validate_float(data.get('SeatLipWidth_mm', 0))
+        for column, attribute in GASKET_FIELDS:
+            _set(self, attribute, self._validate_float(data.get(column, 0)))
         
         # Validar que los datos sean coherentes
         self._validate_gasket_coherence()
     
+    @staticmethod
+    def _intern(value: Any) -> Any:
+        """Interna cadenas repetidas entre presets (DN, estándar)"""
+        return sys.intern(value) if isinstance(value, str) else value
+    
     def _validate_float(self, value: Any) -> float:
         """Valida y convierte un valor a float"""
         try:
@@ -114,35 +189,25 @@ class Preset:
             raise ValueError("FlangeOD debe ser igual a GasketOD para Gasket")
     
     def get_parameters_dict(self) -> Dict[str, Any]:
-        """Retorna un diccionario con todos los parámetros del preset"""
-        params = {
-            'Size': self.size,
-            'DN': self.dn,
-            'Standard': self.standard,
-            'ComponentType': self.component_type
-        }
-        
-        if self.component_type == 'ferrule':
-            params.update({
-                'FlangeOD_mm': self.flange_od_mm,
-                'C2_mm': self.c2_mm,
-                'TubeID_mm': self.tube_id_mm,
-                'PassageDia_mm': self.passage_dia_mm,
-                'HeightTube_mm': self.height_tube_mm,
-                'HeightProfile_mm': self.height_profile_mm,
-                'SeatLipWidth_mm': self.seat_lip_width_mm
-            })
-        elif self.component_type == 'gasket':
-            params.update({
-                'FlangeOD_mm': self.flange_od_mm,
-                'GasketOD_mm': self.gasket_od_mm,
-                'GasketID_mm': self.gasket_id_mm,
-                'BeadC2_mm': self.bead_c2_mm,
-                'ProfileH_mm': self.profile_h_mm,
-                'SeatLipWidth_mm': self.seat_lip_width_mm
-            })
+        """
+        Retorna un diccionario con todos los parámetros del preset
         
-        return params
+        El diccionario se construye una sola vez por preset; cada llamada
+        retorna una copia que el llamador puede modificar.
+        """
+        try:
+            params = self._params
+        except AttributeError:
+            params = {
+                'Size': self.size,
+                'DN': self.dn,
+                'Standard': self.standard,
+                'ComponentType': self.component_type
+            }
+            for column, attribute in COMPONENT_FIELDS[self.component_type]:
+                params[column] = getattr(self, attribute)
+            _set(self, '_params', params)
+        return dict(params)
     
     def get_name(self) -> str:
         """Retorna el nombre del preset para nomenclatura"""
@@ -156,6 +221,41 @@ class Preset:
         """Representación detallada del preset"""
         return f"Preset(component_type='{self.component_type}', size={self.size}, dn='{self.dn}')"
     
+    def _identity(self) -> Tuple[Any, ...]:
+        """Tupla de valores que identifica al preset (igualdad y hash)"""
+        try:
+            return self._key
+        except AttributeError:
+            key = (self.component_type, self.size, self.dn, self.standard) + tuple(
+                getattr(self, attribute)
+                for _, attribute in COMPONENT_FIELDS[self.component_type]
+            )
+            _set(self, '_key', key)
+            return key
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Preset):
+            return NotImplemented
+        return self._identity() == other._identity()
+    
+    def __hash__(self) -> int:
+        return hash(self._identity())
+    
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"Preset es inmutable: no se puede asignar '{name}'")
+    
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Preset es inmutable: no se puede eliminar '{name}'")
+    
+    def __reduce__(self):
+        """Serialización (pickle/copy) a través de from_values"""
+        values = {
+            column: getattr(self, attribute)
+            for column, attribute in COMPONENT_FIELDS[self.component_type]
+        }
+        return (Preset.from_values,
+                (self.component_type, self.size, self.dn, self.standard, values))
+    
     def is_compatible_with(self, other: 'Preset') -> bool:
         """
         Verifica si este preset es compatible con otro
@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""
+Cache binario de presets para CSVLoader
+Guarda una instantánea columnar de cada CSV para evitar re-parsearlo, en
+el directorio de cache del usuario (el paquete instalado puede ser de
+solo lectura o compartido)
+"""
+
+import array
+import hashlib
+import logging
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    from .preset import Preset, COMPONENT_FIELDS
+except ImportError:
+    # Para ejecución directa del script
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from data.preset import Preset, COMPONENT_FIELDS
+
+
+# Firma de un archivo CSV: (tamaño en bytes, mtime en ns, sha256)
+Signature = Tuple[int, int, bytes]
+
+
+def user_cache_root() -> Path:
+    """
+    Directorio de cache de TriptaFittings del usuario actual
+
+    Returns:
+        %LOCALAPPDATA% en Windows, ~/Library/Caches en macOS y
+        $XDG_CACHE_HOME (o ~/.cache) en el resto, más 'triptafittings'
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(
+            os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache')
+    return Path(base) / 'triptafittings'
+
+
+def default_cache_dir() -> Path:
+    """Directorio de cache del usuario para las instantáneas de presets"""
+    return user_cache_root() / 'presets'
+
+
+class PresetCache:
+    """
+    Instantáneas binarias de archivos CSV de presets
+    
+    Cada CSV tiene un archivo ``<nombre>-<hash de la ruta>.cache`` en el
+    directorio de cache con las columnas numéricas como float64 y los
+    DN/estándares internados en una tabla de strings, referenciados con
+    enteros uint32; todo en little-endian. La instantánea se invalida cuando
+    cambia el tamaño del CSV; si solo cambió el mtime se compara el hash
+    del contenido antes de descartarla.
+    
+    Cada checkout o directorio temporal deja su propia instantánea, así que
+    al escribir una se eliminan las menos usadas por encima de
+    ``MAX_SNAPSHOTS``.
+    """
+    
+    MAGIC = b'TFPC'
+    VERSION = 2
+    SUFFIX = '.cache'
+    MAX_SNAPSHOTS = 32
+    
+    # magic, versión, tamaño CSV, mtime_ns CSV, sha256 CSV, filas, columnas
+    _HEADER = struct.Struct('<4sHQq32sIH')
+    _LENGTH = struct.Struct('<H')
+    _COUNT = struct.Struct('<I')
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Inicializa el cache de presets
+        
+        Args:
+            cache_dir: Directorio de las instantáneas (por defecto
+                ``default_cache_dir()``)
+        """
+        self.logger = logging.getLogger(__name__)
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+    
+    @property
+    def cache_dir(self) -> Path:
+        """Directorio de las instantáneas
+        
+        El directorio por defecto se resuelve en cada uso: el cargador
+        puede crearse al importar el workbench, antes de que se configure
+        el entorno del usuario.
+        """
+        return self._cache_dir if self._cache_dir is not None else default_cache_dir()
+    
+    def cache_path(self, csv_path: Path) -> Path:
+        """Retorna la ruta de la instantánea asociada a un CSV"""
+        csv_path = Path(csv_path).resolve()
+        key = hashlib.sha256(str(csv_path).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{csv_path.stem}-{key}{self.SUFFIX}"
+    
+    @staticmethod
+    def content_hash(csv_path: Path) -> bytes:
+        """Calcula el sha256 del contenido de un archivo"""
+        digest = hashlib.sha256()
+        with open(csv_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 16), b''):
+                digest.update(block)
+        return digest.digest()
+    
+    def signature(self, csv_path: Path) -> Signature:
+        """
+        Obtiene la firma actual de un archivo CSV
+        
+        Args:
+            csv_path: Ruta al archivo CSV
+        
+        Returns:
+            Tupla (tamaño, mtime_ns, sha256)
+        """
+        stat = os.stat(csv_path)
+        return stat.st_size, stat.st_mtime_ns, self.content_hash(csv_path)
+    
+    def load(self, csv_path: Path, component_type: str) -> Optional[List[Preset]]:
+        """
+        Carga los presets desde la instantánea si sigue siendo válida
+        
+        Args:
+            csv_path: Ruta al archivo CSV de origen
+            component_type: Tipo de componente ('ferrule' o 'gasket')
+        
+        Returns:
+            Lista de presets o None si no hay instantánea válida
+        """
+        cache_path = self.cache_path(csv_path)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            stat = os.stat(csv_path)
+            with open(cache_path, 'rb') as file:
+                payload = file.read()
+            
+            header = self._HEADER.unpack_from(payload, 0)
+            magic, version, size, mtime_ns, sha256, rows, n_columns = header
+            if magic != self.MAGIC or version != self.VERSION:
+                return None
+            if size != stat.st_size:
+                return None
+            if mtime_ns != stat.st_mtime_ns:
+                # Mismo tamaño pero distinto mtime: comparar contenido
+                if sha256 != self.content_hash(csv_path):
+                    return None
+                self._refresh_header(cache_path, header, stat.st_mtime_ns)
+            
+            presets = self._decode(payload, self._HEADER.size, rows,
+                                   n_columns, component_type)
+        except (OSError, struct.error, ValueError, KeyError, IndexError) as e:
+            self.logger.debug(f"Instantánea inválida {cache_path}: {e}")
+            return None
+        
+        if presets is not None:
+            self._touch(cache_path)
+            self.logger.info(f"Cargados {len(presets)} presets desde cache: {cache_path}")
+        return presets
+    
+    def store(self, csv_path: Path, component_type: str,
+              presets: List[Preset], signature: Signature) -> bool:
+        """
+        Escribe la instantánea binaria de un CSV
+        
+        La escritura es atómica (archivo temporal + ``os.replace``) y los
+        errores de E/S solo se registran: el cache es opcional.
+        
+        Args:
+            csv_path: Ruta al archivo CSV de origen
+            component_type: Tipo de componente de los presets
+            presets: Presets parseados del CSV
+            signature: Firma del CSV tomada antes de parsearlo
+        
+        Returns:
+            True si la instantánea se escribió
+        """
+        cache_path = self.cache_path(csv_path)
+        size, mtime_ns, sha256 = signature
+        columns = [column for column, _ in COMPONENT_FIELDS[component_type]]
+        
+        strings: List[str] = []
+        string_ids = {}
+        
+        def intern(value: str) -> int:
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+            return string_ids[value]
+        
+        dn_ids = [intern(p.dn) for p in presets]
+        standard_ids = [intern(p.standard) for p in presets]
+        size_column = array.array('d', (p.size for p in presets))
+        value_columns = [
+            array.array('d', (getattr(p, attribute) for p in presets))
+            for _, attribute in COMPONENT_FIELDS[component_type]
+        ]
+        
+        chunks = [self._HEADER.pack(self.MAGIC, self.VERSION, size, mtime_ns,
+                                    sha256, len(presets), len(columns))]
+        chunks.append(self._pack_string(component_type))
+        chunks.extend(self._pack_string(column) for column in columns)
+        chunks.append(self._COUNT.pack(len(strings)))
+        chunks.extend(self._pack_string(value) for value in strings)
+        chunks.append(self._pack_ids(dn_ids))
+        chunks.append(self._pack_ids(standard_ids))
+        for column in [size_column] + value_columns:
+            chunks.append(self._pack_array(column))
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=cache_path.name,
+                                            dir=str(cache_path.parent))
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(b''.join(chunks))
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            self.logger.debug(f"No se pudo escribir el cache {cache_path}: {e}")
+            return False
+        
+        self.logger.debug(f"Cache escrito: {cache_path}")
+        self.prune()
+        return True
+    
+    def prune(self, max_snapshots: Optional[int] = None) -> int:
+        """
+        Elimina las instantáneas menos usadas del directorio de cache
+        
+        Args:
+            max_snapshots: Instantáneas a conservar (por defecto
+                ``MAX_SNAPSHOTS``)
+        
+        Returns:
+            Número de instantáneas eliminadas
+        """
+        if max_snapshots is None:
+            max_snapshots = self.MAX_SNAPSHOTS
+        snapshots = []
+        for path in self.cache_dir.glob('*' + self.SUFFIX):
+            try:
+                snapshots.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        snapshots.sort(reverse=True)
+        
+        removed = 0
+        for _, path in snapshots[max_snapshots:]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                self.logger.debug(f"No se pudo eliminar el cache {path}: {e}")
+        return removed
+    
+    def invalidate(self, csv_path: Path) -> None:
+        """Elimina la instantánea asociada a un CSV si existe"""
+        try:
+            self.cache_path(csv_path).unlink()
+        except FileNotFoundError:
+            pass
+    
+    def _touch(self, cache_path: Path) -> None:
+        """Marca una instantánea como usada (el mtime ordena ``prune``)"""
+        try:
+            os.utime(cache_path)
+        except OSError as e:
+            self.logger.debug(f"No se pudo actualizar el cache {cache_path}: {e}")
+    
+    def _refresh_header(self, cache_path: Path, header: tuple, mtime_ns: int):
+        """Actualiza el mtime guardado para no volver a calcular el hash"""
+        magic, version, size, _, sha256, rows, n_columns = header
+        try:
+            with open(cache_path, 'r+b') as file:
+                file.write(self._HEADER.pack(magic, version, size, mtime_ns,
+                                             sha256, rows, n_columns))
+        except OSError as e:
+            self.logger.debug(f"No se pudo actualizar el cache {cache_path}: {e}")
+    
+    def _decode(self, payload: bytes, offset: int, rows: int, n_columns: int,
+                component_type: str) -> Optional[List[Preset]]:
+        """Reconstruye los presets a partir del contenido binario"""
+        stored_type, offset = self._unpack_string(payload, offset)
+        if stored_type != component_type:
+            return None
+        
+        columns = []
+        for _ in range(n_columns):
+            column, offset = self._unpack_string(payload, offset)
+            columns.append(column)
+        if columns != [column for column, _ in COMPONENT_FIELDS[component_type]]:
+            return None
+        
+        (n_strings,) = self._COUNT.unpack_from(payload, offset)
+        offset += self._COUNT.size
+        strings = []
+        for _ in range(n_strings):
+            value, offset = self._unpack_string(payload, offset)
+            strings.append(sys.intern(value))
+        
+        dn_ids, offset = self._unpack_ids(payload, offset, rows)
+        standard_ids, offset = self._unpack_ids(payload, offset, rows)
+        sizes, offset = self._unpack_array('d', payload, offset, rows)
+        values = []
+        for _ in columns:
+            column_values, offset = self._unpack_array('d', payload, offset, rows)
+            values.append(column_values)
+        
+        presets = []
+        for row in range(rows):
+            row_values = {column: values[i][row] for i, column in enumerate(columns)}
+            presets.append(Preset.from_values(component_type, sizes[row],
+                                              strings[dn_ids[row]],
+                                              strings[standard_ids[row]],
+                                              row_values))
+        return presets
+    
+    def _pack_string(self, value: str) -> bytes:
+        """Empaqueta un string con prefijo de longitud"""
+        encoded = value.encode('utf-8')
+        return self._LENGTH.pack(len(encoded)) + encoded
+    
+    def _unpack_string(self, payload: bytes, offset: int) -> Tuple[str, int]:
+        """Desempaqueta un string con prefijo de longitud"""
+        (length,) = self._LENGTH.unpack_from(payload, offset)
+        offset += self._LENGTH.size
+        end = offset + length
+        if end > len(payload):
+            raise ValueError("Cache truncado")
+        return payload[offset:end].decode('utf-8'), end
+    
+    @staticmethod
+    def _pack_ids(ids: List[int]) -> bytes:
+        """Serializa índices de la tabla de strings como uint32 little-endian"""
+        return struct.pack(f'<{len(ids)}I', *ids)
+    
+    @staticmethod
+    def _unpack_ids(payload: bytes, offset: int, rows: int) -> Tuple[Tuple[int, ...], int]:
+        """Deserializa índices uint32 little-endian"""
+        end = offset + 4 * rows
+        if end > len(payload):
+            raise ValueError("Cache truncado")
+        return struct.unpack_from(f'<{rows}I', payload, offset), end
+    
+    @staticmethod
+    def _pack_array(column: array.array) -> bytes:
+        """Serializa una columna float64 en little-endian"""
+        if sys.byteorder != 'little':
+            column = array.array(column.typecode, column)
+            column.byteswap()
+        return column.tobytes()
+    
+    @staticmethod
+    def _unpack_array(typecode: str, payload: bytes, offset: int,
+                      rows: int) -> Tuple[array.array, int]:
+        """Deserializa una columna float64 little-endian"""
+        column = array.array(typecode)
+        end = offset + rows * column.itemsize
+        if end > len(payload):
+            raise ValueError("Cache truncado")
+        column.frombytes(payload[offset:end])
+        if sys.byteorder != 'little':
+            column.byteswap()
+        return column, end
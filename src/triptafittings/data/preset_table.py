@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+Tabla columnar de presets
+Guarda cada dimensión en una columna float64 y permite filtros y
+validaciones sobre el catálogo completo sin recorrer objetos Preset
+"""
+
+import array
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    # NumPy es opcional: sin él las columnas son array('d') y los
+    # filtros se evalúan en Python puro
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from .preset import Preset, COMPONENT_FIELDS
+    from .validation import ROW_RULES, ValidationReport, validate_table
+except ImportError:
+    # Para ejecución directa del script
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from data.preset import Preset, COMPONENT_FIELDS
+    from data.validation import ROW_RULES, ValidationReport, validate_table
+
+
+class PresetTable:
+    """
+    Catálogo de presets de un componente en formato columnar
+
+    Las dimensiones se guardan como columnas float64 (``numpy.ndarray`` si
+    NumPy está disponible, ``array('d')`` si no) y los DN/estándares como
+    códigos enteros sobre una tabla de strings internados. Los objetos
+    ``Preset`` solo se crean cuando se piden con ``preset()``/``presets()``.
+
+    Los métodos de filtrado retornan índices de fila en el formato nativo
+    del backend (``ndarray`` o ``list``), que pueden encadenarse mediante
+    el argumento ``indices``.
+    """
+
+    def __init__(self, component_type: str, sizes: Sequence[float],
+                 dns: Sequence[str], standards: Sequence[str],
+                 columns: Dict[str, Sequence[float]],
+                 presets: Optional[Sequence[Preset]] = None):
+        """
+        Inicializa la tabla
+
+        Args:
+            component_type: Tipo de componente ('ferrule' o 'gasket')
+            sizes: Tamaños en pulgadas por fila
+            dns: DN por fila
+            standards: Estándar por fila
+            columns: Columna CSV -> valores por fila
+            presets: Presets ya materializados (opcional, mismo orden)
+        """
+        self.component_type = component_type.lower()
+        if self.component_type not in COMPONENT_FIELDS:
+            raise ValueError(f"Tipo de componente inválido: {component_type}")
+
+        self._rows = len(sizes)
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._dn_codes = self._make_codes(self._encode(dns))
+        self._standard_codes = self._make_codes(self._encode(standards))
+
+        self._columns: Dict[str, Any] = {'Size': self._make_column(sizes)}
+        for column, _ in COMPONENT_FIELDS[self.component_type]:
+            values = columns[column]
+            if len(values) != self._rows:
+                raise ValueError(f"La columna {column} no tiene {self._rows} filas")
+            self._columns[column] = self._make_column(values)
+
+        self._presets: Dict[int, Preset] = {}
+        if presets is not None:
+            self._presets = dict(enumerate(presets))
+
+    @classmethod
+    def from_presets(cls, component_type: str, presets: Sequence[Preset]) -> 'PresetTable':
+        """
+        Construye la tabla a partir de presets ya cargados
+
+        Args:
+            component_type: Tipo de componente de los presets
+            presets: Lista de presets
+
+        Returns:
+            Tabla columnar que reutiliza los presets dados al materializar
+        """
+        fields = COMPONENT_FIELDS[component_type.lower()]
+        columns = {
+            column: [getattr(p, attribute) for p in presets]
+            for column, attribute in fields
+        }
+        return cls(component_type,
+                   [p.size for p in presets],
+                   [p.dn for p in presets],
+                   [p.standard for p in presets],
+                   columns,
+                   presets)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> List[str]:
+        """Nombres de las columnas numéricas (incluye 'Size')"""
+        return list(self._columns)
+
+    def column(self, name: str):
+        """
+        Retorna una columna numérica completa
+
+        Args:
+            name: Nombre de la columna CSV (ej: 'TubeID_mm') o 'Size'
+
+        Returns:
+            ndarray float64 o array('d') de solo lectura por convención
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise ValueError(f"Columna desconocida para {self.component_type}: {name}")
+
+    def dn(self, row: int) -> str:
+        """DN de una fila"""
+        return self._strings[self._dn_codes[row]]
+
+    def standard(self, row: int) -> str:
+        """Estándar de una fila"""
+        return self._strings[self._standard_codes[row]]
+
+    def filter_range(self, column: str, low: Optional[float] = None,
+                     high: Optional[float] = None, indices=None):
+        """
+        Filas cuyo valor de ``column`` está en el rango cerrado [low, high]
+
+        Args:
+            column: Nombre de la columna
+            low: Límite inferior (None = sin límite)
+            high: Límite superior (None = sin límite)
+            indices: Restringe la búsqueda a estas filas (resultado previo)
+
+        Returns:
+            Índices de fila que cumplen el filtro
+        """
+        values = self.column(column)
+        if np is not None:
+            mask = np.ones(self._rows, dtype=bool)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+            return self._apply_mask(mask, indices)
+
+        rows = range(self._rows) if indices is None else indices
+        return [i for i in rows
+                if (low is None or values[i] >= low) and
+                (high is None or values[i] <= high)]
+
+    def filter_dn(self, dns: Iterable[str], indices=None):
+        """Filas cuyo DN está en ``dns``"""
+        return self._filter_codes(self._dn_codes, dns, indices)
+
+    def filter_standard(self, standards: Iterable[str], indices=None):
+        """Filas cuyo estándar está en ``standards``"""
+        if isinstance(standards, str):
+            standards = [standards]
+        return self._filter_codes(self._standard_codes, standards, indices)
+
+    def codes(self, field: str):
+        """
+        Columna de códigos de 'DN' o 'Standard' y su tabla de strings
+
+        Args:
+            field: 'DN' o 'Standard'
+
+        Returns:
+            Tupla (códigos por fila, lista código -> string)
+        """
+        if field == 'DN':
+            return self._dn_codes, self._strings
+        if field == 'Standard':
+            return self._standard_codes, self._strings
+        raise ValueError(f"Campo sin códigos: {field}")
+
+    def validate(self) -> Dict[str, List[int]]:
+        """
+        Evalúa las reglas de coherencia de cada fila sobre todas las filas a la vez
+
+        Returns:
+            Diccionario mensaje de error -> filas que no cumplen la regla
+            (solo incluye reglas con fallos)
+        """
+        return validate_table(self, rules=ROW_RULES[self.component_type]).failures()
+
+    def report(self, partner: Optional['PresetTable'] = None,
+               rules=None) -> ValidationReport:
+        """
+        Reporte completo por fila y por regla (ver ``data.validation``)
+
+        Args:
+            partner: Tabla del componente complementario, para las reglas
+                de emparejamiento Ferrule/Gasket
+            rules: Reglas a evaluar (por defecto todas las del componente)
+
+        Returns:
+            ValidationReport de la tabla
+        """
+        return validate_table(self, partner, rules)
+
+    def is_valid(self) -> bool:
+        """True si todas las filas cumplen las reglas de coherencia"""
+        return not self.validate()
+
+    def preset(self, row: int) -> Preset:
+        """
+        Materializa (y memoriza) el preset de una fila
+
+        Args:
+            row: Índice de fila
+
+        Returns:
+            Objeto Preset de la fila
+        """
+        row = int(row)
+        if row < 0:
+            row += self._rows
+        if not 0 <= row < self._rows:
+            raise IndexError(f"Fila fuera de rango: {row}")
+
+        preset = self._presets.get(row)
+        if preset is None:
+            values = {
+                column: float(self._columns[column][row])
+                for column, _ in COMPONENT_FIELDS[self.component_type]
+            }
+            preset = Preset.from_values(self.component_type,
+                                        float(self._columns['Size'][row]),
+                                        self.dn(row), self.standard(row), values)
+            self._presets[row] = preset
+        return preset
+
+    def presets(self, indices=None) -> List[Preset]:
+        """Materializa los presets de las filas indicadas (todas por defecto)"""
+        rows = range(self._rows) if indices is None else indices
+        return [self.preset(i) for i in rows]
+
+    def _encode(self, values: Sequence[str]) -> List[int]:
+        """Convierte strings en códigos sobre la tabla de strings internados"""
+        codes = []
+        for value in values:
+            code = self._string_ids.get(value)
+            if code is None:
+                code = len(self._strings)
+                self._string_ids[value] = code
+                self._strings.append(sys.intern(value))
+            codes.append(code)
+        if len(codes) != self._rows:
+            raise ValueError(f"Se esperaban {self._rows} filas")
+        return codes
+
+    def _filter_codes(self, codes, values: Iterable[str], indices):
+        """Filtra filas cuyo código pertenece al conjunto de strings dado"""
+        wanted = {self._string_ids[v] for v in values if v in self._string_ids}
+        if np is not None:
+            mask = np.isin(codes, list(wanted))
+            return self._apply_mask(mask, indices)
+        rows = range(self._rows) if indices is None else indices
+        return [i for i in rows if codes[i] in wanted]
+
+    def _apply_mask(self, mask, indices):
+        """Convierte una máscara booleana en índices (NumPy)"""
+        if indices is None:
+            return np.flatnonzero(mask)
+        indices = np.asarray(indices, dtype=np.intp)
+        return indices[mask[indices]]
+
+    @staticmethod
+    def _make_column(values: Sequence[float]):
+        """Crea una columna float64 en el backend disponible"""
+        if np is not None:
+            return np.asarray(values, dtype=np.float64)
+        return array.array('d', values)
+
+    @staticmethod
+    def _make_codes(codes: List[int]):
+        """Crea una columna de códigos enteros en el backend disponible"""
+        if np is not None:
+            return np.asarray(codes, dtype=np.int32)
+        return array.array('l', codes)
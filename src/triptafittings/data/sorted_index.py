@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Índice ordenado para búsquedas aproximadas de presets
+Permite consultas por valor más cercano, piso/techo y tolerancia en O(log n)
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy es opcional: nearest_many usa bisect valor por valor
+    np = None
+
+T = TypeVar('T')
+
+
+class SortedIndex(Generic[T]):
+    """
+    Índice de valores ordenados por una clave numérica
+
+    Las claves repetidas se conservan en el orden de inserción. Todas las
+    consultas individuales usan ``bisect`` sobre la lista de claves.
+    """
+
+    def __init__(self, items: Iterable[Tuple[float, T]]):
+        """
+        Construye el índice
+
+        Args:
+            items: Pares (clave, valor) en cualquier orden
+        """
+        pairs = sorted(items, key=lambda item: item[0])
+        self._keys: List[float] = [float(key) for key, _ in pairs]
+        self._values: List[T] = [value for _, value in pairs]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def keys(self) -> List[float]:
+        """Claves ordenadas (copia)"""
+        return list(self._keys)
+
+    def nearest(self, key: float, tolerance: Optional[float] = None) -> Optional[T]:
+        """
+        Valor cuya clave es la más cercana a ``key``
+
+        En caso de empate se retorna la clave menor.
+
+        Args:
+            key: Valor buscado
+            tolerance: Distancia máxima aceptada (None = sin límite)
+
+        Returns:
+            Valor más cercano o None si el índice está vacío o fuera de tolerancia
+        """
+        position = self._nearest_position(key)
+        if position is None:
+            return None
+        if tolerance is not None and abs(self._keys[position] - key) > tolerance:
+            return None
+        return self._values[position]
+
+    def floor(self, key: float) -> Optional[T]:
+        """Valor con la mayor clave <= ``key``"""
+        position = bisect_right(self._keys, key)
+        return self._values[position - 1] if position else None
+
+    def ceiling(self, key: float) -> Optional[T]:
+        """Valor con la menor clave >= ``key``"""
+        position = bisect_left(self._keys, key)
+        return self._values[position] if position < len(self._keys) else None
+
+    def within(self, key: float, tolerance: float) -> List[T]:
+        """Valores con clave en [key - tolerance, key + tolerance]"""
+        return self.range(key - tolerance, key + tolerance)
+
+    def range(self, low: float, high: float) -> List[T]:
+        """Valores con clave en el rango cerrado [low, high], ordenados"""
+        start = bisect_left(self._keys, low)
+        end = bisect_right(self._keys, high)
+        return self._values[start:end]
+
+    def neighbors(self, key: float, count: int = 1) -> List[T]:
+        """
+        Hasta ``count`` valores a cada lado de ``key``, sin los de clave igual
+
+        Args:
+            key: Clave de referencia
+            count: Valores por lado
+
+        Returns:
+            Valores ordenados por distancia a ``key`` (empates a favor de
+            la clave menor, igual que nearest())
+        """
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key)
+        below = list(range(start - 1, max(start - count, 0) - 1, -1))
+        above = list(range(end, min(end + count, len(self._keys))))
+        positions = sorted(below + above, key=lambda p: (abs(self._keys[p] - key), self._keys[p]))
+        return [self._values[p] for p in positions]
+
+    def nearest_many(self, keys: Sequence[float],
+                     tolerance: Optional[float] = None) -> List[Optional[T]]:
+        """
+        Busca el valor más cercano para muchas claves a la vez
+
+        Con NumPy usa ``searchsorted`` vectorizado; sin NumPy aplica
+        ``nearest`` a cada clave.
+
+        Args:
+            keys: Claves buscadas (ej: diámetros medidos)
+            tolerance: Distancia máxima aceptada (None = sin límite)
+
+        Returns:
+            Lista alineada con ``keys`` (None donde no hay coincidencia)
+        """
+        if np is None or not self._keys:
+            return [self.nearest(key, tolerance) for key in keys]
+
+        sorted_keys = np.asarray(self._keys, dtype=np.float64)
+        wanted = np.asarray(keys, dtype=np.float64)
+        right = np.clip(np.searchsorted(sorted_keys, wanted, side='left'),
+                        0, len(sorted_keys) - 1)
+        left = np.clip(right - 1, 0, len(sorted_keys) - 1)
+        # Empates a favor de la clave menor, igual que nearest()
+        use_left = np.abs(wanted - sorted_keys[left]) <= np.abs(sorted_keys[right] - wanted)
+        positions = np.where(use_left, left, right)
+        if tolerance is None:
+            return [self._values[p] for p in positions.tolist()]
+
+        distances = np.abs(sorted_keys[positions] - wanted)
+        return [self._values[p] if ok else None
+                for p, ok in zip(positions.tolist(), (distances <= tolerance).tolist())]
+
+    def _nearest_position(self, key: float) -> Optional[int]:
+        """Posición de la clave más cercana"""
+        if not self._keys:
+            return None
+        position = bisect_left(self._keys, key)
+        if position == 0:
+            return 0
+        if position == len(self._keys):
+            return position - 1
+        before = self._keys[position - 1]
+        after = self._keys[position]
+        return position - 1 if key - before <= after - key else position
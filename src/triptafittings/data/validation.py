@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de validación por reglas sobre tablas columnares de presets
+Evalúa cada regla sobre columnas completas (vectorizado con NumPy si está
+disponible) y produce un reporte por fila y por regla en una sola pasada,
+sin crear objetos Preset ni capturar excepciones fila a fila
+"""
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # Sin NumPy las reglas se evalúan en Python puro
+    np = None
+
+try:
+    from .preset import COMPONENT_FIELDS
+except ImportError:
+    # Para ejecución directa del script
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from data.preset import COMPONENT_FIELDS
+
+
+class Rule:
+    """
+    Regla de validación evaluada sobre una tabla completa
+
+    Las subclases implementan ``evaluate``, que retorna una máscara por fila
+    (``ndarray`` bool o ``list`` de bool) con True en las filas que cumplen.
+    Un valor NaN (p. ej. un número ilegible en el CSV) no cumple las
+    comparaciones.
+    """
+
+    # True si la regla necesita la tabla del componente complementario
+    needs_partner = False
+
+    def __init__(self, name: str, message: str):
+        """
+        Args:
+            name: Identificador estable de la regla
+            message: Descripción del fallo para el usuario
+        """
+        self.name = name
+        self.message = message
+
+    def evaluate(self, table, partner=None, shared: Optional[Dict[str, Any]] = None):
+        """
+        Evalúa la regla sobre todas las filas
+
+        Args:
+            table: PresetTable a validar
+            partner: PresetTable del componente complementario (opcional)
+            shared: Resultados intermedios compartidos entre las reglas de
+                una misma validación (p. ej. las parejas de cada fila)
+
+        Returns:
+            Máscara de filas que cumplen la regla
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class CompareRule(Rule):
+    """Compara una columna con otra columna o con una constante"""
+
+    def __init__(self, name: str, message: str, column: str,
+                 compare: Callable[[Any, Any], Any], reference):
+        """
+        Args:
+            name: Identificador de la regla
+            message: Descripción del fallo
+            column: Columna evaluada
+            compare: Operador binario (``operator.gt``, ``operator.eq``...)
+            reference: Nombre de otra columna o valor constante
+        """
+        super().__init__(name, message)
+        self.column = column
+        self.compare = compare
+        self.reference = reference
+
+    def evaluate(self, table, partner=None, shared=None):
+        values = table.column(self.column)
+        by_column = isinstance(self.reference, str)
+        other = table.column(self.reference) if by_column else self.reference
+        if _vectorized(table):
+            return np.asarray(self.compare(values, other), dtype=bool)
+        if by_column:
+            return [bool(self.compare(a, b)) for a, b in zip(values, other)]
+        return [bool(self.compare(a, other)) for a in values]
+
+
+class RequiredRule(Rule):
+    """Un campo de texto ('DN' o 'Standard') no puede estar vacío"""
+
+    def __init__(self, name: str, message: str, field: str):
+        """
+        Args:
+            name: Identificador de la regla
+            message: Descripción del fallo
+            field: 'DN' o 'Standard'
+        """
+        super().__init__(name, message)
+        self.field = field
+
+    def evaluate(self, table, partner=None, shared=None):
+        codes, strings = table.codes(self.field)
+        # Se evalúa una vez por string distinto, no por fila
+        filled = [bool(value.strip()) for value in strings]
+        if _vectorized(table):
+            return np.asarray(filled, dtype=bool)[codes] if filled else np.zeros(len(table), bool)
+        return [filled[code] for code in codes]
+
+
+class MonotonicRule(Rule):
+    """
+    Una columna debe crecer estrictamente con el tamaño dentro de cada estándar
+
+    Se marca la fila cuyo valor no supera al del tamaño inmediatamente
+    menor del mismo estándar. Las filas con el mismo tamaño no se comparan
+    y los NaN no se marcan aquí (ya los reportan las reglas por fila).
+    """
+
+    def __init__(self, name: str, message: str, column: str):
+        """
+        Args:
+            name: Identificador de la regla
+            message: Descripción del fallo
+            column: Columna que debe crecer con 'Size'
+        """
+        super().__init__(name, message)
+        self.column = column
+
+    def evaluate(self, table, partner=None, shared=None):
+        sizes = table.column('Size')
+        values = table.column(self.column)
+        standards, _ = table.codes('Standard')
+        rows = len(table)
+
+        if _vectorized(table):
+            mask = np.ones(rows, dtype=bool)
+            if rows < 2:
+                return mask
+            order = np.lexsort((sizes, standards))
+            sorted_sizes = sizes[order]
+            sorted_values = values[order]
+            sorted_standards = standards[order]
+            same_standard = sorted_standards[1:] == sorted_standards[:-1]
+            larger = sorted_sizes[1:] > sorted_sizes[:-1]
+            shrinks = sorted_values[1:] <= sorted_values[:-1]
+            mask[order[1:][same_standard & larger & shrinks]] = False
+            return mask
+
+        mask = [True] * rows
+        order = sorted(range(rows), key=lambda i: (standards[i], sizes[i]))
+        for previous, current in zip(order, order[1:]):
+            if (standards[previous] == standards[current] and
+                    sizes[current] > sizes[previous] and
+                    values[current] <= values[previous]):
+                mask[current] = False
+        return mask
+
+
+class PairingRule(Rule):
+    """
+    Cada fila debe tener su pareja en la tabla del componente complementario
+
+    La pareja es la fila del otro componente con el mismo tamaño, DN y
+    estándar. Sin ``columns`` la regla solo exige que exista; con
+    ``columns`` exige además que las columnas indicadas coincidan (las
+    filas sin pareja cumplen, porque ya las reporta la regla de existencia).
+    Si no se entrega la tabla complementaria la regla no se evalúa.
+    """
+
+    needs_partner = True
+
+    def __init__(self, name: str, message: str,
+                 columns: Sequence[Tuple[str, str]] = ()):
+        """
+        Args:
+            name: Identificador de la regla
+            message: Descripción del fallo
+            columns: Pares (columna propia, columna de la pareja) que deben
+                ser iguales
+        """
+        super().__init__(name, message)
+        self.columns = tuple(columns)
+
+    def evaluate(self, table, partner=None, shared=None):
+        if shared is None:
+            shared = {}
+        matches = shared.get('partner_rows')
+        if matches is None:
+            matches = shared['partner_rows'] = partner_rows(table, partner)
+        if _vectorized(table, partner):
+            found = matches >= 0
+            if not self.columns:
+                return found
+            mask = np.ones(len(table), dtype=bool)
+            rows = np.flatnonzero(found)
+            for own, other in self.columns:
+                mask[rows] &= table.column(own)[rows] == partner.column(other)[matches[rows]]
+            return mask
+
+        if not self.columns:
+            return [match >= 0 for match in matches]
+        columns = [(table.column(own), partner.column(other)) for own, other in self.columns]
+        return [match < 0 or all(values[row] == others[match] for values, others in columns)
+                for row, match in enumerate(matches)]
+
+
+def partner_rows(table, partner):
+    """
+    Busca para cada fila la fila del otro componente con el mismo tamaño,
+    DN y estándar
+
+    Args:
+        table: PresetTable de referencia
+        partner: PresetTable donde buscar
+
+    Returns:
+        Índice de la pareja por fila (-1 si no tiene); ``ndarray`` con
+        NumPy, ``list`` sin él. Si hay parejas repetidas se usa la primera
+    """
+    if _vectorized(table, partner):
+        if len(partner) == 0:
+            return np.full(len(table), -1, dtype=np.intp)
+        translation = _translation(table, partner)
+        # Claves enteras: (código de tamaño, estándar, DN) combinadas en int64
+        _, size_codes = np.unique(
+            np.concatenate([table.column('Size'), partner.column('Size')]),
+            return_inverse=True)
+        size_codes = size_codes.astype(np.int64)
+        width = len(partner.codes('DN')[1]) + 1
+
+        def combine(sizes, standards, dns):
+            return (sizes * width + standards + 1) * width + dns + 1
+
+        own = combine(size_codes[:len(table)],
+                      translation[table.codes('Standard')[0]],
+                      translation[table.codes('DN')[0]])
+        other = combine(size_codes[len(table):],
+                        partner.codes('Standard')[0].astype(np.int64),
+                        partner.codes('DN')[0].astype(np.int64))
+        # Orden estable: ante claves repetidas searchsorted da la primera fila
+        order = np.argsort(other, kind='stable')
+        positions = np.minimum(np.searchsorted(other[order], own), len(other) - 1)
+        candidates = order[positions]
+        return np.where(other[candidates] == own, candidates, -1)
+
+    translation = _translation(table, partner)
+    partner_standards, partner_strings = partner.codes('Standard')
+    partner_dns, _ = partner.codes('DN')
+    partner_sizes = partner.column('Size')
+    lookup = {}
+    for row in range(len(partner)):
+        lookup.setdefault((partner_sizes[row], partner_standards[row], partner_dns[row]), row)
+    standards, _ = table.codes('Standard')
+    dns, _ = table.codes('DN')
+    sizes = table.column('Size')
+    return [lookup.get((sizes[row], translation[standards[row]], translation[dns[row]]), -1)
+            for row in range(len(table))]
+
+
+def _vectorized(*tables) -> bool:
+    """True si NumPy está disponible y las tablas usan columnas ``ndarray``"""
+    return np is not None and all(isinstance(t.column('Size'), np.ndarray) for t in tables)
+
+
+def _translation(table, vocabulary):
+    """
+    Traduce los códigos de strings de ``table`` a los de ``vocabulary``
+
+    DN y estándar comparten la tabla de strings, así que basta una
+    traducción por tabla. Los strings ausentes en ``vocabulary`` dan -1.
+    """
+    _, strings = table.codes('DN')
+    _, target = vocabulary.codes('DN')
+    if not _vectorized(table, vocabulary):
+        ids = {value: code for code, value in enumerate(target)}
+        return [ids.get(value, -1) for value in strings]
+    if not strings or not target:
+        return np.full(len(strings), -1, dtype=np.int64)
+    strings = np.asarray(strings, dtype=str)
+    target = np.asarray(target, dtype=str)
+    order = np.argsort(target, kind='stable')
+    positions = np.minimum(np.searchsorted(target[order], strings), len(target) - 1)
+    candidates = order[positions]
+    return np.where(target[candidates] == strings, candidates, -1).astype(np.int64)
+
+
+def _positive_rules(component_type: str) -> List[Rule]:
+    """Reglas 'columna > 0' para todas las dimensiones de un componente"""
+    return [
+        CompareRule(f"positive:{column}", f"{column[:-3]} debe ser mayor que 0",
+                    column, operator.gt, 0.0)
+        for column, _ in COMPONENT_FIELDS[component_type]
+    ]
+
+
+_SIZE_RULE = CompareRule("positive:Size", "Size debe ser mayor que 0", 'Size', operator.gt, 0.0)
+_REQUIRED_RULES = (
+    RequiredRule("required:DN", "DN es obligatorio", 'DN'),
+    RequiredRule("required:Standard", "Standard es obligatorio", 'Standard'),
+)
+
+# Reglas que solo dependen de la propia fila (incluyen las de
+# Preset._validate_*_coherence con los mismos mensajes)
+ROW_RULES: Dict[str, Tuple[Rule, ...]] = {
+    'ferrule': (
+        _SIZE_RULE,
+        *_REQUIRED_RULES,
+        *_positive_rules('ferrule'),
+        CompareRule("flange_over_tube", "FlangeOD debe ser mayor que TubeID",
+                    'FlangeOD_mm', operator.gt, 'TubeID_mm'),
+    ),
+    'gasket': (
+        _SIZE_RULE,
+        *_REQUIRED_RULES,
+        *_positive_rules('gasket'),
+        CompareRule("od_over_id", "GasketOD debe ser mayor que GasketID",
+                    'GasketOD_mm', operator.gt, 'GasketID_mm'),
+        CompareRule("flange_equals_od", "FlangeOD debe ser igual a GasketOD para Gasket",
+                    'FlangeOD_mm', operator.eq, 'GasketOD_mm'),
+    ),
+}
+
+# Reglas que comparan filas entre sí o con el componente complementario
+CATALOG_RULES: Dict[str, Tuple[Rule, ...]] = {
+    'ferrule': (
+        MonotonicRule("monotonic:FlangeOD_mm", "FlangeOD debe crecer con el tamaño",
+                      'FlangeOD_mm'),
+        MonotonicRule("monotonic:TubeID_mm", "TubeID debe crecer con el tamaño",
+                      'TubeID_mm'),
+        PairingRule("pairing", "No hay Gasket con el mismo tamaño, DN y estándar"),
+        PairingRule("pairing:seat", "FlangeOD/C2 no coinciden con los del Gasket",
+                    (('FlangeOD_mm', 'FlangeOD_mm'), ('C2_mm', 'BeadC2_mm'))),
+    ),
+    'gasket': (
+        MonotonicRule("monotonic:GasketOD_mm", "GasketOD debe crecer con el tamaño",
+                      'GasketOD_mm'),
+        MonotonicRule("monotonic:GasketID_mm", "GasketID debe crecer con el tamaño",
+                      'GasketID_mm'),
+        PairingRule("pairing", "No hay Ferrule con el mismo tamaño, DN y estándar"),
+        PairingRule("pairing:seat", "FlangeOD/BeadC2 no coinciden con los del Ferrule",
+                    (('FlangeOD_mm', 'FlangeOD_mm'), ('BeadC2_mm', 'C2_mm'))),
+    ),
+}
+
+
+def default_rules(component_type: str) -> Tuple[Rule, ...]:
+    """Todas las reglas de un componente (por fila y de catálogo)"""
+    return ROW_RULES[component_type] + CATALOG_RULES[component_type]
+
+
+class ValidationReport:
+    """
+    Resultado de validar una tabla: una máscara por regla evaluada
+
+    Las reglas que necesitan la tabla complementaria y no la recibieron
+    aparecen en ``skipped`` y no cuentan como fallos.
+    """
+
+    def __init__(self, component_type: str, rows: int,
+                 rules: Sequence[Rule], masks: Dict[str, Any],
+                 skipped: Sequence[str] = ()):
+        """
+        Args:
+            component_type: Tipo de componente validado
+            rows: Número de filas de la tabla
+            rules: Reglas evaluadas, en orden
+            masks: Nombre de regla -> máscara de filas que cumplen
+            skipped: Nombres de reglas no evaluadas
+        """
+        self.component_type = component_type
+        self.rows = rows
+        self.rules = list(rules)
+        self.masks = masks
+        self.skipped = list(skipped)
+
+    def failed_rows(self, rule_name: str) -> List[int]:
+        """Filas que no cumplen una regla"""
+        mask = self.masks[rule_name]
+        if np is not None and isinstance(mask, np.ndarray):
+            return np.flatnonzero(~mask).tolist()
+        return [row for row, ok in enumerate(mask) if not ok]
+
+    def failures(self) -> Dict[str, List[int]]:
+        """
+        Fallos agrupados por regla
+
+        Returns:
+            Mensaje de la regla -> filas que no la cumplen (solo reglas con
+            fallos, en el orden de las reglas)
+        """
+        failures = {}
+        for rule in self.rules:
+            rows = self.failed_rows(rule.name)
+            if rows:
+                failures[rule.message] = rows
+        return failures
+
+    def row_errors(self) -> Dict[int, List[str]]:
+        """
+        Fallos agrupados por fila
+
+        Returns:
+            Fila -> mensajes de las reglas que no cumple (solo filas con
+            fallos, ordenadas)
+        """
+        errors: Dict[int, List[str]] = {}
+        for rule in self.rules:
+            for row in self.failed_rows(rule.name):
+                errors.setdefault(row, []).append(rule.message)
+        return dict(sorted(errors.items()))
+
+    def invalid_rows(self) -> List[int]:
+        """Filas que no cumplen al menos una regla"""
+        return list(self.row_errors())
+
+    def is_valid(self) -> bool:
+        """True si todas las filas cumplen todas las reglas evaluadas"""
+        return not any(self.failed_rows(rule.name) for rule in self.rules)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Reporte serializable (JSON) con los fallos por regla"""
+        return {
+            'component': self.component_type,
+            'rows': self.rows,
+            'valid': self.is_valid(),
+            'rules': {rule.name: {'message': rule.message,
+                                  'failed_rows': self.failed_rows(rule.name)}
+                      for rule in self.rules},
+            'skipped': list(self.skipped),
+        }
+
+    def __repr__(self) -> str:
+        return (f"ValidationReport({self.component_type!r}, rows={self.rows}, "
+                f"invalid={len(self.invalid_rows())})")
+
+
+def validate_table(table, partner=None,
+                   rules: Optional[Sequence[Rule]] = None) -> ValidationReport:
+    """
+    Evalúa reglas sobre todas las filas de una tabla
+
+    Args:
+        table: PresetTable a validar
+        partner: PresetTable del componente complementario, necesaria para
+            las reglas de emparejamiento
+        rules: Reglas a evaluar (por defecto ``default_rules`` del componente)
+
+    Returns:
+        ValidationReport con una máscara por regla evaluada
+    """
+    if rules is None:
+        rules = default_rules(table.component_type)
+
+    evaluated, masks, skipped, shared = [], {}, [], {}
+    for rule in rules:
+        if rule.needs_partner and partner is None:
+            skipped.append(rule.name)
+            continue
+        masks[rule.name] = rule.evaluate(table, partner, shared)
+        evaluated.append(rule)
+    return ValidationReport(table.component_type, len(table), evaluated, masks, skipped)
+
+
+def validate_catalog(ferrules, gaskets) -> Dict[str, ValidationReport]:
+    """
+    Valida las tablas de Ferrule y Gasket, incluido su emparejamiento
+
+    Args:
+        ferrules: PresetTable de Ferrule
+        gaskets: PresetTable de Gasket
+
+    Returns:
+        Diccionario componente -> ValidationReport
+    """
+    return {
+        'ferrule': validate_table(ferrules, gaskets),
+        'gasket': validate_table(gaskets, ferrules),
+    }
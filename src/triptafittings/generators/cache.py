@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""Cache de geometría direccionado por contenido.
+
+La clave de cada entrada es un hash estable de los parámetros del
+``Preset`` más el nombre y la versión del generador, de modo que cambiar
+un valor del catálogo o la lógica del generador produce una clave nueva.
+El cache tiene dos niveles:
+
+* memoria: LRU con un número máximo de entradas;
+* disco (opcional): un archivo JSON por entrada, con un tamaño total
+  máximo y expulsión de las entradas usadas hace más tiempo.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..data.preset import Preset
+
+
+def geometry_key(preset: Preset, generator_name: str, generator_version: str) -> str:
+    """Calcula la clave de cache de la geometría de ``preset``.
+
+    Parameters
+    ----------
+    preset:
+        Preset cuyos parámetros definen la geometría.
+    generator_name, generator_version:
+        Identifican la lógica que produce la geometría.
+
+    Returns
+    -------
+    str
+        Hash sha256 en hexadecimal.
+    """
+    payload = json.dumps(
+        {
+            "generator": generator_name,
+            "version": generator_version,
+            "parameters": preset.get_parameters_dict(),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GeometryCache:
+    """Cache LRU en memoria con respaldo opcional en disco.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directorio del nivel de disco.  ``None`` desactiva ese nivel.
+    memory_items:
+        Número máximo de geometrías en memoria.
+    max_disk_bytes:
+        Tamaño total máximo de los archivos del nivel de disco.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        memory_items: int = 256,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.memory_items = memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self.logger = logging.getLogger(__name__)
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Reentrante: la expulsión de disco corre con el lock tomado y las
+        # subclases pueden tocar la memoria al liberar una entrada
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        # Tamaño estimado del nivel de disco (None = aún no calculado)
+        self._disk_bytes: Optional[int] = None
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __reduce__(self):
+        # En pools de procesos cada trabajador recibe un cache nuevo que
+        # comparte el nivel de disco pero no la memoria
+        return (type(self), (self.cache_dir, self.memory_items, self.max_disk_bytes))
+
+    # ------------------------------------------------------------------
+    def get_or_generate(self, generator: Any) -> Dict[str, Any]:
+        """Retorna la geometría de ``generator`` desde el cache o la genera.
+
+        El generador debe exponer ``preset``, ``VERSION`` y
+        ``generate_geometry()``.
+        """
+        key = geometry_key(generator.preset, type(generator).__name__, generator.VERSION)
+        geometry = self.get(key)
+        if geometry is None:
+            geometry = generator.generate_geometry()
+            self.put(key, geometry)
+        return geometry
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Busca una geometría en memoria y luego en disco."""
+        with self._lock:
+            geometry = self._memory.get(key)
+            if geometry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._copy(geometry)
+
+        geometry = self._read_disk(key)
+        with self._lock:
+            if geometry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, geometry)
+        return self._copy(geometry)
+
+    def put(self, key: str, geometry: Dict[str, Any]) -> None:
+        """Guarda una geometría en ambos niveles."""
+        geometry = self._copy(geometry)
+        with self._lock:
+            self._remember(key, geometry)
+        self._write_disk(key, geometry)
+
+    def clear(self) -> None:
+        """Vacía ambos niveles del cache."""
+        with self._lock:
+            self._memory.clear()
+            self._disk_bytes = None
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob("*" + self.SUFFIX):
+                self._unlink(path)
+
+    # ------------------------------------------------------------------
+    # Puntos de extensión: las subclases cambian cómo se copian las
+    # entradas y cómo se guardan en disco (ver ``MeshCache``)
+    @staticmethod
+    def _copy(geometry: Any) -> Any:
+        """Copia entregada al llamador; la del cache no se comparte."""
+        return copy.deepcopy(geometry)
+
+    def _encode(self, geometry: Any) -> bytes:
+        """Contenido del archivo de una entrada."""
+        return json.dumps(geometry).encode("utf-8")
+
+    def _decode(self, path: Path) -> Any:
+        """Lee una entrada de disco; ``ValueError`` si está corrupta."""
+        with path.open("r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def _remember(self, key: str, geometry: Dict[str, Any]) -> None:
+        """Inserta en el LRU de memoria; debe llamarse con ``_lock``."""
+        self._memory[key] = geometry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._evicted(self._memory.popitem(last=False)[0])
+
+    def _evicted(self, key: str) -> None:
+        """La entrada ``key`` salió del LRU de memoria (con ``_lock``)."""
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / (key + self.SUFFIX)
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            geometry = self._decode(path)
+            # El mtime marca el último uso para la expulsión LRU
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Entrada de cache ilegible {path}: {e}")
+            self._unlink(path)
+            return None
+        return geometry
+
+    def _write_disk(self, key: str, geometry: Dict[str, Any]) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        try:
+            payload = self._encode(geometry)
+            previous = path.stat().st_size if path.exists() else 0
+            fd, tmp_name = tempfile.mkstemp(prefix=key, dir=str(self.cache_dir))
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(payload)
+                self._release(path)
+                os.replace(tmp_name, path)
+            except BaseException:
+                self._unlink(Path(tmp_name))
+                raise
+            written = path.stat().st_size
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"No se pudo escribir la entrada {path}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._evict_disk()
+            else:
+                self._disk_bytes += written - previous
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._disk_bytes = self._evict_disk()
+
+    def _evict_disk(self) -> int:
+        """Elimina las entradas menos usadas hasta respetar ``max_disk_bytes``.
+
+        Returns
+        -------
+        int
+            Tamaño total del nivel de disco tras la expulsión.
+        """
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*" + self.SUFFIX):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_disk_bytes:
+            return total
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            self._unlink(path)
+            total -= size
+        return total
+
+    def _release(self, path: Path) -> None:
+        """Cierra lo que tenga abierto el archivo de una entrada.
+
+        Se llama antes de reemplazarlo o borrarlo: en Windows no se puede
+        hacer ninguna de las dos cosas con un archivo abierto o mapeado.
+        """
+
+    def _unlink(self, path: Path) -> None:
+        self._release(path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"No se pudo eliminar la entrada de cache {path}: {e}")
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Selección del generador adecuado para cada ``Preset``.
+
+Centraliza la correspondencia tipo de componente -> clase generadora y
+expone ``generate_geometry`` como función de módulo para poder enviarla
+a pools de procesos (debe ser serializable con ``pickle``).
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Type, Union
+
+from ..data.preset import Preset
+from .cache import GeometryCache
+from .ferrule import FerruleGenerator
+from .gasket import GasketGenerator
+
+Generator = Union[FerruleGenerator, GasketGenerator]
+
+GENERATORS: Dict[str, Type[Generator]] = {
+    "ferrule": FerruleGenerator,
+    "gasket": GasketGenerator,
+}
+
+
+def get_generator(preset: Preset) -> Generator:
+    """Crea el generador correspondiente al tipo de ``preset``.
+
+    Raises
+    ------
+    ValueError
+        Si no existe generador para el tipo de componente.
+    """
+    try:
+        generator_class = GENERATORS[preset.component_type]
+    except KeyError:
+        raise ValueError(f"Tipo de componente inválido: {preset.component_type}")
+    return generator_class(preset)
+
+
+def generate_geometry(preset: Preset, cache: Optional[GeometryCache] = None) -> Dict[str, Any]:
+    """Genera la geometría de ``preset`` con su generador.
+
+    Si se indica ``cache`` la geometría se busca primero allí y solo se
+    genera cuando no existe una entrada para el mismo contenido.
+    """
+    generator = get_generator(preset)
+    if cache is None:
+        return generator.generate_geometry()
+    return cache.get_or_generate(generator)
+
+
+def build_solid(preset: Preset) -> Any:
+    """Construye el sólido ``Part`` de ``preset`` (requiere FreeCAD)."""
+    return get_generator(preset).build_solid()
@@ -9,7 +9,7 @@ Sprint 2 sin depender de FreeCAD.
 """
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 try:
     from ..data.preset import Preset
@@ -23,6 +23,9 @@ except ImportError:  # pragma: no cover - soporte para ejecución directa
 class FerruleGenerator:
     """Generador de modelos de Ferrule basado en ``Preset``."""
 
+    # Versión de la lógica de generación; cambiarla invalida el cache de geometría
+    VERSION = "1"
+
     def __init__(self, preset: Preset) -> None:
         if preset.component_type != "ferrule":
             raise ValueError("FerruleGenerator requiere un preset de tipo 'ferrule'")
@@ -42,10 +45,33 @@ class FerruleGenerator:
             "component": "ferrule",
         }
 
-    def update_spreadsheet(self, spreadsheet: Dict[str, Any]) -> None:
+    def build_solid(self) -> Any:
+        """Construye el sólido ``Part`` revolucionando el perfil DIN 32676.
+
+        Requiere FreeCAD.  La plantilla del perfil se crea una vez por
+        estándar y solo se re-dimensiona para cada tamaño.
+        """
+        from .profiles import get_profile_template
+
+        return get_profile_template("ferrule", self.preset.standard).build_solid(self.preset)
+
+    def update_spreadsheet(
+        self, spreadsheet: Any, previous: Optional[Preset] = None
+    ) -> Dict[str, Any]:
         """Actualiza una estructura tipo *spreadsheet* con los parámetros.
 
-        La función recibe cualquier objeto semejante a un diccionario y
-        actualiza/añade los parámetros del ``Preset``.
+        Acepta un objeto semejante a un diccionario o una hoja
+        ``Spreadsheet::Sheet`` de FreeCAD (ver ``generators.spreadsheet``).
+        Si se indica ``previous`` solo se escriben los parámetros que
+        difieren de ese preset.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parámetros escritos.
         """
-        spreadsheet.update(self.preset.get_parameters_dict())
+        from .spreadsheet import diff_presets, write_parameters
+
+        changes = diff_presets(previous, self.preset)
+        write_parameters(spreadsheet, "ferrule", changes)
+        return changes
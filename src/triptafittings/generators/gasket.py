@@ -7,7 +7,7 @@ utiliza durante el Sprint 2 para validar el flujo sin requerir FreeCAD.
 """
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 try:
     from ..data.preset import Preset
@@ -21,6 +21,9 @@ except ImportError:  # pragma: no cover - soporte para ejecución directa
 class GasketGenerator:
     """Generador de modelos de Gasket basado en ``Preset``."""
 
+    # Versión de la lógica de generación; cambiarla invalida el cache de geometría
+    VERSION = "1"
+
     def __init__(self, preset: Preset) -> None:
         if preset.component_type != "gasket":
             raise ValueError("GasketGenerator requiere un preset de tipo 'gasket'")
@@ -40,6 +43,33 @@ class GasketGenerator:
             "component": "gasket",
         }
 
-    def update_spreadsheet(self, spreadsheet: Dict[str, Any]) -> None:
-        """Actualiza una estructura tipo *spreadsheet* con los parámetros."""
-        spreadsheet.update(self.preset.get_parameters_dict())
+    def build_solid(self) -> Any:
+        """Construye el sólido ``Part`` revolucionando el perfil DIN 32676.
+
+        Requiere FreeCAD.  La plantilla del perfil se crea una vez por
+        estándar y solo se re-dimensiona para cada tamaño.
+        """
+        from .profiles import get_profile_template
+
+        return get_profile_template("gasket", self.preset.standard).build_solid(self.preset)
+
+    def update_spreadsheet(
+        self, spreadsheet: Any, previous: Optional[Preset] = None
+    ) -> Dict[str, Any]:
+        """Actualiza una estructura tipo *spreadsheet* con los parámetros.
+
+        Acepta un objeto semejante a un diccionario o una hoja
+        ``Spreadsheet::Sheet`` de FreeCAD (ver ``generators.spreadsheet``).
+        Si se indica ``previous`` solo se escriben los parámetros que
+        difieren de ese preset.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parámetros escritos.
+        """
+        from .spreadsheet import diff_presets, write_parameters
+
+        changes = diff_presets(previous, self.preset)
+        write_parameters(spreadsheet, "gasket", changes)
+        return changes
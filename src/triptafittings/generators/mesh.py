@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Teselado de sólidos de revolución sin FreeCAD.
+
+El perfil ``(r, z)`` de ``profiles.py`` se revoluciona alrededor del eje Z
+en ``N`` sectores.  Como las aristas del perfil son rectas, la única
+aproximación está en la dirección angular: ``N`` se elige para que la
+cuerda de cada sector no se aleje del arco más que la desviación lineal
+y no abarque más que la desviación angular (mismo criterio que
+``Part.Shape.tessellate`` / ``MeshPart``).
+
+Las mallas usan buffers empaquetados: vértices ``float32`` (x, y, z) e
+índices ``uint32`` (tres por triángulo), listos para escribir en STL o
+para subir a una GPU.
+"""
+from __future__ import annotations
+
+import math
+import struct
+from array import array
+from typing import Iterator, NamedTuple, Sequence, Tuple
+
+from ..data.preset import Preset
+from .profiles import Point, get_profile_template
+
+# Desviaciones por defecto (mm, radianes), similares a las de FreeCAD
+DEFAULT_LINEAR_DEFLECTION = 0.1
+DEFAULT_ANGULAR_DEFLECTION = 0.5
+
+# Versión del teselador; cambiarla invalida las mallas en cache
+MESH_VERSION = "1"
+
+_MIN_SEGMENTS = 3
+_MAX_SEGMENTS = 4096
+
+
+class Mesh(NamedTuple):
+    """Malla triangular con buffers empaquetados.
+
+    Los buffers son ``array`` o, si la malla viene de ``MeshCache``,
+    ``memoryview`` de solo lectura sobre el archivo mapeado.
+    """
+
+    vertices: Sequence[float]  # float32: x, y, z por vértice
+    indices: Sequence[int]     # uint32: tres índices por triángulo
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices) // 3
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.indices) // 3
+
+    def triangles(self) -> Iterator[Tuple[Tuple[float, float, float], ...]]:
+        """Itera los triángulos como tuplas de tres vértices ``(x, y, z)``."""
+        v = self.vertices
+        idx = self.indices
+        for t in range(0, len(idx), 3):
+            yield tuple((v[3 * i], v[3 * i + 1], v[3 * i + 2]) for i in idx[t:t + 3])
+
+
+def revolution_segments(
+    max_radius: float,
+    linear_deflection: float = DEFAULT_LINEAR_DEFLECTION,
+    angular_deflection: float = DEFAULT_ANGULAR_DEFLECTION,
+) -> int:
+    """Número de sectores que cumple ambas desviaciones en el radio máximo.
+
+    Raises
+    ------
+    ValueError
+        Si alguna desviación no es positiva.
+    """
+    if linear_deflection <= 0 or angular_deflection <= 0:
+        raise ValueError("Las desviaciones de teselado deben ser positivas")
+    step = angular_deflection
+    if max_radius > linear_deflection:
+        # Flecha de la cuerda: r * (1 - cos(paso / 2)) <= desviación lineal
+        step = min(step, 2 * math.acos(1 - linear_deflection / max_radius))
+    segments = math.ceil(2 * math.pi / step)
+    return max(_MIN_SEGMENTS, min(_MAX_SEGMENTS, segments))
+
+
+def tessellate_profile(
+    points: Sequence[Point],
+    linear_deflection: float = DEFAULT_LINEAR_DEFLECTION,
+    angular_deflection: float = DEFAULT_ANGULAR_DEFLECTION,
+) -> Mesh:
+    """Revoluciona un perfil cerrado ``(r, z)`` 360° sobre Z y lo tesela.
+
+    La malla es cerrada y sus triángulos están orientados hacia afuera.
+    Los vértices sobre el eje (``r == 0``) se repiten por sector; las
+    caras degeneradas resultantes tienen área nula.
+    """
+    # Orientar el perfil en sentido antihorario en el plano (r, z)
+    area = sum(r0 * z1 - r1 * z0 for (r0, z0), (r1, z1) in zip(points, points[1:] + points[:1]))
+    if area < 0:
+        points = list(reversed(points))
+    n = len(points)
+    segments = revolution_segments(max(r for r, _ in points), linear_deflection, angular_deflection)
+
+    vertices = array("f")
+    for j in range(segments):
+        angle = 2 * math.pi * j / segments
+        c, s = math.cos(angle), math.sin(angle)
+        for r, z in points:
+            vertices.extend((r * c, r * s, z))
+
+    indices = array("I")
+    for j in range(segments):
+        ring = j * n
+        next_ring = ((j + 1) % segments) * n
+        for i in range(n):
+            a = ring + i
+            b = ring + (i + 1) % n
+            c_ = next_ring + i
+            d = next_ring + (i + 1) % n
+            indices.extend((a, c_, b, b, c_, d))
+    return Mesh(vertices, indices)
+
+
+def tessellate(
+    preset: Preset,
+    linear_deflection: float = DEFAULT_LINEAR_DEFLECTION,
+    angular_deflection: float = DEFAULT_ANGULAR_DEFLECTION,
+) -> Mesh:
+    """Malla del sólido de ``preset`` usando su plantilla de perfil."""
+    template = get_profile_template(preset.component_type, preset.standard)
+    return tessellate_profile(template.dimension(preset), linear_deflection, angular_deflection)
+
+
+def mesh_volume(mesh: Mesh) -> float:
+    """Volumen encerrado por una malla cerrada (teorema de la divergencia)."""
+    volume = 0.0
+    for (ax, ay, az), (bx, by, bz), (cx, cy, cz) in mesh.triangles():
+        volume += ax * (by * cz - bz * cy) - ay * (bx * cz - bz * cx) + az * (bx * cy - by * cx)
+    return volume / 6.0
+
+
+_STL_TRIANGLE = struct.Struct("<12fH")
+
+
+def stl_bytes(mesh: Mesh, header: bytes = b"TriptaFittings") -> bytes:
+    """Serializa la malla como STL binario."""
+    parts = [header[:80].ljust(80, b"\0"), struct.pack("<I", mesh.triangle_count)]
+    pack = _STL_TRIANGLE.pack
+    for (ax, ay, az), (bx, by, bz), (cx, cy, cz) in mesh.triangles():
+        ux, uy, uz = bx - ax, by - ay, bz - az
+        vx, vy, vz = cx - ax, cy - ay, cz - az
+        nx, ny, nz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+        length = math.sqrt(nx * nx + ny * ny + nz * nz) or 1.0
+        parts.append(pack(nx / length, ny / length, nz / length,
+                          ax, ay, az, bx, by, bz, cx, cy, cz, 0))
+    return b"".join(parts)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""Cache de mallas teseladas con niveles de detalle.
+
+La clave de cada malla es ``(hash de geometría, desviación lineal,
+desviación angular)``: el hash de geometría es el mismo que usa
+``GeometryCache`` para la salida de ``FerruleGenerator``/``GasketGenerator``,
+así que cambiar el catálogo o la versión del generador invalida también
+las mallas.  Las previsualizaciones piden el nivel ``"preview"`` (malla
+gruesa) y la exportación el nivel ``"export"`` (malla fina).
+
+En disco cada malla es un archivo ``.mesh`` con los buffers empaquetados
+(``float32`` para vértices, ``uint32`` para índices, little-endian).  Los
+archivos de hasta ``MMAP_MIN_BYTES`` se leen completos; los mayores se
+mapean en memoria con ``mmap`` y los buffers de la ``Mesh`` devuelta son
+vistas de solo lectura sobre el archivo, sin copiar datos.  El mapa se
+cierra cuando la malla sale del LRU de memoria y antes de reemplazar o
+expulsar el archivo, ya que en Windows no se puede hacer ninguna de las
+dos cosas con un archivo mapeado.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+from ..data.preset import Preset
+from .cache import GeometryCache, geometry_key
+from .factory import get_generator
+from .mesh import (
+    DEFAULT_ANGULAR_DEFLECTION,
+    DEFAULT_LINEAR_DEFLECTION,
+    MESH_VERSION,
+    Mesh,
+    tessellate,
+)
+
+# Nivel de detalle -> (desviación lineal en mm, desviación angular en rad)
+LOD_PRESETS: Dict[str, Tuple[float, float]] = {
+    "preview": (0.5, 0.8),
+    "standard": (DEFAULT_LINEAR_DEFLECTION, DEFAULT_ANGULAR_DEFLECTION),
+    "export": (0.01, 0.1),
+}
+
+
+def mesh_key(geometry_hash: str, linear_deflection: float, angular_deflection: float) -> str:
+    """Nombre de la entrada de una malla (sha256 de la clave completa)."""
+    payload = f"{geometry_hash}:{linear_deflection!r}:{angular_deflection!r}:{MESH_VERSION}"
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+
+class MeshCache(GeometryCache):
+    """Cache LRU de mallas con respaldo en disco mapeado en memoria.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directorio del nivel de disco.  ``None`` desactiva ese nivel.
+    memory_items:
+        Número máximo de mallas en memoria.
+    max_disk_bytes:
+        Tamaño total máximo de los archivos ``.mesh``.
+    lod_presets:
+        Niveles de detalle adicionales o que reemplazan a ``LOD_PRESETS``.
+
+    Las mallas devueltas se comparten entre llamadores y no deben
+    modificarse.
+    """
+
+    SUFFIX = ".mesh"
+
+    # magic, versión, vértices, índices (16 bytes: buffers alineados)
+    _HEADER = struct.Struct("<4sHxxII")
+    MAGIC = b"TFMS"
+    VERSION = 1
+    # Archivos más grandes que esto se mapean en vez de leerse completos
+    MMAP_MIN_BYTES = 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        memory_items: int = 64,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        lod_presets: Optional[Mapping[str, Tuple[float, float]]] = None,
+    ) -> None:
+        super().__init__(cache_dir, memory_items, max_disk_bytes)
+        self.lod_presets: Dict[str, Tuple[float, float]] = dict(LOD_PRESETS)
+        self.lod_presets.update(lod_presets or {})
+        # Archivo -> mapa abierto sobre él (solo mallas grandes)
+        self._maps: Dict[Path, mmap.mmap] = {}
+        self._maps_lock = threading.Lock()
+
+    def __reduce__(self):
+        return (type(self), (self.cache_dir, self.memory_items, self.max_disk_bytes,
+                             self.lod_presets))
+
+    # ------------------------------------------------------------------
+    def deflection(self, lod: str) -> Tuple[float, float]:
+        """Desviaciones ``(lineal, angular)`` de un nivel de detalle.
+
+        Raises
+        ------
+        ValueError
+            Si el nivel no existe.
+        """
+        try:
+            return self.lod_presets[lod]
+        except KeyError:
+            raise ValueError(
+                f"Nivel de detalle desconocido: {lod}. Niveles: {sorted(self.lod_presets)}"
+            )
+
+    def get_mesh(
+        self,
+        preset: Preset,
+        lod: str = "standard",
+        linear_deflection: Optional[float] = None,
+        angular_deflection: Optional[float] = None,
+    ) -> Mesh:
+        """Retorna la malla de ``preset``, teselándola solo si no está en cache.
+
+        Parameters
+        ----------
+        preset:
+            Preset del sólido.
+        lod:
+            Nivel de detalle (ver ``LOD_PRESETS``).
+        linear_deflection, angular_deflection:
+            Si se indican, reemplazan los valores del nivel de detalle.
+        """
+        linear, angular = self.deflection(lod)
+        if linear_deflection is not None:
+            linear = linear_deflection
+        if angular_deflection is not None:
+            angular = angular_deflection
+
+        generator = get_generator(preset)
+        geometry_hash = geometry_key(preset, type(generator).__name__, generator.VERSION)
+        key = mesh_key(geometry_hash, linear, angular)
+        mesh = self.get(key)
+        if mesh is None:
+            mesh = tessellate(preset, linear, angular)
+            self.put(key, mesh)
+        return mesh
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _copy(mesh: Mesh) -> Mesh:
+        # Buffers inmutables por contrato: no se copian
+        return mesh
+
+    def _encode(self, mesh: Mesh) -> bytes:
+        vertices, indices = mesh.vertices, mesh.indices
+        if sys.byteorder == "big":  # pragma: no cover - el formato es little-endian
+            vertices, indices = array("f", vertices), array("I", indices)
+            vertices.byteswap()
+            indices.byteswap()
+        header = self._HEADER.pack(self.MAGIC, self.VERSION, len(vertices), len(indices))
+        return header + bytes(vertices) + bytes(indices)
+
+    def _decode(self, path: Path) -> Mesh:
+        with path.open("rb") as fh:
+            if os.fstat(fh.fileno()).st_size <= self.MMAP_MIN_BYTES:
+                buffer = None
+                view = memoryview(fh.read())
+            else:
+                buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(buffer)
+        try:
+            mesh = self._mesh_from(view, path)
+        except ValueError:
+            if buffer is not None:
+                view.release()
+                buffer.close()
+            raise
+        if buffer is not None:
+            with self._maps_lock:
+                previous = self._maps.pop(path, None)
+                self._maps[path] = buffer
+            if previous is not None:
+                self._close_map(path, previous)
+        return mesh
+
+    def _mesh_from(self, view: memoryview, path: Path) -> Mesh:
+        try:
+            magic, version, n_vertices, n_indices = self._HEADER.unpack_from(view)
+        except struct.error as e:
+            raise ValueError(f"Encabezado de malla inválido: {e}")
+        start = self._HEADER.size
+        middle = start + 4 * n_vertices
+        end = middle + 4 * n_indices
+        if magic != self.MAGIC or version != self.VERSION or len(view) != end:
+            raise ValueError(f"Malla con formato o tamaño inválido: {path}")
+
+        vertices = view[start:middle].cast("f")
+        indices = view[middle:end].cast("I")
+        if sys.byteorder == "big":  # pragma: no cover
+            vertices, indices = array("f", vertices), array("I", indices)
+            vertices.byteswap()
+            indices.byteswap()
+        return Mesh(vertices, indices)
+
+    def _evicted(self, key: str) -> None:
+        # Sin la malla en memoria el mapa solo retendría el archivo abierto
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        with self._maps_lock:
+            buffer = self._maps.pop(path, None)
+        if buffer is not None:
+            self._close_map(path, buffer)
+
+    def _release(self, path: Path) -> None:
+        with self._maps_lock:
+            buffer = self._maps.pop(path, None)
+        if buffer is not None:
+            # Se suelta la malla en memoria solo si es la del mapa (``put``
+            # ya pudo haberla reemplazado por la nueva)
+            key = path.name[: -len(self.SUFFIX)]
+            with self._lock:
+                mesh = self._memory.get(key)
+                if mesh is not None and getattr(mesh.vertices, "obj", None) is buffer:
+                    del self._memory[key]
+                mesh = None
+            self._close_map(path, buffer)
+
+    def _close_map(self, path: Path, buffer: mmap.mmap) -> None:
+        try:
+            buffer.close()
+        except BufferError:
+            # Algún llamador aún usa la malla: el mapa se libera con ella
+            self.logger.debug(f"Malla mapeada aún en uso: {path}")
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Perfiles 2D DIN 32676 y construcción de sólidos por revolución.
+
+Cada componente se describe como un polígono cerrado en el plano
+radio/altura ``(r, z)`` que se revoluciona 360° alrededor del eje Z.  El
+perfil de cada componente es una función de Python (``PROFILES``) que
+recibe el preset y retorna los vértices; ``spreadsheet`` la llama con
+parámetros simbólicos para obtener las mismas cotas como expresiones.
+
+Un ``ProfileTemplate`` por (componente, estándar) conserva los segmentos
+``Part.LineSegment`` del contorno: para cada tamaño solo se mueven los
+extremos que cambian y se reutilizan las aristas de los segmentos que no
+cambiaron.  El módulo ``Part`` de FreeCAD se importa al construir el
+primer sólido, por lo que el cálculo de perfiles funciona sin FreeCAD.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..data.preset import COMPONENT_FIELDS, Preset
+
+# Punto del perfil: (radio, altura) en mm
+Point = Tuple[float, float]
+
+
+def ferrule_profile(p: Any) -> List[Point]:
+    """Férula: cara de apoyo en z=0 con ranura en V sobre C2, brida de
+    espesor ``height_profile_mm``, chaflán y tubo de soldadura."""
+    s = p.seat_lip_width_mm
+    return [
+        (p.passage_dia_mm / 2, 0),
+        (p.c2_mm / 2 - s, 0),
+        (p.c2_mm / 2, s),
+        (p.c2_mm / 2 + s, 0),
+        (p.flange_od_mm / 2, 0),
+        (p.flange_od_mm / 2, p.height_profile_mm),
+        (p.c2_mm / 2, p.height_profile_mm),
+        (p.tube_id_mm / 2 + s, 2 * p.height_profile_mm),
+        (p.tube_id_mm / 2 + s, p.height_tube_mm),
+        (p.passage_dia_mm / 2, p.height_tube_mm),
+    ]
+
+
+def gasket_profile(p: Any) -> List[Point]:
+    """Junta: anillo plano con un cordón en cada cara sobre BeadC2."""
+    s = p.seat_lip_width_mm
+    return [
+        (p.gasket_id_mm / 2, s),
+        (p.bead_c2_mm / 2 - s, s),
+        (p.bead_c2_mm / 2, 0),
+        (p.bead_c2_mm / 2 + s, s),
+        (p.gasket_od_mm / 2, s),
+        (p.gasket_od_mm / 2, p.profile_h_mm - s),
+        (p.bead_c2_mm / 2 + s, p.profile_h_mm - s),
+        (p.bead_c2_mm / 2, p.profile_h_mm),
+        (p.bead_c2_mm / 2 - s, p.profile_h_mm - s),
+        (p.gasket_id_mm / 2, p.profile_h_mm - s),
+    ]
+
+
+# Perfil de cada componente: preset (o parámetros simbólicos) -> vértices
+PROFILES: Dict[str, Callable[[Any], List[Point]]] = {
+    "ferrule": ferrule_profile,
+    "gasket": gasket_profile,
+}
+
+
+class ProfileTemplate:
+    """Plantilla de perfil reutilizable para un componente y estándar.
+
+    Parameters
+    ----------
+    component_type:
+        ``"ferrule"`` o ``"gasket"``.
+    standard:
+        Estándar al que pertenece la plantilla.
+    profile:
+        Función que calcula los vértices ``(r, z)`` (ver ``PROFILES``).
+    """
+
+    def __init__(
+        self,
+        component_type: str,
+        standard: str,
+        profile: Callable[[Any], List[Point]],
+    ) -> None:
+        if component_type not in COMPONENT_FIELDS:
+            raise ValueError(f"Tipo de componente inválido: {component_type}")
+        self.component_type = component_type
+        self.standard = standard
+        self.profile = profile
+        # Objetos FreeCAD reutilizados entre tamaños (ver build_solid)
+        self._freecad: Tuple[Any, Any] | None = None
+        self._axis: Tuple[Any, Any] | None = None
+        self._segments: List[Any] = []
+        self._edges: List[Any] = []
+        self._points: Optional[List[Point]] = None
+        self._lock = threading.Lock()
+
+    def dimension(self, preset: Preset) -> List[Point]:
+        """Calcula los vértices del perfil para un preset.
+
+        Raises
+        ------
+        ValueError
+            Si el preset no corresponde a la plantilla o el perfil
+            resultante no es un polígono simple con radios no negativos.
+        """
+        if preset.component_type != self.component_type:
+            raise ValueError(
+                f"La plantilla de {self.component_type} no admite presets de "
+                f"{preset.component_type}"
+            )
+        points = [(float(r), float(z)) for r, z in self.profile(preset)]
+        check_profile(points, preset.get_name())
+        return points
+
+    def build_solid(self, preset: Preset) -> Any:
+        """Construye el ``Part.Solid`` revolucionando el perfil 360° sobre Z.
+
+        El contorno es una lista de ``Part.LineSegment`` creada con el
+        primer tamaño.  En los siguientes solo se mueven los extremos que
+        cambiaron y solo esos segmentos generan una arista nueva.
+
+        Raises
+        ------
+        ImportError
+            Si FreeCAD no está disponible.
+        """
+        points = self.dimension(preset)
+        FreeCAD, Part = self._modules()
+        Vector = FreeCAD.Vector
+        count = len(points)
+        with self._lock:
+            if len(self._segments) != count:
+                self._segments = [Part.LineSegment() for _ in range(count)]
+                self._edges = [None] * count
+                self._points = [None] * count
+            previous = self._points
+            for i in range(count):
+                start, end = points[i], points[(i + 1) % count]
+                if self._edges[i] is None or (previous[i], previous[(i + 1) % count]) != (start, end):
+                    segment = self._segments[i]
+                    segment.StartPoint = Vector(start[0], 0.0, start[1])
+                    segment.EndPoint = Vector(end[0], 0.0, end[1])
+                    self._edges[i] = segment.toShape()
+            self._points = points
+            face = Part.Face(Part.Wire(list(self._edges)))
+        origin, axis = self._axis
+        return face.revolve(origin, axis, 360.0)
+
+    def _modules(self) -> Tuple[Any, Any]:
+        """Importa FreeCAD/Part una vez por plantilla."""
+        if self._freecad is None:
+            try:
+                import FreeCAD
+                import Part
+            except ImportError as e:
+                raise ImportError("build_solid requiere FreeCAD (módulo Part)") from e
+            self._freecad = (FreeCAD, Part)
+            self._axis = (FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1))
+        return self._freecad
+
+
+def check_profile(points: Sequence[Point], name: str = "perfil") -> None:
+    """Verifica que el perfil sea un polígono simple en el semiplano r >= 0.
+
+    Raises
+    ------
+    ValueError
+        Con la descripción del primer problema encontrado.
+    """
+    n = len(points)
+    if n < 3:
+        raise ValueError(f"{name}: el perfil necesita al menos 3 vértices")
+    for i, (r, _) in enumerate(points):
+        if r < 0:
+            raise ValueError(f"{name}: radio negativo en el vértice {i}")
+        if points[i] == points[(i + 1) % n]:
+            raise ValueError(f"{name}: vértices {i} y {(i + 1) % n} coinciden")
+
+    edges = [(points[i], points[(i + 1) % n]) for i in range(n)]
+    for i in range(n):
+        # Las aristas adyacentes comparten un vértice; se omiten
+        for j in range(i + 2, n - (1 if i == 0 else 0)):
+            if _segments_intersect(*edges[i], *edges[j]):
+                raise ValueError(f"{name}: las aristas {i} y {j} se cruzan")
+
+
+def _segments_intersect(a: Point, b: Point, c: Point, d: Point) -> bool:
+    """Indica si los segmentos ab y cd se tocan."""
+
+    def orientation(p: Point, q: Point, r: Point) -> float:
+        return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+    def on_segment(p: Point, q: Point, r: Point) -> bool:
+        return (min(p[0], q[0]) <= r[0] <= max(p[0], q[0])
+                and min(p[1], q[1]) <= r[1] <= max(p[1], q[1]))
+
+    d1, d2 = orientation(c, d, a), orientation(c, d, b)
+    d3, d4 = orientation(a, b, c), orientation(a, b, d)
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return True
+    return ((d1 == 0 and on_segment(c, d, a)) or (d2 == 0 and on_segment(c, d, b))
+            or (d3 == 0 and on_segment(a, b, c)) or (d4 == 0 and on_segment(a, b, d)))
+
+
+# Plantillas por (componente, estándar)
+_templates: Dict[Tuple[str, str], ProfileTemplate] = {}
+_templates_lock = threading.Lock()
+
+
+def get_profile_template(component_type: str, standard: str) -> ProfileTemplate:
+    """Retorna (creándola una vez) la plantilla de un componente y estándar.
+
+    Todos los estándares usan por ahora el perfil DIN 32676 de
+    ``PROFILES``; la clave incluye el estándar para poder especializarlo.
+    """
+    key = (component_type, standard)
+    template = _templates.get(key)
+    if template is None:
+        with _templates_lock:
+            template = _templates.get(key)
+            if template is None:
+                try:
+                    profile = PROFILES[component_type]
+                except KeyError:
+                    raise ValueError(f"Tipo de componente inválido: {component_type}")
+                template = ProfileTemplate(component_type, standard, profile)
+                _templates[key] = template
+    return template
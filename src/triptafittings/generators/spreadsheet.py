@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""Modelos paramétricos enlazados a una hoja de cálculo de FreeCAD.
+
+``SpreadsheetBinding`` crea, para un preset, una hoja ``Spreadsheet::Sheet``
+con un alias por parámetro, un croquis del perfil DIN 32676 cuyas cotas
+son expresiones sobre esos alias y una revolución ``Part::Revolution``.
+Cambiar de tamaño escribe solo las celdas que difieren entre los dos
+presets (``diff_presets``) y hace un único ``recompute`` incremental, en
+lugar de borrar y volver a crear los objetos del documento.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Tuple
+
+from ..data.preset import COMPONENT_FIELDS, Preset
+from .profiles import PROFILES, get_profile_template
+
+# Parámetros comunes al inicio de la hoja (el resto según el componente)
+_COMMON_PARAMETERS = ("Size", "DN", "Standard", "ComponentType")
+
+
+def parameter_layout(component_type: str) -> Dict[str, str]:
+    """Celda de cada parámetro en la hoja: alias -> ``"B<fila>"``.
+
+    La columna A contiene las etiquetas; la fila 1 es el encabezado.
+    """
+    aliases = _COMMON_PARAMETERS + tuple(c for c, _ in COMPONENT_FIELDS[component_type])
+    return {alias: f"B{row}" for row, alias in enumerate(aliases, start=2)}
+
+
+def diff_presets(old: Optional[Preset], new: Preset) -> Dict[str, Any]:
+    """Parámetros de ``new`` cuyo valor difiere del de ``old``.
+
+    Parameters
+    ----------
+    old:
+        Preset actual (``None`` = todos los parámetros cambian).
+    new:
+        Preset de destino.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parámetro -> nuevo valor, en el orden de ``get_parameters_dict``.
+    """
+    params = new.get_parameters_dict()
+    if old is None:
+        return params
+    previous = old.get_parameters_dict()
+    return {key: value for key, value in params.items() if previous.get(key) != value}
+
+
+def write_parameters(spreadsheet: Any, component_type: str, values: Mapping[str, Any]) -> None:
+    """Escribe parámetros en un diccionario o en una hoja de FreeCAD.
+
+    Los objetos tipo diccionario se actualizan con ``update``; en una hoja
+    ``Spreadsheet::Sheet`` se escribe cada celda con ``set``.
+    """
+    if isinstance(spreadsheet, MutableMapping):
+        spreadsheet.update(values)
+        return
+    layout = parameter_layout(component_type)
+    for alias, value in values.items():
+        spreadsheet.set(layout[alias], cell_content(value))
+
+
+def cell_content(value: Any) -> str:
+    """Contenido de celda: números tal cual, textos con prefijo ``'``."""
+    if isinstance(value, (int, float)):
+        return repr(float(value))
+    return f"'{value}"
+
+
+class _Expression:
+    """Expresión FreeCAD construida con los operadores de Python.
+
+    ``PROFILES`` se evalúa con estos objetos en lugar de números; cada
+    operación produce el texto de la expresión con los paréntesis mínimos.
+    """
+
+    # Precedencia de los operadores (mayor = liga más fuerte)
+    _PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2}
+    _ATOM = 3
+
+    def __init__(self, text: str, precedence: int = _ATOM) -> None:
+        self.text = text
+        self.precedence = precedence
+
+    @classmethod
+    def wrap(cls, value: Any) -> "_Expression":
+        if isinstance(value, _Expression):
+            return value
+        return cls(f"{value:g}" if isinstance(value, float) else str(value))
+
+    def _operand(self, precedence: int, right: bool) -> str:
+        # El operando derecho de - y / también necesita paréntesis si empata
+        if self.precedence < precedence or (right and self.precedence == precedence):
+            return f"({self.text})"
+        return self.text
+
+    def _binary(self, operator: str, left: Any, right: Any) -> "_Expression":
+        precedence = self._PRECEDENCE[operator]
+        left, right = self.wrap(left), self.wrap(right)
+        strict = operator in "-/"
+        return _Expression(
+            f"{left._operand(precedence, False)} {operator} {right._operand(precedence, strict)}",
+            precedence,
+        )
+
+    def __add__(self, other: Any) -> "_Expression":
+        return self._binary("+", self, other)
+
+    def __radd__(self, other: Any) -> "_Expression":
+        return self._binary("+", other, self)
+
+    def __sub__(self, other: Any) -> "_Expression":
+        return self._binary("-", self, other)
+
+    def __rsub__(self, other: Any) -> "_Expression":
+        return self._binary("-", other, self)
+
+    def __mul__(self, other: Any) -> "_Expression":
+        return self._binary("*", self, other)
+
+    def __rmul__(self, other: Any) -> "_Expression":
+        return self._binary("*", other, self)
+
+    def __truediv__(self, other: Any) -> "_Expression":
+        return self._binary("/", self, other)
+
+    def __rtruediv__(self, other: Any) -> "_Expression":
+        return self._binary("/", other, self)
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class _SheetParameters:
+    """Sustituto del preset cuyos atributos son referencias a la hoja."""
+
+    def __init__(self, component_type: str, sheet_name: str) -> None:
+        for column, attribute in COMPONENT_FIELDS[component_type]:
+            setattr(self, attribute, _Expression(f"{sheet_name}.{column}"))
+
+
+def profile_expressions(component_type: str, sheet_name: str) -> List[Tuple[str, str]]:
+    """Expresiones FreeCAD ``(r, z)`` de los vértices del perfil.
+
+    Evalúa la función de ``PROFILES`` con referencias a la hoja en lugar
+    de cotas, por ejemplo ``p.c2_mm / 2`` -> ``Params.C2_mm / 2``.
+    """
+    parameters = _SheetParameters(component_type, sheet_name)
+    return [
+        (str(_Expression.wrap(r)), str(_Expression.wrap(z)))
+        for r, z in PROFILES[component_type](parameters)
+    ]
+
+
+class SpreadsheetBinding:
+    """Modelo de FreeCAD cuyas cotas dependen de una hoja de parámetros.
+
+    Parameters
+    ----------
+    document:
+        Documento de FreeCAD que contiene los objetos.
+    sheet, sketch, solid:
+        Hoja de parámetros, croquis del perfil y revolución.
+    preset:
+        Preset escrito actualmente en la hoja.
+    """
+
+    def __init__(self, document: Any, sheet: Any, sketch: Any, solid: Any, preset: Preset) -> None:
+        self.document = document
+        self.sheet = sheet
+        self.sketch = sketch
+        self.solid = solid
+        self.preset = preset
+
+    @classmethod
+    def create(cls, document: Any, preset: Preset, name: Optional[str] = None) -> "SpreadsheetBinding":
+        """Crea hoja, croquis y revolución para ``preset`` (requiere FreeCAD).
+
+        El croquis se dibuja en el plano XZ: cada vértice del perfil tiene
+        restricciones ``DistanceX``/``DistanceY`` nombradas ``r<i>``/``z<i>``
+        cuyo valor es una expresión sobre los alias de la hoja.
+        """
+        import FreeCAD
+        import Part
+        import Sketcher
+
+        name = name or preset.get_name()
+        component = preset.component_type
+
+        sheet = document.addObject("Spreadsheet::Sheet", f"{name}_Params")
+        sheet.set("A1", "'Parámetro")
+        sheet.set("B1", "'Valor")
+        for alias, cell in parameter_layout(component).items():
+            sheet.set(f"A{cell[1:]}", f"'{alias}")
+            sheet.setAlias(cell, alias)
+        write_parameters(sheet, component, preset.get_parameters_dict())
+
+        sketch = document.addObject("Sketcher::SketchObject", f"{name}_Profile")
+        sketch.Placement = FreeCAD.Placement(
+            FreeCAD.Vector(0, 0, 0), FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
+        )
+        Vector = FreeCAD.Vector
+        template = get_profile_template(component, preset.standard)
+        # Valores iniciales; luego los fijan las expresiones
+        points = [Vector(r, z, 0) for r, z in template.dimension(preset)]
+        count = len(points)
+        for i in range(count):
+            sketch.addGeometry(Part.LineSegment(points[i], points[(i + 1) % count]), False)
+        for i in range(count):
+            sketch.addConstraint(Sketcher.Constraint("Coincident", i, 2, (i + 1) % count, 1))
+        for i, (r_expr, z_expr) in enumerate(profile_expressions(component, sheet.Name)):
+            for kind, prefix, expression, value in (
+                ("DistanceX", "r", r_expr, points[i].x),
+                ("DistanceY", "z", z_expr, points[i].y),
+            ):
+                constraint = f"{prefix}{i}"
+                index = sketch.addConstraint(Sketcher.Constraint(kind, -1, 1, i, 1, value))
+                sketch.renameConstraint(index, constraint)
+                sketch.setExpression(f"Constraints.{constraint}", expression)
+
+        solid = document.addObject("Part::Revolution", name)
+        solid.Source = sketch
+        solid.Base = Vector(0, 0, 0)
+        solid.Axis = Vector(0, 0, 1)
+        solid.Angle = 360.0
+        solid.Solid = True
+
+        document.recompute()
+        return cls(document, sheet, sketch, solid, preset)
+
+    def apply_preset(self, preset: Preset) -> Dict[str, Any]:
+        """Cambia el modelo a ``preset`` tocando solo las celdas que cambian.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parámetros escritos; vacío si el preset es equivalente y no se
+            recalculó el documento.
+
+        Raises
+        ------
+        ValueError
+            Si ``preset`` es de otro tipo de componente.
+        """
+        if preset.component_type != self.preset.component_type:
+            raise ValueError(
+                f"El modelo es de tipo {self.preset.component_type}, no {preset.component_type}"
+            )
+        changes = diff_presets(self.preset, preset)
+        if changes:
+            write_parameters(self.sheet, preset.component_type, changes)
+            self.document.recompute()
+        self.preset = preset
+        return changes
+
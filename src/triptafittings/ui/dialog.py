@@ -8,6 +8,7 @@ y validación visual.
 from __future__ import annotations
 
 import sys
+import threading
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
@@ -45,6 +46,8 @@ except ImportError:
                     pass
                 def addWidget(self, widget):
                     pass
+                def addLayout(self, layout):
+                    pass
             
             class QHBoxLayout:
                 def __init__(self, parent=None):
@@ -146,6 +149,10 @@ except ImportError:
                     pass
                 def setText(self, text):
                     self.text = text
+                def setPixmap(self, pixmap):
+                    self.pixmap = pixmap
+                def setMinimumSize(self, w, h):
+                    pass
             
             class QTextEdit:
                 def __init__(self):
@@ -208,6 +215,29 @@ except ImportError:
                 AlignCenter = 1
                 ItemIsEditable = 1
             
+            class QObject:
+                def __init__(self, parent=None):
+                    pass
+            
+            class QRunnable:
+                def __init__(self):
+                    pass
+                def setAutoDelete(self, auto_delete):
+                    pass
+            
+            class QThreadPool:
+                """Sin Qt las tareas se ejecutan de forma síncrona."""
+                _instance = None
+                @classmethod
+                def globalInstance(cls):
+                    if cls._instance is None:
+                        cls._instance = cls()
+                    return cls._instance
+                def start(self, runnable):
+                    runnable.run()
+                def waitForDone(self, msecs=-1):
+                    return True
+            
             class QDateTime:
                 @staticmethod
                 def currentDateTime():
@@ -226,14 +256,31 @@ except ImportError:
                 End = 1
                 def movePosition(self, pos):
                     pass
+            
+            class QPixmap:
+                def __init__(self):
+                    self.data = None
+                def loadFromData(self, data, fmt=None):
+                    self.data = bytes(data)
+                    return True
 
         class MockSignal:
+            """Señal mínima: al declararse en una clase se comporta como
+            descriptor y cada instancia obtiene su propia lista de slots."""
             def __init__(self, *args):
-                pass
+                self._slots = []
+            def __get__(self, obj, objtype=None):
+                if obj is None:
+                    return self
+                key = f"_signal_{id(self)}"
+                if key not in obj.__dict__:
+                    obj.__dict__[key] = MockSignal()
+                return obj.__dict__[key]
             def connect(self, func):
-                pass
+                self._slots.append(func)
             def emit(self, *args):
-                pass
+                for slot in list(self._slots):
+                    slot(*args)
 
         class MockHeader:
             def setStretchLastSection(self, stretch):
@@ -251,9 +298,102 @@ except ImportError:
 
         Signal = MockSignal
 
-from ..core.data_manager import DataManager
-from ..generators.ferrule import FerruleGenerator
-from ..generators.gasket import GasketGenerator
+from ..core.config import ConfigurationManager, get_shared_config
+from ..core.data_manager import get_shared_data_manager
+from ..core.export import export_models
+from ..data.preset import Preset
+from ..generators.factory import generate_geometry
+from .preview import DEFAULT_SIZE, PreviewCache, default_preview_dir, preview_key
+
+# Tamaños vecinos (a cada lado) cuya vista previa se dibuja por adelantado
+PREVIEW_NEIGHBORS = 2
+
+
+class GenerationSignals(QtCore.QObject):
+    """Señales emitidas por ``GenerationWorker``.
+
+    Se crean en el hilo de la GUI, por lo que Qt entrega las emisiones del
+    hilo trabajador mediante conexiones en cola a los slots del diálogo.
+    """
+    
+    progress = Signal(int, int)      # (completados, total)
+    model_ready = Signal(dict)
+    failed = Signal(str)
+    finished = Signal(bool)          # True si se canceló
+
+
+class GenerationWorker(QtCore.QRunnable):
+    """Tarea que genera uno o varios modelos fuera del hilo de la GUI."""
+    
+    def __init__(self, presets: List[Preset]):
+        super().__init__()
+        self.presets = list(presets)
+        self.signals = GenerationSignals()
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Solicita la cancelación; se respeta entre un modelo y el siguiente."""
+        self._cancel_event.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Indica si se solicitó la cancelación."""
+        return self._cancel_event.is_set()
+    
+    def run(self):
+        """Genera los modelos emitiendo progreso y resultados."""
+        total = len(self.presets)
+        for done, preset in enumerate(self.presets, start=1):
+            if self.cancelled:
+                break
+            try:
+                self.signals.model_ready.emit(generate_geometry(preset))
+            except Exception as e:
+                self.signals.failed.emit(f"{preset.get_name()}: {e}")
+            self.signals.progress.emit(done, total)
+        self.signals.finished.emit(self.cancelled)
+
+
+class PreviewSignals(QtCore.QObject):
+    """Señales emitidas por ``PreviewWorker``."""
+    
+    ready = Signal(str, object)      # (clave del preset, PNG en bytes)
+    failed = Signal(str)
+
+
+class PreviewWorker(QtCore.QRunnable):
+    """Dibuja vistas previas de corte fuera del hilo de la GUI.
+    
+    El primer preset es el seleccionado; los demás son los tamaños vecinos,
+    que se dibujan por adelantado para que pasar al tamaño siguiente o al
+    anterior sea inmediato.
+    """
+    
+    def __init__(self, presets: List[Preset], cache: PreviewCache,
+                 width: int = DEFAULT_SIZE[0], height: int = DEFAULT_SIZE[1]):
+        super().__init__()
+        self.presets = list(presets)
+        self.cache = cache
+        self.width = width
+        self.height = height
+        self.signals = PreviewSignals()
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Descarta los presets pendientes."""
+        self._cancel_event.set()
+    
+    def run(self):
+        """Dibuja (o lee del cache) cada preset y emite el PNG."""
+        for preset in self.presets:
+            if self._cancel_event.is_set():
+                break
+            try:
+                png = self.cache.get_png(preset, self.width, self.height)
+            except Exception as e:
+                self.signals.failed.emit(f"{preset.get_name()}: {e}")
+                continue
+            self.signals.ready.emit(preview_key(preset, self.width, self.height), png)
 
 
 class TriptaFittingsDialog(QtWidgets.QDialog):
@@ -267,19 +407,38 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
     model_generated = Signal(dict)
     error_occurred = Signal(str)
     
-    def __init__(self, parent=None, data_directory: Optional[str] = None):
+    def __init__(self, parent=None, data_directory: Optional[str] = None,
+                 preview_cache: Optional[PreviewCache] = None,
+                 config: Optional[ConfigurationManager] = None):
         """Inicializa el diálogo principal.
         
         Args:
             parent: Widget padre (usualmente FreeCAD main window)
             data_directory: Directorio personalizado para datos CSV
+            preview_cache: Cache de vistas previas (por defecto en disco,
+                en el directorio temporal del sistema)
+            config: Configuración del usuario (por defecto la compartida,
+                ver ``get_shared_config``)
         """
         super().__init__(parent)
         
-        # Inicializar gestor de datos
-        self.data_manager = DataManager(data_directory)
+        # Gestor de datos compartido (puede venir precargado por el workbench)
+        self.data_manager = get_shared_data_manager(data_directory)
         self.current_preset = None
         self.generated_models = []
+        self._size_dropdown_key = None
+        
+        # Generación en segundo plano (ver GenerationWorker)
+        self._thread_pool = QtCore.QThreadPool.globalInstance()
+        self._worker: Optional[GenerationWorker] = None
+        
+        # Vista previa del corte (ver PreviewWorker)
+        self.preview_cache = preview_cache or PreviewCache(default_preview_dir())
+        self._preview_worker: Optional[PreviewWorker] = None
+        self._preview_key: Optional[str] = None
+        
+        # Preferencias del usuario (se resuelven al primer uso)
+        self._config = config
         
         # Configurar ventana
         self.setWindowTitle("TriptaFittings Generator")
@@ -295,7 +454,7 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
     def _load_data(self):
         """Carga los datos de presets desde CSV."""
         try:
-            success = self.data_manager.load_all_data()
+            success = self.data_manager.ensure_loaded()
             if not success:
                 self._show_error("Error al cargar datos de presets")
         except Exception as e:
@@ -382,7 +541,15 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
         self.params_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.params_table.setMaximumHeight(200)
         
-        layout.addWidget(self.params_table)
+        # Vista previa 2D del corte, al lado de la tabla
+        self.preview_label = QtWidgets.QLabel("Sin vista previa")
+        self.preview_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.preview_label.setMinimumSize(*DEFAULT_SIZE)
+        
+        row = QtWidgets.QHBoxLayout()
+        row.addWidget(self.params_table)
+        row.addWidget(self.preview_label)
+        layout.addLayout(row)
         
         return group
     
@@ -456,9 +623,19 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
             }
         """)
         
+        # Generación de todos los tamaños del componente
+        self.generate_all_btn = QtWidgets.QPushButton("Generate All Sizes")
+        self.generate_all_btn.setEnabled(False)
+        
+        # Cancelación de la generación en curso
+        self.cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.cancel_btn.setEnabled(False)
+        
         layout.addWidget(self.preview_btn)
         layout.addWidget(self.validate_btn)
         layout.addStretch()
+        layout.addWidget(self.cancel_btn)
+        layout.addWidget(self.generate_all_btn)
         layout.addWidget(self.generate_btn)
         
         return group
@@ -506,6 +683,8 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
         self.component_combo.currentTextChanged.connect(self._on_component_changed)
         self.size_combo.currentTextChanged.connect(self._on_size_changed)
         self.generate_btn.clicked.connect(self._generate_model)
+        self.generate_all_btn.clicked.connect(self.generate_all_sizes)
+        self.cancel_btn.clicked.connect(self.cancel_generation)
         self.preview_btn.clicked.connect(self._preview_parameters)
         self.validate_btn.clicked.connect(self._validate_selection)
     
@@ -513,6 +692,13 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
         """Actualiza el dropdown de tamaños según el componente seleccionado."""
         component = self.component_combo.currentText().lower()
         sizes = self.data_manager.get_available_sizes(component)
+        self.generate_all_btn.setEnabled(bool(sizes) and not self.is_generating())
+        
+        # Evitar repoblar el dropdown si ni el componente ni los datos cambiaron
+        dropdown_key = (self.data_manager.generation, component)
+        if dropdown_key == self._size_dropdown_key and self.size_combo.count() == len(sizes):
+            return
+        self._size_dropdown_key = dropdown_key
         
         # Limpiar y llenar dropdown
         self.size_combo.clear()
@@ -534,6 +720,7 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
         if self.size_combo.currentData() is not None:
             self._load_preset()
             self._update_parameters_table()
+            self._update_preview()
             self._validate_selection()
     
     def _load_preset(self):
@@ -579,6 +766,60 @@ class TriptaFittingsDialog(QtWidgets.QDialog):
         """Limpia la tabla de parámetros."""
         self.params_table.setRowCount(0)
         self.dn_label.setText("--")
+        self._preview_key = None
+        self.preview_label.setText("Sin vista previa")
+    
+    def _update_preview(self):
+        """Muestra el corte del preset actual.
+        
+        Si el PNG está en memoria se muestra de inmediato; si no, se dibuja
+        en el pool de hilos.  También se dibujan por adelantado los
+        ``PREVIEW_NEIGHBORS`` tamaños vecinos de cada lado; lo pendiente de
+        la selección anterior se cancela.
+        """
+        if self._preview_worker is not None:
+            self._preview_worker.cancel()
+            self._preview_worker = None
+        if not self.current_preset:
+            return
+        width, height = DEFAULT_SIZE
+        self._preview_key = preview_key(self.current_preset, width, height)
+        png = self.preview_cache.peek_png(self.current_preset, width, height)
+        pending = []
+        if png is not None:
+            self._show_preview(png)
+        else:
+            pending.append(self.current_preset)
+        
+        index = self.data_manager.get_sorted_index(self.current_preset.component_type)
+        if index is not None:
+            pending.extend(
+                p for p in index.neighbors(self.current_preset.size, PREVIEW_NEIGHBORS)
+                if p.standard == self.current_preset.standard
+                and self.preview_cache.peek_png(p, width, height) is None
+            )
+        if not pending:
+            return
+        worker = PreviewWorker(pending, self.preview_cache, width, height)
+        worker.signals.ready.connect(self._on_preview_ready)
+        worker.signals.failed.connect(self._on_preview_failed)
+        self._preview_worker = worker
+        self._thread_pool.start(worker)
+    
+    def _on_preview_ready(self, key: str, png: bytes):
+        """Muestra el PNG si corresponde al preset seleccionado."""
+        if key == self._preview_key:
+            self._show_preview(png)
+    
+    def _on_preview_failed(self, message: str):
+        """Informa un error al dibujar la vista previa."""
+        self._log_status(f"Vista previa no disponible: {message}", "warning")
+    
+    def _show_preview(self, png: bytes):
+        """Carga el PNG en la etiqueta de vista previa."""
+        pixmap = QtGui.QPixmap()
+        if pixmap.loadFromData(png, "PNG"):
+            self.preview_label.setPixmap(pixmap)
     
     def _preview_parameters(self):
         """Muestra un preview de los parámetros actuales."""
@@ -596,14 +837,11 @@ DN: {self.current_preset.dn}
 
 Parámetros principales:
 """
-        params = self.current_preset.get_parameters_dict()
-        for param, value in list(params.items())[:5]:  # Mostrar solo los primeros 5
+        for param, value in self.current_preset.get_parameters_dict().items():
             preview_text += f"  • {param}: {value}\n"
         
-        if len(params) > 5:
-            preview_text += f"  ... y {len(params) - 5} parámetros más"
-        
         self._log_status(preview_text.strip())
+        self._update_preview()
     
     def _validate_selection(self):
         """Valida la selección actual."""
@@ -636,48 +874,108 @@ Parámetros principales:
             self._log_status("✅ Selección válida. Listo para generar.", "success")
     
     def _generate_model(self):
-        """Genera el modelo 3D."""
+        """Genera el modelo 3D del preset seleccionado en segundo plano."""
         if not self.current_preset:
             self._show_error("No hay preset seleccionado")
             return
         
-        try:
-            self._set_progress(True)
-            component = self.component_combo.currentText().lower()
-            
-            # Generar usando el generador correspondiente
-            if component == "ferrule":
-                generator = FerruleGenerator(self.current_preset)
-            else:
-                generator = GasketGenerator(self.current_preset)
-            
-            # Generar geometría
-            model = generator.generate_geometry()
-            
-            # Registrar modelo generado
-            self.generated_models.append(model)
-            
-            # Emitir señal para FreeCAD
-            self.model_generated.emit(model)
-            
-            self._log_status(f"✅ Modelo generado exitosamente: {model['name']}", "success")
-            
-        except Exception as e:
-            error_msg = f"Error al generar modelo: {str(e)}"
-            self._log_status(f"❌ {error_msg}", "error")
-            self.error_occurred.emit(error_msg)
-        finally:
-            self._set_progress(False)
+        self.generate_models([self.current_preset])
     
-    def _set_progress(self, active: bool):
+    def generate_all_sizes(self):
+        """Genera en segundo plano todos los tamaños del componente actual."""
+        component = self.component_combo.currentText().lower()
+        presets = self.data_manager.get_presets_by_type(component)
+        if not presets:
+            self._show_warning(f"No hay presets disponibles para {component}")
+            return
+        
+        self.generate_models(presets)
+    
+    def generate_models(self, presets: List[Preset]) -> bool:
+        """Inicia la generación de ``presets`` sin bloquear la GUI.
+        
+        Cada modelo se entrega por la señal ``model_generated`` a medida
+        que se genera; los errores por ``error_occurred``.
+        
+        Returns:
+            ``False`` si ya había una generación en curso
+        """
+        if self.is_generating():
+            self._log_status("Ya hay una generación en curso", "warning")
+            return False
+        
+        worker = GenerationWorker(presets)
+        worker.signals.progress.connect(self._on_generation_progress)
+        worker.signals.model_ready.connect(self._on_model_ready)
+        worker.signals.failed.connect(self._on_generation_failed)
+        worker.signals.finished.connect(self._on_generation_finished)
+        self._worker = worker
+        
+        self._set_busy(True, len(presets))
+        self._log_status(f"Generando {len(presets)} modelo(s)...")
+        self._thread_pool.start(worker)
+        return True
+    
+    def is_generating(self) -> bool:
+        """Indica si hay una generación en curso."""
+        return self._worker is not None
+    
+    def cancel_generation(self):
+        """Cancela la generación en curso tras el modelo actual."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self._log_status("Cancelando generación...", "warning")
+    
+    def _on_generation_progress(self, done: int, total: int):
+        """Actualiza la barra de progreso."""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+    
+    def _on_model_ready(self, model: Dict[str, Any]):
+        """Registra un modelo generado y lo reenvía a FreeCAD."""
+        self.generated_models.append(model)
+        self.model_generated.emit(model)
+        self._log_status(f"✅ Modelo generado exitosamente: {model['name']}", "success")
+    
+    def _on_generation_failed(self, message: str):
+        """Informa el error de un modelo sin detener el resto."""
+        error_msg = f"Error al generar modelo: {message}"
+        self._log_status(f"❌ {error_msg}", "error")
+        self.error_occurred.emit(error_msg)
+    
+    def _on_generation_finished(self, cancelled: bool):
+        """Restablece la interfaz al terminar la generación."""
+        self._worker = None
+        self._set_busy(False)
+        if cancelled:
+            self._log_status("Generación cancelada", "warning")
+    
+    def _set_busy(self, busy: bool, total: int = 0):
+        """Habilita/deshabilita las acciones durante la generación."""
+        self.generate_btn.setEnabled(not busy and self.current_preset is not None)
+        self.generate_all_btn.setEnabled(not busy and self.size_combo.count() > 0)
+        self.cancel_btn.setEnabled(busy)
+        self._set_progress(busy, total)
+    
+    def _set_progress(self, active: bool, total: int = 0):
         """Controla la visualización del progreso."""
         self.progress_bar.setVisible(active)
         if active:
-            self.progress_bar.setRange(0, 0)  # Progreso indefinido
+            # Sin total conocido el progreso es indefinido
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(0)
         else:
             self.progress_bar.setRange(0, 1)
             self.progress_bar.setValue(1)
     
+    def reject(self):
+        """Cierra el diálogo cancelando la generación en curso."""
+        self.cancel_generation()
+        if self._preview_worker is not None:
+            self._preview_worker.cancel()
+        super().reject()
+    
     def _log_status(self, message: str, level: str = "info"):
         """Registra un mensaje en el área de estado."""
         timestamp = QtCore.QDateTime.currentDateTime().toString("hh:mm:ss")
@@ -717,7 +1015,7 @@ Parámetros principales:
 
 <h4>Funciones adicionales:</h4>
 <ul>
-<li><b>Preview Parameters:</b> Muestra un resumen de los parámetros</li>
+<li><b>Preview Parameters:</b> Lista los parámetros y actualiza el corte 2D</li>
 <li><b>Validate:</b> Verifica que la selección sea válida</li>
 <li><b>Tabla de Parámetros:</b> Puedes editar valores antes de generar</li>
 </ul>
@@ -728,6 +1026,36 @@ Parámetros principales:
         
         QtWidgets.QMessageBox.information(self, "Ayuda", help_text)
     
+    @property
+    def config(self) -> ConfigurationManager:
+        """Configuración compartida de la que se leen las preferencias."""
+        if self._config is None:
+            self._config = get_shared_config()
+        return self._config
+    
+    def export_generated_models(self, output_dir: str,
+                                formats: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Exporta los modelos generados en esta sesión.
+        
+        Args:
+            output_dir: Directorio de salida
+            formats: Formatos a escribir (por defecto ``export_formats`` de
+                la configuración del usuario)
+            
+        Returns:
+            Manifiesto de la exportación (ver ``core.export.export_models``)
+        """
+        if formats is None:
+            formats = self.config.get_setting(
+                "export_formats", ConfigurationManager.DEFAULT_CONFIG["export_formats"])
+        manifest = export_models(self.generated_models, output_dir, formats)
+        self._log_status(f"{manifest['written']} archivos exportados a {output_dir} "
+                         f"({', '.join(manifest['formats'])})")
+        for failure in manifest["failures"]:
+            self._log_status(f"No se exportó {failure['name']} ({failure['format']}): "
+                             f"{failure['error']}", "warning")
+        return manifest
+    
     def get_generated_models(self) -> List[Dict[str, Any]]:
         """Retorna la lista de modelos generados en esta sesión."""
         return self.generated_models.copy()
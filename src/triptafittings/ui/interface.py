@@ -7,12 +7,16 @@ Esta interfaz de texto permite a los usuarios consultar los presets
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-
-from ..core.data_manager import DataManager
-from ..generators.ferrule import FerruleGenerator
-from ..generators.gasket import GasketGenerator
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..core.batch import GenerationRequest, GenerationResult, run_batch
+from ..core.config import ConfigurationManager, get_shared_config
+from ..core.data_manager import DataManager, get_shared_data_manager
+from ..core.export import export_models
+from ..generators.cache import GeometryCache
+from ..generators.factory import GENERATORS, generate_geometry
 from ..core.model_manager import ModelManager
+from ..core.model_registry import ModelRegistry
 
 
 class UserInterface:
@@ -24,12 +28,36 @@ class UserInterface:
     **Sprint 3** sin depender de FreeCAD.
     """
 
-    def __init__(self, data_directory: Optional[str] = None) -> None:
-        self._manager = DataManager(data_directory)
-        # Gestor de modelos generados en la sesión
-        self._models = ModelManager()
-        # Cargar todos los datos al inicializar la interfaz.
-        self._manager.load_all_data()
+    def __init__(
+        self,
+        data_directory: Optional[str] = None,
+        data_manager: Optional[DataManager] = None,
+        geometry_cache: Optional[GeometryCache] = None,
+        model_registry: Optional[ModelRegistry] = None,
+        config: Optional[ConfigurationManager] = None,
+    ) -> None:
+        # El catálogo se carga en la primera consulta (ver
+        # ``DataManager.ensure_loaded``), no al construir la interfaz.
+        self._manager = data_manager or get_shared_data_manager(data_directory)
+        # Gestor de modelos generados en la sesión (persistente si se
+        # indica un ``ModelRegistry``)
+        self._models = ModelManager(model_registry)
+        # Cache de geometría opcional (evita regenerar presets conocidos)
+        self._geometry_cache = geometry_cache
+        # Configuración del usuario (por defecto la compartida, al primer uso)
+        self._config = config
+
+    @property
+    def config(self) -> ConfigurationManager:
+        """Configuración de la que se leen las preferencias del usuario."""
+        if self._config is None:
+            self._config = get_shared_config()
+        return self._config
+
+    @property
+    def data_manager(self) -> DataManager:
+        """Gestor de datos utilizado por la interfaz."""
+        return self._manager
 
     def list_available_sizes(self, component: str | None = None) -> List[float]:
         """Retorna los tamaños disponibles para el componente indicado."""
@@ -64,22 +92,115 @@ class UserInterface:
             )
 
         kind = component.lower()
-        if kind == "ferrule":
-            generator = FerruleGenerator(preset)
-        elif kind == "gasket":
-            generator = GasketGenerator(preset)
-        else:  # pragma: no cover - validación redundante
+        if kind not in GENERATORS:  # pragma: no cover - validación redundante
             raise ValueError(f"Tipo de componente inválido: {component}")
 
-        model = generator.generate_geometry()
+        model = generate_geometry(preset, self._geometry_cache)
         # Registrar modelo generado para su gestión posterior
         self._models.add_model(model)
         return model
 
+    def iter_generate_models(
+        self,
+        requests: Iterable[GenerationRequest],
+        workers: Optional[int] = None,
+        use_processes: bool = False,
+    ) -> Iterator[GenerationResult]:
+        """Genera varios modelos entregando cada resultado al terminar.
+
+        Los modelos generados se registran en bloque en el gestor de
+        modelos cuando termina (o se abandona) la iteración.
+
+        Parameters
+        ----------
+        requests:
+            Pares ``(componente, tamaño)``.
+        workers:
+            Número de trabajadores del pool (``1`` = secuencial).
+        use_processes:
+            Usa un pool de procesos en lugar de hilos.
+
+        Yields
+        ------
+        GenerationResult
+            Un resultado por solicitud, en orden de finalización.  Las
+            solicitudes sin preset se reportan como fallos sin llegar al pool.
+        """
+        jobs = []
+        failures = []
+        for index, (component, size) in enumerate(requests):
+            request = (component, size)
+            preset = None
+            if component.lower() in GENERATORS:
+                preset = self._manager.get_preset_by_size(component, size)
+            if preset is None:
+                failures.append(GenerationResult(
+                    index, request,
+                    error=f"No se encontró preset para {component} con tamaño {size}",
+                ))
+            else:
+                jobs.append((index, request, preset))
+
+        generated: List[Dict[str, Any]] = []
+        try:
+            yield from failures
+            for result in run_batch(jobs, workers, use_processes, self._geometry_cache):
+                if result.ok:
+                    generated.append(result.model)
+                yield result
+        finally:
+            self._models.add_models(generated)
+
+    def generate_models(
+        self,
+        requests: Iterable[GenerationRequest],
+        workers: Optional[int] = None,
+        use_processes: bool = False,
+    ) -> Dict[str, Any]:
+        """Genera un lote de modelos sin abortar ante fallos individuales.
+
+        Parameters
+        ----------
+        requests:
+            Pares ``(componente, tamaño)``.
+        workers:
+            Número de trabajadores del pool (``1`` = secuencial).
+        use_processes:
+            Usa un pool de procesos en lugar de hilos.
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``models`` con los modelos generados y ``failures`` con
+            ``{"component", "size", "error"}`` por cada fallo, ambos en el
+            orden de las solicitudes.
+        """
+        results = sorted(
+            self.iter_generate_models(requests, workers, use_processes),
+            key=lambda result: result.index,
+        )
+        return {
+            "models": [r.model for r in results if r.ok],
+            "failures": [
+                {"component": r.request[0], "size": r.request[1], "error": r.error}
+                for r in results if not r.ok
+            ],
+            "total": len(results),
+        }
+
     # --- Gestión de modelos -------------------------------------------------
-    def list_generated_models(self, component: str | None = None) -> List[Dict[str, Any]]:
-        """Retorna los modelos generados en la sesión actual."""
-        return self._models.list_models(component)
+    def list_generated_models(
+        self,
+        component: str | None = None,
+        size: float | None = None,
+        dn: str | None = None,
+        standard: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Retorna los modelos generados en la sesión actual.
+
+        Los filtros opcionales se resuelven con los índices de ``ModelManager``.
+        """
+        return self._models.list_models(component, size=size, dn=dn, standard=standard)
 
     def remove_model(self, name: str) -> bool:
         """Elimina un modelo por nombre."""
@@ -88,3 +209,40 @@ class UserInterface:
     def clear_models(self, component: str | None = None) -> None:
         """Elimina todos los modelos o solo los del componente indicado."""
         self._models.clear(component)
+
+    # --- Exportación ----------------------------------------------------------
+    def export_models(
+        self,
+        output_dir: str,
+        formats: Iterable[str] | None = None,
+        component: str | None = None,
+        workers: Optional[int] = None,
+        use_processes: bool = False,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Exporta los modelos generados a STEP, STL y/o DXF.
+
+        Parameters
+        ----------
+        output_dir:
+            Directorio de salida.
+        formats:
+            Formatos a escribir; por defecto ``export_formats`` de la
+            configuración del usuario (``config``).
+        component:
+            Exporta solo los modelos de ese componente.
+        workers, use_processes, force:
+            Ver ``core.export.export_models``.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Manifiesto de la exportación.
+        """
+        if formats is None:
+            formats = self.config.get_setting(
+                "export_formats", ConfigurationManager.DEFAULT_CONFIG["export_formats"])
+        return export_models(
+            self._models.list_models(component), output_dir, formats,
+            workers=workers, use_processes=use_processes, force=force,
+        )
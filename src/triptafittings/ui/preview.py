@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Vista previa 2D del corte transversal de un preset.
+
+Dibuja el perfil ``(r, z)`` de ``generators.profiles`` a ambos lados del
+eje (corte por un plano que contiene el eje Z), con rayado de sección y
+línea de eje, y lo codifica como PNG.  Se usa ``QImage``/``QPainter``,
+que a diferencia de ``QPixmap`` pueden usarse fuera del hilo de la GUI.
+
+``PreviewCache`` guarda los PNG por hash del preset en memoria y en disco,
+de modo que recorrer los tamaños en el diálogo no vuelve a dibujar nada.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+try:
+    from PySide2 import QtCore, QtGui
+    QT_AVAILABLE = True
+except ImportError:
+    try:
+        from PyQt5 import QtCore, QtGui
+        QT_AVAILABLE = True
+    except ImportError:
+        # Sin Qt no se dibuja; el cache sigue sirviendo PNG ya guardados
+        QT_AVAILABLE = False
+
+from ..data.preset import Preset
+from ..data.preset_cache import user_cache_root
+from ..generators.cache import GeometryCache, geometry_key
+from ..generators.profiles import Point, get_profile_template
+
+# Cambiarla invalida los PNG en cache
+PREVIEW_VERSION = "2"
+
+DEFAULT_SIZE = (320, 200)
+
+Color = Tuple[int, int, int]
+BACKGROUND: Color = (255, 255, 255)
+SECTION_FILL: Color = (207, 224, 242)
+HATCH: Color = (90, 125, 170)
+OUTLINE: Color = (20, 40, 80)
+AXIS: Color = (200, 60, 60)
+
+_MARGIN = 12
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def preview_key(preset: Preset, width: int, height: int) -> str:
+    """Clave de cache del PNG de ``preset`` con un tamaño de imagen."""
+    return geometry_key(preset, f"SectionPreview{width}x{height}", PREVIEW_VERSION)
+
+
+def section_polygons(preset: Preset) -> List[List[Point]]:
+    """Polígonos del corte en coordenadas ``(x, z)``: perfil y su reflejo."""
+    points = get_profile_template(preset.component_type, preset.standard).dimension(preset)
+    return [points, [(-r, z) for r, z in points]]
+
+
+def render_section(preset: Preset, width: int = DEFAULT_SIZE[0],
+                   height: int = DEFAULT_SIZE[1]) -> bytes:
+    """Dibuja el corte de ``preset`` y lo retorna como PNG.
+
+    Raises
+    ------
+    ValueError
+        Si la imagen es demasiado pequeña o el perfil es inválido.
+    ImportError
+        Si Qt no está disponible.
+    """
+    if width <= 2 * _MARGIN or height <= 2 * _MARGIN:
+        raise ValueError(f"Imagen demasiado pequeña: {width}x{height}")
+    polygons = section_polygons(preset)
+    if not QT_AVAILABLE:
+        raise ImportError("render_section requiere Qt (PySide2 o PyQt5)")
+    r_max = max(r for r, _ in polygons[0])
+    z_min = min(z for _, z in polygons[0])
+    z_max = max(z for _, z in polygons[0])
+    scale = min((width - 2 * _MARGIN) / (2 * r_max),
+                (height - 2 * _MARGIN) / max(z_max - z_min, 1e-9))
+    z_mid = (z_min + z_max) / 2
+
+    def to_pixels(polygon: Sequence[Point]) -> QtGui.QPolygonF:
+        return QtGui.QPolygonF([
+            QtCore.QPointF(width / 2 + x * scale, height / 2 - (z - z_mid) * scale)
+            for x, z in polygon
+        ])
+
+    section = QtGui.QPainterPath()
+    for polygon in polygons:
+        section.addPolygon(to_pixels(polygon))
+        section.closeSubpath()
+
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB32)
+    image.fill(QtGui.QColor(*BACKGROUND))
+    painter = QtGui.QPainter(image)
+    try:
+        # Relleno con rayado a 45° (convención de sección) y contorno
+        painter.fillPath(section, QtGui.QColor(*SECTION_FILL))
+        painter.fillPath(section, QtGui.QBrush(QtGui.QColor(*HATCH), QtCore.Qt.BDiagPattern))
+        painter.setPen(QtGui.QPen(QtGui.QColor(*OUTLINE), 0))
+        painter.drawPath(section)
+        # Eje de revolución (trazo y punto)
+        axis_pen = QtGui.QPen(QtGui.QColor(*AXIS), 0)
+        axis_pen.setStyle(QtCore.Qt.DashDotLine)
+        painter.setPen(axis_pen)
+        painter.drawLine(width // 2, 0, width // 2, height - 1)
+    finally:
+        painter.end()
+
+    buffer = QtCore.QBuffer()
+    buffer.open(QtCore.QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+
+def default_preview_dir() -> Path:
+    """Directorio de disco por defecto de las vistas previas.
+
+    Está en el cache del usuario, junto a las instantáneas de presets: el
+    directorio temporal es compartido en equipos multiusuario.
+    """
+    return user_cache_root() / "previews"
+
+
+class PreviewCache(GeometryCache):
+    """Cache de PNG de vistas previas en memoria y en disco.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directorio del nivel de disco.  ``None`` desactiva ese nivel.
+    memory_items:
+        Número máximo de imágenes en memoria.
+    max_disk_bytes:
+        Tamaño total máximo de los archivos ``.png``.
+    """
+
+    SUFFIX = ".png"
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        memory_items: int = 128,
+        max_disk_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        super().__init__(cache_dir, memory_items, max_disk_bytes)
+
+    def get_png(self, preset: Preset, width: int = DEFAULT_SIZE[0],
+                height: int = DEFAULT_SIZE[1]) -> bytes:
+        """PNG del corte de ``preset``, dibujándolo solo si no está en cache."""
+        key = preview_key(preset, width, height)
+        png = self.get(key)
+        if png is None:
+            png = render_section(preset, width, height)
+            self.put(key, png)
+        return png
+
+    def peek_png(self, preset: Preset, width: int = DEFAULT_SIZE[0],
+                 height: int = DEFAULT_SIZE[1]) -> bytes | None:
+        """PNG en memoria, sin tocar el disco ni dibujar (para el hilo de la GUI)."""
+        key = preview_key(preset, width, height)
+        with self._lock:
+            png = self._memory.get(key)
+            if png is not None:
+                self._memory.move_to_end(key)
+        return png
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _copy(png: bytes) -> bytes:
+        return png
+
+    def _encode(self, png: bytes) -> bytes:
+        return png
+
+    def _decode(self, path: Path) -> bytes:
+        data = path.read_bytes()
+        if not data.startswith(_PNG_SIGNATURE):
+            raise ValueError(f"PNG inválido: {path}")
+        return data
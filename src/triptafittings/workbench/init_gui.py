@@ -12,6 +12,7 @@ from typing import List
 
 from .gui import WB_ICON, list_toolbar_commands
 from .commands import COMMANDS
+from ..core.data_manager import get_shared_data_manager
 
 # Importar Gui.Workbench si está disponible
 try:
@@ -88,8 +89,16 @@ class TriptaFittingsWorkbench(WorkbenchBase):
             print("Error al inicializar workbench:", str(e))
 
     def Activated(self) -> None:
-        """Se llama cuando el workbench se activa en FreeCAD."""
+        """Se llama cuando el workbench se activa en FreeCAD.
+
+        Precarga el catálogo de presets en segundo plano para que el primer
+        uso de un comando no espere al parseo de los CSV.
+        """
         print("TriptaFittings workbench activado")
+        try:
+            get_shared_data_manager().warm_up(background=True)
+        except Exception as e:
+            print("Error al precargar presets:", str(e))
 
     def Deactivated(self) -> None:
         """Se llama cuando el workbench se desactiva."""
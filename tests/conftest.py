@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Configuración común de pytest."""
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_user_directories = pytest.MonkeyPatch()
+
+
+def pytest_configure(config):
+    """Redirige los directorios de cache y configuración del usuario.
+
+    Los tests no deben dejar archivos en los directorios reales del
+    usuario (por ejemplo las instantáneas de ``PresetCache``).  Se hace
+    antes de la colección porque algunos módulos cargan presets al
+    importarse.
+    """
+    home = Path(tempfile.mkdtemp(prefix="triptafittings-home-"))
+    config._user_home = home
+    for variable in ("HOME", "USERPROFILE"):
+        _user_directories.setenv(variable, str(home))
+    _user_directories.setenv("XDG_CACHE_HOME", str(home / ".cache"))
+    _user_directories.setenv("XDG_CONFIG_HOME", str(home / ".config"))
+    _user_directories.setenv("LOCALAPPDATA", str(home / "AppData" / "Local"))
+    _user_directories.setenv("APPDATA", str(home / "AppData" / "Roaming"))
+
+
+def pytest_unconfigure(config):
+    _user_directories.undo()
+    shutil.rmtree(config._user_home, ignore_errors=True)
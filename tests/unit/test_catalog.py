@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitarios para el registro de catálogos por estándar
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.data.catalog import CatalogRegistry
+from triptafittings.data.csv_loader import CSVLoader
+
+PRESETS_DIR = Path(__file__).resolve().parents[2] / 'src' / 'triptafittings' / 'data' / 'presets'
+
+
+class TestCatalogRegistry(unittest.TestCase):
+    """Tests para CatalogRegistry con dos estándares"""
+
+    def setUp(self):
+        """Copia los presets reales y agrega un catálogo ISO 2852"""
+        self.test_dir = tempfile.mkdtemp()
+        presets = Path(self.test_dir) / 'presets'
+        shutil.copytree(PRESETS_DIR, presets, ignore=shutil.ignore_patterns('*.cache'))
+
+        source = (presets / 'ferrule_din32676A_1p5_to_12in.csv').read_text(encoding='utf-8')
+        (presets / 'iso').mkdir()
+        (presets / 'iso' / 'ferrule_iso2852.csv').write_text(
+            source.replace('DIN 32676 A', 'ISO 2852'), encoding='utf-8')
+
+        manifest = json.loads((presets / 'manifest.json').read_text(encoding='utf-8'))
+        manifest['catalogs'].append({'standard': 'ISO 2852', 'component': 'ferrule',
+                                     'file': 'iso/ferrule_iso2852.csv'})
+        (presets / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+
+        self.loader = CSVLoader(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_manifest_discovery_does_not_load(self):
+        """Leer el manifiesto no parsea ningún CSV"""
+        with patch.object(CSVLoader, 'load_file', side_effect=AssertionError("carga")):
+            registry = CatalogRegistry(self.loader)
+            self.assertEqual(registry.standards(), ['DIN 32676 A', 'ISO 2852'])
+            self.assertEqual(registry.components('ISO 2852'), ['ferrule'])
+
+    def test_standard_loaded_on_first_query(self):
+        """Solo se cargan los archivos del estándar consultado"""
+        registry = CatalogRegistry(self.loader)
+        with patch.object(CSVLoader, 'load_file', wraps=self.loader.load_file) as load_file:
+            preset = registry.get_preset('ISO 2852', 'ferrule', 3)
+            registry.get_presets('ISO 2852', 'ferrule')
+
+        self.assertEqual(preset.standard, 'ISO 2852')
+        self.assertEqual(preset.dn, 'DN80')
+        self.assertEqual(load_file.call_count, 1)
+        self.assertTrue(registry.is_loaded('ISO 2852'))
+        self.assertFalse(registry.is_loaded('DIN 32676 A'))
+        self.assertEqual(registry.get_presets('ISO 2852', 'gasket'), [])
+        self.assertIsNone(registry.get_preset('ASME BPE', 'ferrule', 3))
+
+    def test_mismatched_standard_is_rejected(self):
+        """Un archivo con presets de otro estándar es un error"""
+        manifest_path = Path(self.test_dir) / 'presets' / 'manifest.json'
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        manifest['catalogs'][2]['standard'] = 'ASME BPE'
+        manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+
+        registry = CatalogRegistry(self.loader)
+        with self.assertRaises(ValueError):
+            registry.ensure_standard('ASME BPE')
+
+    def _split_iso_catalog(self, overlap: int = 0):
+        """Reparte el catálogo ISO 2852 de Ferrule en dos archivos"""
+        presets = Path(self.test_dir) / 'presets'
+        header, *rows = (presets / 'iso' / 'ferrule_iso2852.csv').read_text(
+            encoding='utf-8').splitlines()
+        (presets / 'iso' / 'ferrule_iso2852.csv').write_text(
+            '\n'.join([header] + rows[:4]) + '\n', encoding='utf-8')
+        (presets / 'iso' / 'ferrule_iso2852_large.csv').write_text(
+            '\n'.join([header] + rows[4 - overlap:]) + '\n', encoding='utf-8')
+        manifest_path = presets / 'manifest.json'
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        manifest['catalogs'].append({'standard': 'ISO 2852', 'component': 'ferrule',
+                                     'file': 'iso/ferrule_iso2852_large.csv'})
+        manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+
+    def test_standard_split_across_files(self):
+        """Dos archivos del mismo estándar y componente se concatenan"""
+        self._split_iso_catalog()
+        registry = CatalogRegistry(self.loader)
+
+        self.assertEqual(registry.components('ISO 2852'), ['ferrule'])
+        presets = registry.get_presets('ISO 2852', 'ferrule')
+        self.assertEqual(len(presets), 9)
+        self.assertEqual([p.size for p in presets], sorted(p.size for p in presets))
+        self.assertEqual(registry.get_preset('ISO 2852', 'ferrule', 1.5).dn, 'DN40')
+        self.assertEqual(registry.get_preset('ISO 2852', 'ferrule', 12).dn, 'DN300')
+
+    def test_size_repeated_across_files_is_rejected(self):
+        """Un tamaño en dos archivos del mismo componente es un error"""
+        self._split_iso_catalog(overlap=1)
+        registry = CatalogRegistry(self.loader)
+
+        with self.assertRaisesRegex(ValueError, 'ya está en'):
+            registry.ensure_standard('ISO 2852')
+
+    def test_data_manager_shares_default_catalog(self):
+        """DataManager no vuelve a leer el catálogo por defecto"""
+        manager = DataManager(self.test_dir)
+        manager.load_all_data()
+        with patch.object(CSVLoader, 'load_file', side_effect=AssertionError("carga")):
+            preset = manager.get_preset_by_standard('DIN 32676 A', 'gasket', 3.0)
+        self.assertIs(preset, manager.get_preset_by_size('gasket', 3.0))
+
+        self.assertEqual(manager.get_available_standards(), ['DIN 32676 A', 'ISO 2852'])
+        self.assertEqual(len(manager.get_presets_by_standard('ISO 2852', 'ferrule')), 9)
+
+    def test_directory_without_manifest(self):
+        """Sin manifiesto se usan los CSV por defecto de CSVLoader"""
+        os.remove(Path(self.test_dir) / 'presets' / 'manifest.json')
+        registry = CatalogRegistry(self.loader)
+
+        self.assertEqual(registry.standards(), ['DIN 32676 A'])
+        self.assertEqual(len(registry.get_presets('DIN 32676 A', 'ferrule')), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Tests para el comando triptafittings-generate."""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import pytest
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.cli import main, parse_size_range
+
+
+def test_parse_size_range():
+    assert parse_size_range("3") == (3.0, 3.0)
+    assert parse_size_range("1.5:4") == (1.5, 4.0)
+    assert parse_size_range(":2") == (None, 2.0)
+    assert parse_size_range("6:") == (6.0, None)
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_size_range("4:1")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_size_range("grande")
+
+
+def test_generate_writes_models_and_manifest(tmp_path):
+    out = tmp_path / "salida"
+    code = main(["-c", "ferrule", "-s", "1.5:2.5", "-s", "6",
+                 "--standard", "DIN 32676 A", "-o", str(out), "--threads", "-w", "2"])
+
+    assert code == 0
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert [m["size"] for m in manifest["models"]] == [1.5, 2.0, 2.5, 6.0]
+    assert manifest["failures"] == []
+
+    entry = manifest["models"][0]
+    payload = (out / entry["file"]).read_bytes()
+    assert hashlib.sha256(payload).hexdigest() == entry["sha256"]
+    assert json.loads(payload)["name"] == "Ferrule_1.5in_DN40"
+
+
+def test_generate_with_processes(tmp_path):
+    code = main(["-c", "gasket", "-s", "3", "-o", str(tmp_path), "-w", "2"])
+
+    assert code == 0
+    assert (tmp_path / "Gasket_3.0in_DN80.json").exists()
+
+
+def test_no_matching_presets(tmp_path, capsys):
+    assert main(["-s", "99", "-o", str(tmp_path)]) == 1
+    assert "Ningún preset" in capsys.readouterr().err
+    assert not (tmp_path / "manifest.json").exists()
+
+
+def test_generate_and_export(tmp_path):
+    args = ["-c", "gasket", "-s", "2:3", "-o", str(tmp_path), "-e", "stl", "-e", "DXF", "-w", "2"]
+    assert main(args) == 0
+
+    manifest = json.loads((tmp_path / "export_manifest.json").read_text(encoding="utf-8"))
+    assert manifest["written"] == 6
+    assert (tmp_path / "Gasket_2.5in_DN65.stl").exists()
+
+    # Segunda ejecución: nada que reescribir
+    assert main(args) == 0
+    manifest = json.loads((tmp_path / "export_manifest.json").read_text(encoding="utf-8"))
+    assert manifest["skipped"] == 6
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Tests para el índice de compatibilidad y la lista de materiales."""
+import os
+import sys
+
+import pytest
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.compatibility import BOMLine, CompatibilityIndex
+from triptafittings.core.data_manager import DataManager
+from triptafittings.data.preset import Preset
+
+
+@pytest.fixture(scope="module")
+def manager():
+    return DataManager()
+
+
+def _retagged(preset, standard, dn=None, **values):
+    """Copia de un preset en otro estándar, opcionalmente con otras cotas."""
+    parameters = preset.get_parameters_dict()
+    parameters.update(values)
+    return Preset.from_values(preset.component_type, preset.size, dn or preset.dn,
+                              standard, parameters)
+
+
+def test_mates_match_pairwise_check(manager):
+    index = manager.get_compatibility_index()
+    ferrules = manager.get_all_presets("ferrule")
+    gaskets = manager.get_all_presets("gasket")
+
+    assert len(index) == len(ferrules) + len(gaskets)
+    for ferrule in ferrules:
+        expected = [g for g in gaskets if ferrule.is_compatible_with(g)]
+        assert index.mates(ferrule) == {"gasket": expected}
+        assert index.mates(ferrule, "gasket")["gasket"] == expected
+    for gasket in gaskets:
+        assert index.mates(gasket, "ferrule")["ferrule"] == [
+            f for f in ferrules if f.is_compatible_with(gasket)]
+    assert index.unmatched("ferrule", "gasket") == []
+
+
+def test_mates_across_standards(manager):
+    ferrule = manager.get_preset_by_size("ferrule", 3.0)
+    gasket = manager.get_preset_by_size("gasket", 3.0)
+    # Mismas cotas de asiento en otro estándar: se acopla; otras cotas no
+    other = _retagged(gasket, "ISO 2852", dn="DN76")
+    wrong_seat = _retagged(gasket, "ISO 2852", BeadC2_mm=96.0)
+    index = CompatibilityIndex([ferrule, gasket, other, wrong_seat])
+
+    assert index.mates(ferrule)["gasket"] == [gasket, other]
+    assert index.are_compatible(ferrule, other)
+    assert not index.are_compatible(ferrule, wrong_seat)
+    assert not index.are_compatible(gasket, other)
+    # Se prefiere la pareja del mismo estándar
+    assert index.best_mate(ferrule, "gasket") is gasket
+    assert index.best_mate(_retagged(ferrule, "ISO 2852"), "gasket") is other
+    assert index.best_mate(ferrule, "clamp") is None
+
+
+def test_mates_within_resolution_across_cell_boundary(manager):
+    ferrule = manager.get_preset_by_size("ferrule", 3.0)
+    gasket = manager.get_preset_by_size("gasket", 3.0)
+    # Cotas a ambos lados del borde de una celda de 0.01 mm
+    below = _retagged(ferrule, "ISO 2852", FlangeOD_mm=50.004, C2_mm=43.5)
+    above = _retagged(gasket, "ISO 2852", FlangeOD_mm=50.006, BeadC2_mm=43.5)
+    # Celdas contiguas pero más de 0.01 mm de diferencia: no se acoplan
+    far = _retagged(gasket, "SMS", FlangeOD_mm=50.0145, BeadC2_mm=43.5)
+    index = CompatibilityIndex([below, above, far])
+
+    assert index.mates(below)["gasket"] == [above]
+    assert index.mates(above)["ferrule"] == [below]
+    assert index.are_compatible(below, above)
+    assert index.mates(far) == {}
+    assert not index.are_compatible(below, far)
+
+
+def test_connection_bom(manager):
+    bom = manager.get_connection_bom(2.0)
+    ferrule = manager.get_preset_by_size("ferrule", 2.0)
+    gasket = manager.get_preset_by_size("gasket", 2.0)
+
+    assert bom == [
+        BOMLine("ferrule", 2, ferrule, "Ferrule_2.0in_DN50"),
+        BOMLine("gasket", 1, gasket, "Gasket_2.0in_DN50"),
+        BOMLine("clamp", 1, None, "Abrazadera clamp para brida Ø64 mm"),
+    ]
+    # Desde el Gasket se arma la misma unión
+    assert manager.get_connection_bom(2.0, "gasket") == bom
+    with pytest.raises(ValueError):
+        manager.get_connection_bom(99.0)
+
+
+def test_assembly_bom_merges_lines(manager):
+    index = manager.get_compatibility_index()
+    small = manager.get_preset_by_size("ferrule", 2.0)
+    large = manager.get_preset_by_size("gasket", 4.0)
+
+    bom = index.assembly_bom([small, large, small])
+
+    assert [(line.component, line.quantity, line.description) for line in bom] == [
+        ("ferrule", 4, "Ferrule_2.0in_DN50"),
+        ("gasket", 2, "Gasket_2.0in_DN50"),
+        ("clamp", 2, "Abrazadera clamp para brida Ø64 mm"),
+        ("ferrule", 2, "Ferrule_4.0in_DN100"),
+        ("gasket", 1, "Gasket_4.0in_DN100"),
+        ("clamp", 1, "Abrazadera clamp para brida Ø119 mm"),
+    ]
+
+
+def test_missing_mate_raises(manager):
+    ferrule = manager.get_preset_by_size("ferrule", 3.0)
+    index = CompatibilityIndex([ferrule])
+
+    assert index.unmatched("ferrule", "gasket") == [ferrule]
+    with pytest.raises(ValueError, match="Gasket"):
+        index.connection_bom(ferrule)
+
+
+def test_compatible_presets_use_index(manager):
+    ferrule, gasket = manager.get_compatible_presets(3.0)
+
+    assert gasket is manager.get_mates(ferrule, "gasket")["gasket"][0]
+    assert manager.get_compatible_presets(99.0) == (None, None)
+
+
+def test_catalog_standards_index(manager):
+    standards = manager.get_available_standards()
+    index = manager.get_compatibility_index(standards)
+
+    assert index is manager.get_compatibility_index(standards)
+    assert len(index) == sum(len(manager.get_presets_by_standard(s, c))
+                             for s in standards for c in ("ferrule", "gasket"))
@@ -34,3 +34,126 @@ def test_set_and_persist_configuration(tmp_path):
 
     # Unknown keys should return default value if provided
     assert mgr2.get_setting("missing", "default") == "default"
+
+
+def test_save_fsyncs_before_replace(tmp_path, monkeypatch):
+    mgr = ConfigurationManager(config_file=tmp_path / "config.json")
+    calls = []
+    fsync, replace = os.fsync, os.replace
+    monkeypatch.setattr(os, "fsync", lambda fd: (calls.append("fsync"), fsync(fd)))
+    monkeypatch.setattr(os, "replace", lambda *a: (calls.append("replace"), replace(*a)))
+
+    mgr.set_setting("units", "inch")
+
+    assert calls == ["fsync", "replace"]
+
+
+def test_batch_groups_writes(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.json"
+    mgr = ConfigurationManager(config_file=config_path)
+    writes = []
+    original = mgr.save_configuration
+    monkeypatch.setattr(mgr, "save_configuration", lambda: (writes.append(1), original()))
+
+    with mgr.batch():
+        mgr.set_setting("units", "inch")
+        with mgr.batch():
+            mgr.set_setting("validation_level", "relaxed")
+        assert writes == []
+
+    assert len(writes) == 1
+    data = json.loads(config_path.read_text())
+    assert data["units"] == "inch" and data["validation_level"] == "relaxed"
+
+
+def test_write_behind_defers_until_flush(tmp_path):
+    config_path = tmp_path / "config.json"
+    mgr = ConfigurationManager(config_file=config_path, write_behind=True, debounce=3600)
+
+    for units in ("inch", "cm", "m"):
+        mgr.set_setting("units", units)
+    assert json.loads(config_path.read_text())["units"] == "mm"
+
+    mgr.close()
+    assert json.loads(config_path.read_text())["units"] == "m"
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_write_behind_debounce_timer(tmp_path):
+    config_path = tmp_path / "config.json"
+    mgr = ConfigurationManager(config_file=config_path, write_behind=True, debounce=0.01)
+    mgr.set_setting("units", "inch")
+    timer = mgr._timer
+
+    timer.join(timeout=5)
+    assert json.loads(config_path.read_text())["units"] == "inch"
+    mgr.close()
+
+
+def test_subscribers_receive_changes(tmp_path):
+    mgr = ConfigurationManager(config_file=tmp_path / "config.json")
+    events = []
+    unsubscribe = mgr.subscribe(lambda *change: events.append(change))
+
+    mgr.set_setting("units", "inch")
+    mgr.set_setting("units", "inch")  # sin cambio: no notifica
+    unsubscribe()
+    mgr.set_setting("units", "cm")
+
+    assert events == [("units", "mm", "inch")]
+
+
+def test_external_change_is_reloaded_and_throttled(tmp_path):
+    config_path = tmp_path / "config.json"
+    mgr = ConfigurationManager(config_file=config_path, reload_interval=3600)
+    events = []
+    mgr.subscribe(lambda *change: events.append(change))
+    assert mgr.get_setting("units") == "mm"  # primera comprobación
+
+    other = ConfigurationManager(config_file=config_path)
+    other.set_setting("units", "inch")
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # Dentro del intervalo no se consulta el disco
+    assert mgr.get_setting("units") == "mm"
+    assert mgr.check_for_changes(force=True) is True
+    assert mgr.get_setting("units") == "inch"
+    assert events == [("units", "mm", "inch")]
+
+
+def test_shared_config_is_one_instance_per_file(tmp_path):
+    from triptafittings.core.config import get_shared_config
+
+    config_path = tmp_path / "config.json"
+    shared = get_shared_config(config_path)
+    try:
+        assert get_shared_config(str(config_path)) is shared
+        assert shared.write_behind is True
+        assert get_shared_config(tmp_path / "other.json") is not shared
+    finally:
+        shared.close()
+
+
+def test_shared_config_lives_in_user_directory(tmp_path, monkeypatch):
+    from triptafittings.core import config as config_module
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    shared = config_module.get_shared_config()
+    try:
+        expected = tmp_path / "xdg" / "triptafittings" / "config.json"
+        assert shared.config_file == expected
+        # Leer no escribe nada: ni en el directorio actual ni en el del usuario
+        assert shared.get_setting("export_formats") == ["STEP", "DXF"]
+        shared.flush()
+        assert not expected.exists()
+        assert list(tmp_path.glob("*.json")) == []
+
+        shared.set_setting("units", "inch")
+        shared.flush()
+        assert json.loads(expected.read_text(encoding="utf-8"))["units"] == "inch"
+    finally:
+        shared.close()
+        config_module._shared_configs.pop(str(expected.resolve()), None)
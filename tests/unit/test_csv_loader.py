@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitarios para la lectura en streaming de CSVLoader
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.data.csv_loader import CSVLoader
+
+PRESETS_DIR = Path(__file__).resolve().parents[2] / 'src' / 'triptafittings' / 'data' / 'presets'
+
+
+class TestCSVLoaderStreaming(unittest.TestCase):
+    """Tests para iter_presets e iter_preset_chunks"""
+
+    def setUp(self):
+        """Copia los CSV reales a un directorio temporal"""
+        self.test_dir = tempfile.mkdtemp()
+        shutil.copytree(PRESETS_DIR, os.path.join(self.test_dir, 'presets'),
+                        ignore=shutil.ignore_patterns('*.cache'))
+        self.loader = CSVLoader(self.test_dir, use_cache=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_iter_presets_matches_load(self):
+        """El streaming produce los mismos presets que la carga completa"""
+        streamed = list(self.loader.iter_presets('Gasket'))
+        self.assertEqual(streamed, self.loader.load_gasket_data())
+
+    def test_iter_preset_chunks(self):
+        """Lotes de tamaño fijo con un último lote parcial"""
+        chunks = list(self.loader.iter_preset_chunks('ferrule', chunk_size=4))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 1])
+        self.assertEqual(chunks[0][0].dn, 'DN40')
+        with self.assertRaises(ValueError):
+            next(self.loader.iter_preset_chunks('ferrule', chunk_size=0))
+
+    def test_invalid_rows(self):
+        """Filas inválidas interrumpen o se omiten según skip_invalid"""
+        csv_path = Path(self.test_dir) / self.loader.ferrule_csv
+        with open(csv_path, 'a', encoding='utf-8') as file:
+            file.write('"14""",DN350,10.0,358.0,350.2,350.0,36.0,5.6,1.2,DIN 32676 A\n')
+
+        with self.assertRaises(ValueError) as context:
+            list(self.loader.iter_presets('ferrule'))
+        self.assertIn('fila 11', str(context.exception))
+
+        self.assertEqual(len(list(self.loader.iter_presets('ferrule', skip_invalid=True))), 9)
+
+    def test_invalid_component(self):
+        """Un componente desconocido produce ValueError"""
+        with self.assertRaises(ValueError):
+            next(self.loader.iter_presets('clamp'))
+
+
+if __name__ == '__main__':
+    unittest.main()
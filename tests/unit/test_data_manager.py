@@ -9,13 +9,16 @@ import sys
 import os
 import tempfile
 import shutil
+import threading
 
 # Agregar el directorio raíz al path para importar módulos
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
 
-from triptafittings.core.data_manager import DataManager
+from triptafittings.core.data_manager import DataManager, get_shared_data_manager
 from triptafittings.data.preset import Preset
 
+PRESETS_DIR = os.path.join(os.path.dirname(__file__), '../..', 'src', 'triptafittings', 'data', 'presets')
+
 
 class TestDataManager(unittest.TestCase):
     """Tests para la clase DataManager"""
@@ -313,5 +316,248 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(len(data_manager._gasket_presets), 1)
 
 
+class TestLazyLoading(unittest.TestCase):
+    """Tests para la carga diferida del catálogo"""
+    
+    def test_no_load_until_first_query(self):
+        """El catálogo se lee en la primera consulta"""
+        data_manager = DataManager()
+        self.assertFalse(data_manager.is_loaded)
+        
+        self.assertIn(3.0, data_manager.get_available_sizes('ferrule'))
+        self.assertTrue(data_manager.is_loaded)
+    
+    def test_background_warm_up(self):
+        """warm_up carga los datos en un hilo en segundo plano"""
+        data_manager = DataManager()
+        thread = data_manager.warm_up()
+        thread.join(timeout=10)
+        
+        self.assertTrue(data_manager.is_loaded)
+        self.assertIsNone(data_manager.warm_up())
+    
+    def test_concurrent_first_queries_load_once(self):
+        """Consultas concurrentes disparan una sola carga"""
+        data_manager = DataManager()
+        with patch.object(data_manager, '_load_all_data',
+                          wraps=data_manager._load_all_data) as load:
+            threads = [data_manager.warm_up() for _ in range(3)]
+            data_manager.get_available_dns()
+            for thread in threads:
+                if thread is not None:
+                    thread.join(timeout=10)
+        
+        self.assertEqual(load.call_count, 1)
+    
+    def test_shared_manager_per_directory(self):
+        """get_shared_data_manager reutiliza la instancia por directorio"""
+        self.assertIs(get_shared_data_manager(), get_shared_data_manager())
+        other = tempfile.mkdtemp()
+        try:
+            self.assertIsNot(get_shared_data_manager(other), get_shared_data_manager())
+        finally:
+            shutil.rmtree(other, ignore_errors=True)
+
+
+class TestMemoizedViews(unittest.TestCase):
+    """Tests para las vistas memorizadas y la generación de carga"""
+    
+    def setUp(self):
+        self.data_manager = DataManager()
+        self.data_manager.ensure_loaded()
+    
+    def test_views_are_computed_once_per_generation(self):
+        """Llamadas repetidas reutilizan la misma lista"""
+        sizes = self.data_manager.get_available_sizes('ferrule')
+        dns = self.data_manager.get_available_dns()
+        
+        self.assertIs(self.data_manager.get_available_sizes('Ferrule'), sizes)
+        self.assertIs(self.data_manager.get_available_dns(), dns)
+        self.assertEqual(dns[0], 'DN40')
+    
+    def test_reload_invalidates_views(self):
+        """reload_data avanza la generación y recalcula las vistas"""
+        generation = self.data_manager.generation
+        sizes = self.data_manager.get_available_sizes()
+        
+        self.assertTrue(self.data_manager.reload_data(full=True))
+        
+        self.assertGreater(self.data_manager.generation, generation)
+        new_sizes = self.data_manager.get_available_sizes()
+        self.assertIsNot(new_sizes, sizes)
+        self.assertEqual(new_sizes, sizes)
+    
+    def test_summary_returns_copies(self):
+        """El resumen no expone las listas memorizadas"""
+        summary = self.data_manager.get_data_summary()
+        summary['available_sizes'].append(99.0)
+        
+        self.assertNotIn(99.0, self.data_manager.get_available_sizes())
+
+
+class TestParallelLoading(unittest.TestCase):
+    """Tests para la carga concurrente de archivos independientes"""
+    
+    def test_parallel_matches_sequential(self):
+        """Hilos, procesos y carga secuencial producen el mismo catálogo"""
+        sequential = DataManager(load_workers=1)
+        self.assertTrue(sequential.load_all_data())
+        
+        for kwargs in ({'load_workers': None}, {'load_workers': 2, 'use_processes': True}):
+            data_manager = DataManager(**kwargs)
+            self.assertTrue(data_manager.load_all_data())
+            self.assertEqual(data_manager._ferrule_presets, sequential._ferrule_presets)
+            self.assertEqual(data_manager._gasket_presets, sequential._gasket_presets)
+    
+    def test_files_are_parsed_concurrently(self):
+        """Con varios trabajadores ambos archivos se cargan a la vez"""
+        data_manager = DataManager(load_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def wait_for_other(load):
+            def wrapper():
+                barrier.wait()
+                return load()
+            return wrapper
+        
+        loader = data_manager.csv_loader
+        with patch.object(loader, 'load_ferrule_data', wait_for_other(loader.load_ferrule_data)), \
+                patch.object(loader, 'load_gasket_data', wait_for_other(loader.load_gasket_data)):
+            self.assertTrue(data_manager.load_all_data())
+    
+    def test_sequential_by_default(self):
+        """Por defecto no se crea ningún pool"""
+        data_manager = DataManager()
+        with patch('triptafittings.core.data_manager.ThreadPoolExecutor') as threads, \
+                patch('triptafittings.core.data_manager.ProcessPoolExecutor') as processes:
+            self.assertTrue(data_manager.load_all_data())
+        
+        threads.assert_not_called()
+        processes.assert_not_called()
+    
+    def test_every_failed_file_is_reported(self):
+        """Cada archivo con error agrega su mensaje, en orden fijo"""
+        data_manager = DataManager()
+        loader = data_manager.csv_loader
+        with patch.object(loader, 'load_ferrule_data', side_effect=FileNotFoundError("ferrule")), \
+                patch.object(loader, 'load_gasket_data', side_effect=ValueError("gasket")):
+            self.assertFalse(data_manager.load_all_data())
+        
+        self.assertEqual(data_manager._load_errors, ['ferrule', 'gasket'])
+        self.assertFalse(data_manager.is_loaded)
+
+
+class TestIncrementalReload(unittest.TestCase):
+    """Tests para la recarga de solo los archivos modificados"""
+    
+    def setUp(self):
+        """Copia los presets reales a un directorio temporal"""
+        self.test_dir = tempfile.mkdtemp()
+        shutil.copytree(PRESETS_DIR, os.path.join(self.test_dir, 'presets'),
+                        ignore=shutil.ignore_patterns('*.cache'))
+        self.data_manager = DataManager(self.test_dir)
+        self.assertTrue(self.data_manager.load_all_data())
+        self.gasket_csv = os.path.join(self.test_dir, self.data_manager.csv_loader.gasket_csv)
+    
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def _edit_gasket_csv(self, edit):
+        with open(self.gasket_csv, encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        lines = edit(lines)
+        with open(self.gasket_csv, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        # Asegurar que el mtime cambie aun con resolución gruesa
+        stat = os.stat(self.gasket_csv)
+        os.utime(self.gasket_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    
+    def test_unchanged_files_are_not_parsed(self):
+        """Sin cambios no se parsea nada ni avanza la generación"""
+        generation = self.data_manager.generation
+        loader = self.data_manager.csv_loader
+        with patch.object(loader, 'load_ferrule_data') as ferrule, \
+                patch.object(loader, 'load_gasket_data') as gasket:
+            diff = self.data_manager.reload_changed()
+            # Tocar un archivo sin editarlo tampoco lo recarga
+            os.utime(self.gasket_csv)
+            self.assertTrue(self.data_manager.reload_data(full=False))
+        
+        self.assertTrue(diff.is_empty)
+        self.assertEqual(diff.files, [])
+        ferrule.assert_not_called()
+        gasket.assert_not_called()
+        self.assertEqual(self.data_manager.generation, generation)
+    
+    def test_only_edited_file_is_reparsed(self):
+        """Editar un CSV recarga solo ese archivo y reporta las diferencias"""
+        ferrule_3 = self.data_manager.get_preset_by_size('ferrule', 3.0)
+        old_gasket_2 = self.data_manager.get_preset_by_size('gasket', 2.0)
+        old_gasket_3 = self.data_manager.get_preset_by_size('gasket', 3.0)
+        old_gasket_4 = self.data_manager.get_preset_by_size('gasket', 4.0)
+        generation = self.data_manager.generation
+        
+        def edit(lines):
+            # Quitar 2", cambiar el estándar de 3" y agregar 14"
+            lines = [line for line in lines if not line.startswith('"2""",')]
+            lines = [line.replace('DIN 32676 A', 'DIN 32676 A rev') if line.startswith('"3""",')
+                     else line for line in lines]
+            return lines + [lines[-1].replace('"12"""', '"14"""').replace('DN300', 'DN350')]
+        self._edit_gasket_csv(edit)
+        
+        loader = self.data_manager.csv_loader
+        with patch.object(loader, 'load_ferrule_data') as ferrule:
+            diff = self.data_manager.reload_changed()
+        ferrule.assert_not_called()
+        
+        self.assertEqual(diff.files, [loader.gasket_csv])
+        self.assertEqual(diff.removed, [old_gasket_2])
+        self.assertEqual([(old.size, new.standard) for old, new in diff.changed],
+                         [(3.0, 'DIN 32676 A rev')])
+        self.assertEqual([preset.size for preset in diff.added], [14.0])
+        self.assertIs(diff.changed[0][0], old_gasket_3)
+        
+        # Índices parcheados
+        self.assertIsNone(self.data_manager.get_preset_by_size('gasket', 2.0))
+        self.assertIsNone(self.data_manager.get_preset_by_dn('gasket', 'DN50'))
+        self.assertEqual(self.data_manager.get_preset_by_dn('gasket', 'DN350').size, 14.0)
+        self.assertIs(self.data_manager.get_preset_by_size('gasket', 3.0), diff.changed[0][1])
+        self.assertIs(self.data_manager.get_preset_by_size('ferrule', 3.0), ferrule_3)
+        # La lista y los índices comparten los objetos; los no modificados se conservan
+        gaskets = self.data_manager.get_all_presets('gasket')
+        self.assertTrue(any(preset is old_gasket_4 for preset in gaskets))
+        for preset in gaskets:
+            self.assertIs(self.data_manager.get_preset_by_size('gasket', preset.size), preset)
+            self.assertIs(self.data_manager.get_preset_by_dn('gasket', preset.dn), preset)
+        self.assertIn(14.0, self.data_manager.get_available_sizes('gasket'))
+        self.assertGreater(self.data_manager.generation, generation)
+        
+        # Índice de compatibilidad reconstruido: el 2" se queda sin Gasket y
+        # el 3" se acopla con el Gasket de otro estándar con las mismas cotas
+        ferrule_2 = self.data_manager.get_preset_by_size('ferrule', 2.0)
+        self.assertEqual(self.data_manager.get_mates(ferrule_2), {})
+        self.assertEqual(self.data_manager.get_compatible_presets(3.0),
+                         (ferrule_3, diff.changed[0][1]))
+    
+    def test_reload_data_is_full_by_default(self):
+        """reload_data() sin argumentos vuelve a leer todos los archivos"""
+        loader = self.data_manager.csv_loader
+        with patch.object(loader, 'load_ferrule_data', wraps=loader.load_ferrule_data) as ferrule, \
+                patch.object(loader, 'load_gasket_data', wraps=loader.load_gasket_data) as gasket:
+            self.assertTrue(self.data_manager.reload_data())
+        
+        ferrule.assert_called_once()
+        gasket.assert_called_once()
+    
+    def test_failed_reload_keeps_previous_data(self):
+        """Un CSV inválido no reemplaza los datos cargados"""
+        self._edit_gasket_csv(lambda lines: lines[:1] + ['x,y,z'])
+        
+        self.assertIsNone(self.data_manager.reload_changed())
+        self.assertFalse(self.data_manager.reload_data(full=False))
+        self.assertEqual(len(self.data_manager._load_errors), 2)
+        self.assertIsNotNone(self.data_manager.get_preset_by_size('gasket', 2.0))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Tests para la generación en segundo plano del diálogo."""
+import os
+import sys
+import threading
+
+import pytest
+
+# Añadir la ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.config import ConfigurationManager
+from triptafittings.core.data_manager import DataManager
+from triptafittings.ui import dialog
+from triptafittings.ui.dialog import GenerationWorker, TriptaFittingsDialog
+
+pytestmark = pytest.mark.skipif(dialog.PYSIDE2_AVAILABLE,
+                                reason="Los tests usan el modo sin Qt")
+
+
+def _conectar(worker):
+    eventos = {'modelos': [], 'errores': [], 'progreso': [], 'fin': []}
+    worker.signals.model_ready.connect(eventos['modelos'].append)
+    worker.signals.failed.connect(eventos['errores'].append)
+    worker.signals.progress.connect(lambda done, total: eventos['progreso'].append((done, total)))
+    worker.signals.finished.connect(eventos['fin'].append)
+    return eventos
+
+
+def test_worker_emite_progreso_y_modelos():
+    presets = DataManager().get_all_presets('gasket')[:3]
+    worker = GenerationWorker(presets)
+    eventos = _conectar(worker)
+
+    worker.run()
+
+    assert [m['name'] for m in eventos['modelos']] == [p.get_name() for p in presets]
+    assert eventos['progreso'] == [(1, 3), (2, 3), (3, 3)]
+    assert eventos['fin'] == [False]
+    assert eventos['errores'] == []
+
+
+def test_worker_cancelado_no_genera():
+    worker = GenerationWorker(DataManager().get_all_presets('ferrule'))
+    eventos = _conectar(worker)
+
+    worker.cancel()
+    hilo = threading.Thread(target=worker.run)
+    hilo.start()
+    hilo.join()
+
+    assert eventos['modelos'] == []
+    assert eventos['fin'] == [True]
+
+
+def test_worker_reporta_errores_sin_detenerse(monkeypatch):
+    presets = DataManager().get_all_presets('ferrule')[:2]
+    llamadas = []
+
+    def generar(preset):
+        llamadas.append(preset)
+        if len(llamadas) == 1:
+            raise RuntimeError("fallo")
+        return {'name': preset.get_name()}
+
+    monkeypatch.setattr(dialog, 'generate_geometry', generar)
+    worker = GenerationWorker(presets)
+    eventos = _conectar(worker)
+    worker.run()
+
+    assert len(eventos['errores']) == 1 and 'fallo' in eventos['errores'][0]
+    assert [m['name'] for m in eventos['modelos']] == [presets[1].get_name()]
+
+
+def test_dialogo_entrega_modelos_por_senal():
+    dlg = TriptaFittingsDialog()
+    recibidos = []
+    dlg.model_generated.connect(recibidos.append)
+    presets = dlg.data_manager.get_presets_by_type('ferrule')
+
+    assert dlg.generate_models(presets) is True
+
+    assert [m['name'] for m in recibidos] == [p.get_name() for p in presets]
+    assert dlg.get_generated_models() == recibidos
+    assert not dlg.is_generating()
+    assert dlg.cancel_btn.isEnabled() is False
+
+
+def test_dialogo_rechaza_generacion_concurrente():
+    dlg = TriptaFittingsDialog()
+    dlg._worker = GenerationWorker([])
+
+    assert dlg.generate_models(dlg.data_manager.get_presets_by_type('gasket')) is False
+    dlg.reject()
+    assert dlg._worker.cancelled
+
+
+def test_dialogo_exporta_con_formatos_de_la_configuracion(tmp_path):
+    config = ConfigurationManager(tmp_path / 'config.json')
+    config.set_setting('export_formats', ['DXF'])
+    dlg = TriptaFittingsDialog(config=config)
+    dlg.generate_models(dlg.data_manager.get_presets_by_type('gasket')[:1])
+
+    manifest = dlg.export_generated_models(str(tmp_path / 'salida'))
+
+    assert manifest['formats'] == ['DXF']
+    assert manifest['written'] == 1
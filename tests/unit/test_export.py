@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Tests para el teselado y la exportación a STEP/STL/DXF."""
+import hashlib
+import json
+import math
+import os
+import struct
+import sys
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core import export
+from triptafittings.core.config import ConfigurationManager
+from triptafittings.core.data_manager import DataManager
+from triptafittings.core.export import EXPORT_MANIFEST, export_models, model_preset
+from triptafittings.generators.factory import generate_geometry
+from triptafittings.generators.mesh import (
+    mesh_volume, revolution_segments, stl_bytes, tessellate,
+)
+from triptafittings.generators.profiles import get_profile_template
+from triptafittings.ui.interface import UserInterface
+
+
+@pytest.fixture(scope="module")
+def manager():
+    return DataManager()
+
+
+@pytest.fixture
+def models(manager):
+    return [generate_geometry(manager.get_preset_by_size(c, 3.0)) for c in ("ferrule", "gasket")]
+
+
+def _pappus_volume(points):
+    """Volumen exacto del sólido de revolución de un polígono."""
+    area = centroid = 0.0
+    for (r0, z0), (r1, z1) in zip(points, points[1:] + points[:1]):
+        cross = r0 * z1 - r1 * z0
+        area += cross
+        centroid += (r0 + r1) * cross
+    return 2 * math.pi * abs(centroid / 6)
+
+
+def test_revolution_segments():
+    assert revolution_segments(50.0, 0.1, math.pi) == math.ceil(
+        math.pi / math.acos(1 - 0.1 / 50.0))
+    # Radio pequeño: manda la desviación angular
+    assert revolution_segments(0.05, 0.1, 0.5) == math.ceil(2 * math.pi / 0.5)
+    assert revolution_segments(1e6, 1e-9, 1e-9) == 4096
+    with pytest.raises(ValueError):
+        revolution_segments(10.0, 0.0, 0.5)
+
+
+@pytest.mark.parametrize("component", ["ferrule", "gasket"])
+def test_tessellation_is_closed_and_outward(manager, component):
+    preset = manager.get_preset_by_size(component, 3.0)
+    mesh = tessellate(preset, 0.01, 0.1)
+    points = get_profile_template(component, preset.standard).dimension(preset)
+
+    assert mesh.vertices.typecode == "f" and mesh.indices.typecode == "I"
+    assert mesh.vertex_count == len(points) * revolution_segments(
+        max(r for r, _ in points), 0.01, 0.1)
+    # Malla cerrada: cada arista la comparten exactamente dos triángulos
+    edges = Counter()
+    for t in range(0, len(mesh.indices), 3):
+        a, b, c = mesh.indices[t:t + 3]
+        edges.update(frozenset(e) for e in ((a, b), (b, c), (c, a)))
+    assert set(edges.values()) == {2}
+    # Volumen positivo (normales hacia afuera) y cercano al exacto
+    assert mesh_volume(mesh) == pytest.approx(_pappus_volume(points), rel=1e-3)
+
+
+def test_stl_bytes(manager):
+    mesh = tessellate(manager.get_preset_by_size("gasket", 2.0))
+    data = stl_bytes(mesh)
+    (count,) = struct.unpack_from("<I", data, 80)
+    assert count == mesh.triangle_count
+    assert len(data) == 84 + 50 * count
+
+
+def test_model_preset_roundtrip(models, manager):
+    assert model_preset(models[0]) == manager.get_preset_by_size("ferrule", 3.0)
+
+
+def test_export_writes_files_and_manifest(tmp_path, models):
+    manifest = export_models(models, tmp_path, ["stl", "DXF"], workers=2)
+
+    assert manifest["formats"] == ["STL", "DXF"]
+    assert manifest["written"] == 4 and manifest["skipped"] == 0
+    assert manifest["failures"] == []
+    assert [m["name"] for m in manifest["models"]] == ["Ferrule_3.0in_DN80", "Gasket_3.0in_DN80"]
+    assert json.loads((tmp_path / EXPORT_MANIFEST).read_text(encoding="utf-8")) == manifest
+
+    for entry in manifest["models"]:
+        for info in entry["files"].values():
+            payload = (tmp_path / info["file"]).read_bytes()
+            assert hashlib.sha256(payload).hexdigest() == info["sha256"]
+
+    dxf = (tmp_path / "Gasket_3.0in_DN80.dxf").read_text(encoding="ascii")
+    assert dxf.count("\nVERTEX\n") == 10 and dxf.endswith("EOF\n")
+
+
+def test_reexport_skips_up_to_date_files(tmp_path, models, manager):
+    export_models(models, tmp_path, ["STL", "DXF"], workers=1)
+
+    manifest = export_models(models, tmp_path, ["STL", "DXF"], workers=1)
+    assert manifest["written"] == 0 and manifest["skipped"] == 4
+
+    # Archivo modificado en disco: se reescribe solo ese
+    (tmp_path / "Ferrule_3.0in_DN80.stl").write_bytes(b"editado")
+    manifest = export_models(models, tmp_path, ["STL", "DXF"], workers=1)
+    assert (manifest["written"], manifest["skipped"]) == (1, 3)
+
+    # Otra precisión de malla invalida solo los formatos de malla
+    manifest = export_models(models, tmp_path, ["STL", "DXF"], workers=1, linear_deflection=0.5)
+    assert (manifest["written"], manifest["skipped"]) == (2, 2)
+
+    # Modelo con otro contenido: se reescriben sus archivos
+    changed = dict(models[1], parameters=dict(models[1]["parameters"], ProfileH_mm=5.0))
+    manifest = export_models([models[0], changed], tmp_path, ["STL", "DXF"], workers=1,
+                             linear_deflection=0.5)
+    assert (manifest["written"], manifest["skipped"]) == (2, 2)
+
+    manifest = export_models(models, tmp_path, ["DXF"], workers=1, force=True)
+    assert manifest["written"] == 2
+
+
+def test_subset_export_keeps_other_manifest_entries(tmp_path, models):
+    export_models(models, tmp_path, ["STL", "DXF"], workers=1)
+
+    # Solo la junta y solo DXF: el Ferrule y el STL de la junta se conservan
+    manifest = export_models(models[1:], tmp_path, ["DXF"], workers=1, force=True)
+
+    assert manifest["written"] == 1
+    entries = {m["name"]: m for m in manifest["models"]}
+    assert list(entries) == ["Ferrule_3.0in_DN80", "Gasket_3.0in_DN80"]
+    assert set(entries["Ferrule_3.0in_DN80"]["files"]) == {"STL", "DXF"}
+    assert set(entries["Gasket_3.0in_DN80"]["files"]) == {"STL", "DXF"}
+    assert json.loads((tmp_path / EXPORT_MANIFEST).read_text(encoding="utf-8")) == manifest
+
+    again = export_models(models, tmp_path, ["STL", "DXF"], workers=1)
+    assert (again["written"], again["skipped"]) == (0, 4)
+
+
+def test_failed_reexport_keeps_manifest_entry(tmp_path, models, monkeypatch):
+    first = export_models(models, tmp_path, ["STL", "DXF"], workers=1)
+
+    def broken(model, *args):
+        raise RuntimeError("trabajador caído")
+    monkeypatch.setattr(export, "export_model", broken)
+    manifest = export_models(models[:1], tmp_path, ["STL", "DXF"], workers=1, force=True)
+
+    assert manifest["models"] == first["models"]
+    assert [(f["name"], f["format"]) for f in manifest["failures"]] == [
+        ("Ferrule_3.0in_DN80", "STL"), ("Ferrule_3.0in_DN80", "DXF")]
+
+    monkeypatch.undo()
+    again = export_models(models, tmp_path, ["STL", "DXF"], workers=1)
+    assert (again["written"], again["skipped"]) == (0, 4)
+
+
+def test_processes_only_for_mesh_formats(tmp_path, models, monkeypatch):
+    pools = []
+    real_pool = export.ProcessPoolExecutor
+
+    def spy(*args, **kwargs):
+        pools.append(kwargs)
+        return real_pool(*args, **kwargs)
+    monkeypatch.setattr(export, "ProcessPoolExecutor", spy)
+
+    # Por defecto hilos; con STEP en el lote nunca procesos
+    export_models(models, tmp_path / "default", ["DXF"], workers=2)
+    with patch.dict(sys.modules, {"FreeCAD": None, "Part": None}):
+        export_models(models, tmp_path / "step", ["STEP", "DXF"], workers=2,
+                      use_processes=True)
+    assert pools == []
+
+    manifest = export_models(models, tmp_path / "mesh", ["STL"], workers=2, use_processes=True)
+    assert len(pools) == 1 and manifest["written"] == 2
+
+
+def test_step_requires_freecad(tmp_path, models):
+    with patch.dict(sys.modules, {"FreeCAD": None, "Part": None}):
+        manifest = export_models(models[:1], tmp_path, ["STEP", "DXF"], workers=1)
+
+    assert manifest["written"] == 1
+    assert [(f["format"], "FreeCAD" in f["error"]) for f in manifest["failures"]] == [("STEP", True)]
+    assert list(manifest["models"][0]["files"]) == ["DXF"]
+
+
+def test_step_with_freecad(tmp_path, models):
+    def export_step(path):
+        with open(path, "w") as file:
+            file.write("ISO-10303-21;")
+
+    part = MagicMock(name="Part")
+    part.Face.return_value.revolve.return_value.exportStep.side_effect = export_step
+    freecad = MagicMock(name="FreeCAD")
+    with patch.dict(sys.modules, {"FreeCAD": freecad, "Part": part}), \
+            patch("triptafittings.generators.profiles._templates", {}):
+        manifest = export_models(models[:1], tmp_path, ["STEP"], workers=1)
+
+    assert manifest["failures"] == []
+    assert (tmp_path / "Ferrule_3.0in_DN80.step").read_text() == "ISO-10303-21;"
+
+
+def test_invalid_format(tmp_path, models):
+    with pytest.raises(ValueError):
+        export_models(models, tmp_path, ["IGES"])
+
+
+def test_user_interface_exports_generated_models(tmp_path):
+    ui = UserInterface(data_manager=DataManager())
+    ui.generate_model("ferrule", 2.0)
+    ui.generate_model("gasket", 2.0)
+
+    manifest = ui.export_models(str(tmp_path), formats=["DXF"], component="gasket", workers=1)
+
+    assert [m["name"] for m in manifest["models"]] == ["Gasket_2.0in_DN50"]
+    assert (tmp_path / "Gasket_2.0in_DN50.dxf").exists()
+
+
+def test_formats_default_to_user_configuration(tmp_path, models, monkeypatch):
+    config = ConfigurationManager(tmp_path / "config.json")
+    config.set_setting("export_formats", ["STL"])
+    monkeypatch.setattr(export, "get_shared_config", lambda: config)
+
+    manifest = export_models(models[:1], tmp_path / "out", workers=1)
+    assert manifest["formats"] == ["STL"]
+
+    ui = UserInterface(data_manager=DataManager(), config=config)
+    ui.generate_model("gasket", 2.0)
+    config.set_setting("export_formats", ["DXF"])
+    manifest = ui.export_models(str(tmp_path / "ui"), workers=1)
+    assert manifest["formats"] == ["DXF"]
+    assert (tmp_path / "ui" / "Gasket_2.0in_DN50.dxf").exists()
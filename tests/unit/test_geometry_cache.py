@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Tests unitarios para el cache de geometría."""
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.data.preset import Preset
+from triptafittings.generators.cache import GeometryCache, geometry_key
+from triptafittings.generators.factory import generate_geometry
+from triptafittings.generators.ferrule import FerruleGenerator
+from triptafittings.ui.interface import UserInterface
+
+
+class TestGeometryCache(unittest.TestCase):
+    def setUp(self):
+        self.ferrule_data = {
+            'Size': '3"',
+            'DN': 'DN80',
+            'FlangeOD_mm': 106.0,
+            'C2_mm': 97.0,
+            'TubeID_mm': 81.2,
+            'PassageDia_mm': 81.0,
+            'HeightTube_mm': 24.0,
+            'HeightProfile_mm': 4.3,
+            'SeatLipWidth_mm': 1.0,
+            'Standard': 'DIN 32676 A'
+        }
+        self.preset = Preset('ferrule', self.ferrule_data)
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_key_depends_on_content_and_version(self):
+        same = Preset('ferrule', dict(self.ferrule_data))
+        changed = Preset('ferrule', dict(self.ferrule_data, C2_mm=96.0))
+
+        key = geometry_key(self.preset, 'FerruleGenerator', '1')
+        self.assertEqual(key, geometry_key(same, 'FerruleGenerator', '1'))
+        self.assertNotEqual(key, geometry_key(changed, 'FerruleGenerator', '1'))
+        self.assertNotEqual(key, geometry_key(self.preset, 'FerruleGenerator', '2'))
+
+    def test_memory_hit_skips_generation(self):
+        cache = GeometryCache()
+        first = generate_geometry(self.preset, cache)
+        with patch.object(FerruleGenerator, 'generate_geometry',
+                          side_effect=AssertionError('regenerado')):
+            second = generate_geometry(self.preset, cache)
+
+        self.assertEqual(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # Las copias entregadas no comparten estado con el cache
+        second['parameters']['C2_mm'] = 0
+        self.assertEqual(generate_geometry(self.preset, cache)['parameters']['C2_mm'], 97.0)
+
+    def test_disk_tier_survives_new_instance(self):
+        generate_geometry(self.preset, GeometryCache(self.cache_dir))
+        cache = GeometryCache(self.cache_dir)
+        with patch.object(FerruleGenerator, 'generate_geometry',
+                          side_effect=AssertionError('regenerado')):
+            geometry = generate_geometry(self.preset, cache)
+        self.assertEqual(geometry['name'], 'Ferrule_3.0in_DN80')
+
+    def test_memory_lru_and_disk_eviction(self):
+        cache = GeometryCache(self.cache_dir, memory_items=2, max_disk_bytes=250)
+        for i in range(5):
+            cache.put(f'k{i}', {'name': f'modelo{i}', 'data': 'x' * 50})
+
+        self.assertEqual(list(cache._memory), ['k3', 'k4'])
+        remaining = sorted(os.listdir(self.cache_dir))
+        self.assertLess(len(remaining), 5)
+        self.assertIn('k4.json', remaining)
+
+    def test_pickle_keeps_disk_tier_only(self):
+        cache = GeometryCache(self.cache_dir, memory_items=8)
+        cache.put('k', {'name': 'modelo'})
+        clone = pickle.loads(pickle.dumps(cache))
+
+        self.assertEqual(len(clone._memory), 0)
+        self.assertEqual(clone.get('k'), {'name': 'modelo'})
+
+    def test_user_interface_uses_cache(self):
+        cache = GeometryCache()
+        ui = UserInterface(geometry_cache=cache)
+        ui.generate_model('gasket', 2.0)
+        ui.generate_models([('gasket', 2.0), ('gasket', 3.0)], workers=2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
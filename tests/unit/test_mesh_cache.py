@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Tests unitarios para el cache de mallas mapeadas en memoria."""
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.core.export import export_models
+from triptafittings.generators import mesh_cache as mesh_cache_module
+from triptafittings.generators.factory import generate_geometry
+from triptafittings.generators.mesh import tessellate
+from triptafittings.generators.mesh_cache import LOD_PRESETS, MeshCache
+
+
+class TestMeshCache(unittest.TestCase):
+    def setUp(self):
+        self.data_manager = DataManager()
+        self.preset = self.data_manager.get_preset_by_size('ferrule', 3.0)
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _files(self):
+        return sorted(Path(self.cache_dir).glob('*' + MeshCache.SUFFIX))
+
+    def test_memory_hit_returns_same_mesh(self):
+        cache = MeshCache()
+        with patch.object(mesh_cache_module, 'tessellate', wraps=tessellate) as spy:
+            first = cache.get_mesh(self.preset)
+            second = cache.get_mesh(self.preset)
+
+        self.assertIs(first, second)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_lod_levels_are_separate_entries(self):
+        cache = MeshCache(self.cache_dir)
+        preview = cache.get_mesh(self.preset, 'preview')
+        export = cache.get_mesh(self.preset, 'export')
+
+        self.assertLess(preview.triangle_count, export.triangle_count)
+        self.assertEqual(len(self._files()), 2)
+        # Desviaciones explícitas equivalentes al nivel: misma entrada
+        linear, angular = LOD_PRESETS['preview']
+        self.assertIs(cache.get_mesh(self.preset, 'export', linear, angular), preview)
+        with self.assertRaises(ValueError):
+            cache.get_mesh(self.preset, 'ultra')
+
+    def test_custom_lod_presets(self):
+        cache = MeshCache(lod_presets={'preview': (2.0, 1.5), 'cam': (0.001, 0.05)})
+        self.assertEqual(cache.deflection('preview'), (2.0, 1.5))
+        self.assertEqual(cache.deflection('export'), LOD_PRESETS['export'])
+        self.assertGreater(cache.get_mesh(self.preset, 'cam').triangle_count,
+                           cache.get_mesh(self.preset, 'preview').triangle_count)
+
+    def test_disk_entry_is_memory_mapped(self):
+        original = MeshCache(self.cache_dir).get_mesh(self.preset, 'preview')
+
+        with patch.object(mesh_cache_module, 'tessellate') as spy, \
+                patch.object(MeshCache, 'MMAP_MIN_BYTES', 0):
+            cache = MeshCache(self.cache_dir)
+            cached = cache.get_mesh(self.preset, 'preview')
+        spy.assert_not_called()
+
+        self.assertEqual(len(cache._maps), 1)
+        self.assertIsInstance(cached.vertices, memoryview)
+        self.assertTrue(cached.vertices.readonly)
+        self.assertEqual(cached.vertices.format, 'f')
+        self.assertEqual(cached.indices.format, 'I')
+        self.assertEqual(list(cached.vertices), list(original.vertices))
+        self.assertEqual(list(cached.indices), list(original.indices))
+
+    def test_small_mesh_is_read_without_mapping(self):
+        original = MeshCache(self.cache_dir).get_mesh(self.preset, 'preview')
+        cache = MeshCache(self.cache_dir)
+        cached = cache.get_mesh(self.preset, 'preview')
+
+        self.assertEqual(cache._maps, {})
+        self.assertTrue(cached.vertices.readonly)
+        self.assertEqual(list(cached.indices), list(original.indices))
+
+    def test_map_is_closed_before_replace_and_evict(self):
+        MeshCache(self.cache_dir).get_mesh(self.preset, 'preview')
+        with patch.object(MeshCache, 'MMAP_MIN_BYTES', 0):
+            cache = MeshCache(self.cache_dir)
+            mesh = cache.get_mesh(self.preset, 'preview')
+            (path, buffer), = cache._maps.items()
+            key = path.stem
+            del mesh
+
+            fresh_mesh = tessellate(self.preset, *LOD_PRESETS['preview'])
+            cache.put(key, fresh_mesh)
+            self.assertTrue(buffer.closed)
+            self.assertEqual(cache._maps, {})
+            self.assertIs(cache.get(key), fresh_mesh)
+
+            # Expulsión: el mapa se cierra aunque la malla siga en memoria
+            fresh = MeshCache(self.cache_dir)
+            fresh.get_mesh(self.preset, 'preview')
+            (_, buffer), = fresh._maps.items()
+            fresh.clear()
+        self.assertTrue(buffer.closed)
+        self.assertEqual(self._files(), [])
+
+    def test_map_is_closed_when_leaving_memory(self):
+        other = self.data_manager.get_preset_by_size('ferrule', 4.0)
+        MeshCache(self.cache_dir).get_mesh(self.preset, 'preview')
+        MeshCache(self.cache_dir).get_mesh(other, 'preview')
+        with patch.object(MeshCache, 'MMAP_MIN_BYTES', 0):
+            cache = MeshCache(self.cache_dir, memory_items=1)
+            cache.get_mesh(self.preset, 'preview')
+            (_, first), = cache._maps.items()
+            cache.get_mesh(other, 'preview')
+
+        self.assertTrue(first.closed)
+        self.assertEqual(len(cache._maps), 1)
+        self.assertEqual(len(self._files()), 2)
+
+    def test_failed_eviction_is_logged(self):
+        cache = MeshCache(self.cache_dir)
+        cache.get_mesh(self.preset, 'preview')
+
+        with patch.object(Path, 'unlink', side_effect=PermissionError('en uso')), \
+                self.assertLogs('triptafittings.generators.cache', 'WARNING') as logs:
+            cache.clear()
+        self.assertIn('No se pudo eliminar', logs.output[0])
+        self.assertEqual(len(self._files()), 1)
+
+    def test_catalog_change_invalidates_mesh(self):
+        cache = MeshCache(self.cache_dir)
+        cache.get_mesh(self.preset)
+        other = self.data_manager.get_preset_by_size('ferrule', 4.0)
+        cache.get_mesh(other)
+        self.assertEqual(len(self._files()), 2)
+
+    def test_corrupt_file_is_regenerated(self):
+        MeshCache(self.cache_dir).get_mesh(self.preset)
+        path, = self._files()
+        path.write_bytes(path.read_bytes()[:40])
+
+        mesh = MeshCache(self.cache_dir).get_mesh(self.preset)
+        self.assertEqual(mesh.vertex_count, tessellate(self.preset).vertex_count)
+        self.assertGreater(path.stat().st_size, 40)
+
+    def test_pickle_keeps_disk_and_lods(self):
+        cache = MeshCache(self.cache_dir, lod_presets={'cam': (0.001, 0.05)})
+        clone = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(clone.cache_dir, cache.cache_dir)
+        self.assertEqual(clone.deflection('cam'), (0.001, 0.05))
+
+    def test_export_uses_mesh_cache(self):
+        model = generate_geometry(self.preset)
+        cache = MeshCache(self.cache_dir)
+        out = tempfile.mkdtemp()
+        try:
+            export_models([model], out, ['STL'], workers=1, mesh_cache=cache)
+            export_models([model], out, ['STL'], workers=1, mesh_cache=cache, force=True)
+        finally:
+            shutil.rmtree(out, ignore_errors=True)
+
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        self.assertEqual(len(self._files()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
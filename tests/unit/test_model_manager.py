@@ -7,6 +7,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
 
 from triptafittings.ui.interface import UserInterface
+from triptafittings.core.model_manager import ModelManager
 
 
 def test_model_management_flow():
@@ -31,3 +32,67 @@ def test_model_management_flow():
     # Limpiar todos los modelos
     ui.clear_models()
     assert ui.list_generated_models() == []
+
+
+def test_add_models_bulk_is_atomic():
+    manager = ModelManager()
+    names = manager.add_models([
+        {'name': 'a', 'component': 'ferrule'},
+        {'name': 'b', 'component': 'gasket'},
+    ])
+    assert names == ['a', 'b']
+
+    try:
+        manager.add_models([{'name': 'c', 'component': 'ferrule'}, {'name': 'd'}])
+    except ValueError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError('Se esperaba ValueError')
+    assert [m['name'] for m in manager.list_models()] == ['a', 'b']
+
+
+def _modelo(name, component, size, dn, standard='DIN 32676 A'):
+    return {'name': name, 'component': component,
+            'parameters': {'Size': size, 'DN': dn, 'Standard': standard}}
+
+
+def test_filtered_listing_uses_indexes():
+    manager = ModelManager()
+    manager.add_models([
+        _modelo('f1', 'ferrule', 1.5, 'DN40'),
+        _modelo('g1', 'gasket', 1.5, 'DN40'),
+        _modelo('f3', 'ferrule', 3.0, 'DN80'),
+        _modelo('f3b', 'ferrule', '3.0', 'DN80', 'ISO 2852'),
+    ])
+
+    assert [m['name'] for m in manager.list_models(size=1.5)] == ['f1', 'g1']
+    assert [m['name'] for m in manager.list_models('ferrule', dn='DN80')] == ['f3', 'f3b']
+    assert [m['name'] for m in manager.list_models(standard='ISO 2852', size=3)] == ['f3b']
+    assert manager.list_models('clamp') == []
+
+
+def test_indexes_follow_replace_and_remove():
+    manager = ModelManager()
+    manager.add_model(_modelo('m', 'ferrule', 1.5, 'DN40'))
+    manager.add_model(_modelo('m', 'gasket', 3.0, 'DN80'))
+
+    assert manager.list_models('ferrule') == []
+    assert manager.list_models(dn='DN40') == []
+    assert [m['name'] for m in manager.list_models('gasket', size=3.0)] == ['m']
+
+    assert manager.remove_model('m') is True
+    assert manager.list_models('gasket') == []
+    assert all(not index for index in manager._indexes.values())
+
+
+def test_clear_component_only_touches_its_models():
+    manager = ModelManager()
+    manager.add_models([_modelo(f'f{i}', 'ferrule', i, f'DN{i}') for i in range(5)])
+    manager.add_model(_modelo('g', 'gasket', 1.0, 'DN1'))
+
+    manager.clear('ferrule')
+
+    assert len(manager) == 1
+    assert [m['name'] for m in manager.list_models(dn='DN1')] == ['g']
+    manager.clear()
+    assert len(manager) == 0 and manager.list_models(size=1.0) == []
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Tests para el registro persistente de modelos."""
+import json
+import os
+import sys
+import time
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.model_manager import ModelManager
+from triptafittings.core.model_registry import ModelRegistry
+
+
+def _modelo(name, component='ferrule', size=3.0):
+    return {'name': name, 'component': component, 'parameters': {'Size': size, 'DN': 'DN80'}}
+
+
+def test_add_model_does_not_touch_disk_until_flush(tmp_path):
+    log = tmp_path / 'models.jsonl'
+    registry = ModelRegistry(log, flush_interval=3600)
+    manager = ModelManager(registry)
+
+    manager.add_model(_modelo('a'))
+    assert not log.exists()
+
+    assert registry.flush() == 1
+    assert json.loads(log.read_text())['model']['name'] == 'a'
+    registry.close()
+
+
+def test_restart_replays_log(tmp_path):
+    log = tmp_path / 'models.jsonl'
+    manager = ModelManager(ModelRegistry(log))
+    manager.add_models([_modelo('a'), _modelo('b', 'gasket'), _modelo('c')])
+    manager.remove_model('a')
+    manager.add_model(_modelo('c', size=1.5))
+    manager.close()
+
+    restored = ModelManager(ModelRegistry(log))
+    assert [m['name'] for m in restored.list_models()] == ['b', 'c']
+    assert [m['name'] for m in restored.list_models('ferrule', size=1.5)] == ['c']
+    restored.close()
+
+
+def test_startup_compacts_and_ignores_truncated_line(tmp_path):
+    log = tmp_path / 'models.jsonl'
+    manager = ModelManager(ModelRegistry(log))
+    manager.add_models([_modelo(f'f{i}') for i in range(5)] + [_modelo('g', 'gasket')])
+    manager.clear('ferrule')
+    manager.close()
+    with log.open('a', encoding='utf-8') as fh:
+        fh.write('{"op": "add", "model": {"na')  # volcado interrumpido
+
+    restored = ModelManager(ModelRegistry(log))
+    assert [m['name'] for m in restored.list_models()] == ['g']
+    lines = log.read_text().splitlines()
+    assert len(lines) == 1 and json.loads(lines[0])['model']['name'] == 'g'
+    restored.close()
+
+
+def test_append_after_half_written_line_keeps_new_record(tmp_path):
+    log = tmp_path / 'models.jsonl'
+    manager = ModelManager(ModelRegistry(log))
+    manager.add_model(_modelo('a'))
+    manager.close()
+    with log.open('a', encoding='utf-8') as fh:
+        fh.write('{"op": "add", "model": {"na')  # volcado interrumpido
+
+    # Sin registros obsoletos no se compacta: el nuevo registro se anexa
+    restored = ModelManager(ModelRegistry(log))
+    restored.add_model(_modelo('b', 'gasket'))
+    restored.close()
+
+    again = ModelManager(ModelRegistry(log))
+    assert [m['name'] for m in again.list_models()] == ['a', 'b']
+    again.close()
+
+
+def test_timer_thread_flushes_in_background(tmp_path):
+    log = tmp_path / 'models.jsonl'
+    registry = ModelRegistry(log, flush_interval=0.01)
+    registry.record_add([_modelo('a')])
+
+    deadline = time.monotonic() + 5
+    while not (log.exists() and log.read_text()) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert json.loads(log.read_text())['model']['name'] == 'a'
+    registry.close()
@@ -201,6 +201,45 @@ class TestPreset(unittest.TestCase):
         self.assertIn("Preset(component_type='ferrule'", repr_repr)
         self.assertIn("size=3.0", repr_repr)
         self.assertIn("dn='DN80'", repr_repr)
+    
+    def test_preset_is_immutable_and_compact(self):
+        """Test presets inmutables y sin __dict__"""
+        preset = Preset('ferrule', self.ferrule_data)
+        
+        self.assertFalse(hasattr(preset, '__dict__'))
+        with self.assertRaises(AttributeError):
+            preset.size = 4.0
+        with self.assertRaises(AttributeError):
+            del preset.dn
+        self.assertFalse(hasattr(preset, 'gasket_od_mm'))
+    
+    def test_equality_and_hash(self):
+        """Test presets con los mismos datos son iguales y hashables"""
+        preset1 = Preset('ferrule', self.ferrule_data)
+        preset2 = Preset('ferrule', dict(self.ferrule_data))
+        other = Preset('gasket', self.gasket_data)
+        
+        self.assertEqual(preset1, preset2)
+        self.assertEqual(len({preset1, preset2, other}), 2)
+        self.assertIs(preset1.dn, preset2.dn)
+    
+    def test_pickle_round_trip(self):
+        """Test serialización con pickle"""
+        import pickle
+        preset = Preset('gasket', self.gasket_data)
+        
+        restored = pickle.loads(pickle.dumps(preset))
+        self.assertEqual(restored, preset)
+        self.assertEqual(restored.get_parameters_dict(), preset.get_parameters_dict())
+    
+    def test_parameters_dict_is_cached_copy(self):
+        """Test get_parameters_dict retorna copias de un dict cacheado"""
+        preset = Preset('ferrule', self.ferrule_data)
+        params = preset.get_parameters_dict()
+        params['TubeID_mm'] = 0.0
+        
+        self.assertEqual(preset.get_parameters_dict()['TubeID_mm'], 81.2)
+        self.assertEqual(list(params)[:4], ['Size', 'DN', 'Standard', 'ComponentType'])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitarios para el cache binario de presets
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.data.csv_loader import CSVLoader
+from triptafittings.data.preset import Preset
+
+PRESETS_DIR = Path(__file__).resolve().parents[2] / 'src' / 'triptafittings' / 'data' / 'presets'
+
+
+class TestPresetCache(unittest.TestCase):
+    """Tests para PresetCache integrado en CSVLoader"""
+
+    def setUp(self):
+        """Copia los CSV reales a un directorio temporal"""
+        self.test_dir = tempfile.mkdtemp()
+        shutil.copytree(PRESETS_DIR, os.path.join(self.test_dir, 'presets'),
+                        ignore=shutil.ignore_patterns('*.cache'))
+        self.cache_dir = os.path.join(self.test_dir, 'cache')
+        self.loader = CSVLoader(self.test_dir, cache_dir=self.cache_dir)
+        self.ferrule_csv = Path(self.test_dir) / self.loader.ferrule_csv
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_first_load_writes_snapshot(self):
+        """La primera carga parsea el CSV y escribe la instantánea"""
+        presets = self.loader.load_ferrule_data()
+
+        self.assertEqual(len(presets), 9)
+        self.assertTrue(self.loader.cache.cache_path(self.ferrule_csv).exists())
+
+    def test_snapshot_round_trip(self):
+        """Los presets del cache son equivalentes a los del CSV"""
+        parsed = self.loader.load_gasket_data()
+        with patch.object(Preset, '__init__', side_effect=AssertionError("CSV re-parseado")):
+            cached = self.loader.load_gasket_data()
+
+        self.assertEqual([p.get_parameters_dict() for p in parsed],
+                         [p.get_parameters_dict() for p in cached])
+
+    def test_touch_without_changes_keeps_snapshot(self):
+        """Un cambio de mtime sin cambio de contenido no invalida el cache"""
+        self.loader.load_ferrule_data()
+        stat = os.stat(self.ferrule_csv)
+        os.utime(self.ferrule_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(Preset, '__init__', side_effect=AssertionError("CSV re-parseado")):
+            presets = self.loader.load_ferrule_data()
+        self.assertEqual(len(presets), 9)
+
+    def test_modified_csv_is_reparsed(self):
+        """Un CSV modificado invalida la instantánea"""
+        self.loader.load_ferrule_data()
+        with open(self.ferrule_csv, 'a', encoding='utf-8') as file:
+            file.write('"14""",DN350,370.0,358.0,350.2,350.0,36.0,5.6,1.2,DIN 32676 A\n')
+
+        presets = self.loader.load_ferrule_data()
+        self.assertEqual(len(presets), 10)
+        self.assertEqual(presets[-1].dn, 'DN350')
+
+    def test_corrupt_snapshot_falls_back_to_csv(self):
+        """Una instantánea corrupta se ignora"""
+        self.loader.load_ferrule_data()
+        self.loader.cache.cache_path(self.ferrule_csv).write_bytes(b'basura')
+
+        presets = self.loader.load_ferrule_data()
+        self.assertEqual(len(presets), 9)
+
+    def test_cache_disabled(self):
+        """Con use_cache=False no se escriben instantáneas"""
+        loader = CSVLoader(self.test_dir, use_cache=False, cache_dir=self.cache_dir)
+        loader.load_ferrule_data()
+
+        self.assertIsNone(loader.cache)
+        self.assertFalse(self.loader.cache.cache_path(self.ferrule_csv).exists())
+
+    def test_snapshot_outside_data_directory(self):
+        """La instantánea va al directorio de cache, no junto al CSV"""
+        self.loader.load_ferrule_data()
+        cache_path = self.loader.cache.cache_path(self.ferrule_csv)
+
+        self.assertEqual(cache_path.parent, Path(self.cache_dir))
+        self.assertEqual(list(self.ferrule_csv.parent.glob('*.cache')), [])
+
+    def test_cache_path_keyed_by_csv_path(self):
+        """Dos CSV con el mismo nombre en otros directorios no comparten instantánea"""
+        other_csv = Path(self.test_dir) / 'otro' / self.ferrule_csv.name
+
+        self.assertNotEqual(self.loader.cache.cache_path(self.ferrule_csv),
+                            self.loader.cache.cache_path(other_csv))
+
+    def test_prune_keeps_most_recent_snapshots(self):
+        """Las instantáneas menos usadas por encima del límite se eliminan"""
+        cache = self.loader.cache
+        self.loader.load_ferrule_data()
+        self.loader.load_gasket_data()
+        stale = Path(self.cache_dir) / ('huerfano-0000' + cache.SUFFIX)
+        stale.write_bytes(b'viejo')
+        os.utime(stale, ns=(0, 0))
+
+        with patch.object(type(cache), 'MAX_SNAPSHOTS', 2):
+            self.loader.load_ferrule_data()  # Acierto: no escribe ni poda
+            self.assertTrue(stale.exists())
+            self.loader.cache.invalidate(self.ferrule_csv)
+            self.loader.load_ferrule_data()
+
+        self.assertFalse(stale.exists())
+        self.assertEqual(len(list(Path(self.cache_dir).glob('*' + cache.SUFFIX))), 2)
+
+    def test_default_cache_dir_is_per_user(self):
+        """Sin cache_dir se usa XDG_CACHE_HOME, resuelto al usar el cache"""
+        loader = CSVLoader(self.test_dir)
+        with patch.object(sys, 'platform', 'linux'), \
+                patch.dict(os.environ, {'XDG_CACHE_HOME': self.test_dir}):
+            self.assertEqual(loader.cache.cache_dir,
+                             Path(self.test_dir) / 'triptafittings' / 'presets')
+
+
+if __name__ == '__main__':
+    unittest.main()
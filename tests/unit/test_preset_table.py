@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitarios para la tabla columnar de presets
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.data import preset_table
+from triptafittings.data.preset_table import PresetTable
+
+
+class TestPresetTable(unittest.TestCase):
+    """Tests para PresetTable con el backend disponible"""
+
+    def setUp(self):
+        """Carga el catálogo real de presets"""
+        self.data_manager = DataManager()
+        self.ferrules = self.data_manager.get_all_presets('ferrule')
+        self.table = PresetTable.from_presets('ferrule', self.ferrules)
+
+    def test_columns(self):
+        """Las columnas contienen los valores de los presets"""
+        self.assertEqual(len(self.table), len(self.ferrules))
+        self.assertIn('TubeID_mm', self.table.columns)
+        self.assertEqual(list(self.table.column('Size')), [p.size for p in self.ferrules])
+        self.assertEqual(self.table.dn(3), self.ferrules[3].dn)
+
+    def test_filter_range(self):
+        """Filtro por rango de TubeID"""
+        rows = self.table.filter_range('TubeID_mm', 30, 80)
+        presets = self.table.presets(rows)
+
+        self.assertEqual([p.dn for p in presets], ['DN40', 'DN50', 'DN65'])
+
+    def test_chained_filters(self):
+        """Los filtros se pueden encadenar con indices"""
+        rows = self.table.filter_range('FlangeOD_mm', low=100)
+        rows = self.table.filter_dn(['DN80', 'DN150', 'DN40'], indices=rows)
+
+        self.assertEqual([self.table.dn(i) for i in rows], ['DN80', 'DN150'])
+        self.assertEqual(len(self.table.filter_standard('ISO 2852')), 0)
+
+    def test_lazy_materialization(self):
+        """Los presets se crean solo al pedirlos"""
+        table = PresetTable('gasket', [3.0], ['DN80'], ['DIN 32676 A'], {
+            'FlangeOD_mm': [106.0], 'GasketOD_mm': [106.0], 'GasketID_mm': [81.2],
+            'BeadC2_mm': [97.0], 'ProfileH_mm': [4.3], 'SeatLipWidth_mm': [1.0],
+        })
+        self.assertEqual(table._presets, {})
+
+        preset = table.preset(0)
+        self.assertEqual(preset.get_name(), 'Gasket_3.0in_DN80')
+        self.assertIs(table.preset(0), preset)
+
+    def test_bulk_validation(self):
+        """La validación reporta todas las filas incoherentes"""
+        self.assertTrue(self.table.is_valid())
+
+        table = PresetTable('ferrule', [1.0, 2.0, 3.0], ['DN1', 'DN2', 'DN3'], ['X'] * 3, {
+            'FlangeOD_mm': [50.0, 10.0, 60.0], 'C2_mm': [40.0] * 3,
+            'TubeID_mm': [30.0, 20.0, 0.0], 'PassageDia_mm': [29.0, 19.0, 1.0],
+            'HeightTube_mm': [20.0] * 3, 'HeightProfile_mm': [4.0] * 3,
+            'SeatLipWidth_mm': [1.0] * 3,
+        })
+        failures = table.validate()
+
+        self.assertEqual(failures, {
+            "TubeID debe ser mayor que 0": [2],
+            "FlangeOD debe ser mayor que TubeID": [1],
+        })
+
+    def test_pure_python_backend(self):
+        """Sin NumPy los resultados son los mismos"""
+        with patch.object(preset_table, 'np', None):
+            table = PresetTable.from_presets('ferrule', self.ferrules)
+            rows = table.filter_range('TubeID_mm', 30, 80)
+            self.assertEqual(list(rows), [0, 1, 2])
+            self.assertTrue(table.is_valid())
+
+    def test_data_manager_range_query(self):
+        """DataManager expone las consultas por rango"""
+        presets = self.data_manager.find_presets_in_range('gasket', 'GasketID_mm', 100, 200)
+        self.assertEqual([p.dn for p in presets], ['DN100', 'DN150'])
+        self.assertIs(self.data_manager.get_preset_table('gasket'),
+                      self.data_manager.get_preset_table('gasket'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Tests para la vista previa 2D del corte."""
+import os
+import sys
+
+import pytest
+
+# Añadir la ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.ui import dialog, preview
+from triptafittings.ui.dialog import PreviewWorker, TriptaFittingsDialog
+from triptafittings.ui.preview import (
+    AXIS, BACKGROUND, PreviewCache, preview_key, render_section,
+)
+
+requires_qt = pytest.mark.skipif(not preview.QT_AVAILABLE, reason="Requiere Qt")
+
+
+@pytest.fixture(scope="module")
+def manager():
+    return DataManager()
+
+
+def _fake_render(preset, width=320, height=200):
+    """Sustituto de render_section: un PNG distinto por preset, sin Qt."""
+    return b"\x89PNG\r\n\x1a\n" + f"{preset.get_name()} {width}x{height}".encode()
+
+
+@pytest.fixture
+def fake_render(monkeypatch):
+    calls = []
+    monkeypatch.setattr(preview, "render_section",
+                        lambda *args: calls.append(args) or _fake_render(*args))
+    return calls
+
+
+@requires_qt
+def test_render_section(manager):
+    png = render_section(manager.get_preset_by_size("ferrule", 3.0), 200, 120)
+    image = preview.QtGui.QImage.fromData(png, "PNG")
+
+    def pixel(x, y):
+        return tuple(preview.QtGui.QColor(image.pixel(x, y)).getRgb()[:3])
+
+    assert (image.width(), image.height()) == (200, 120)
+    # Eje en el centro y fondo en el agujero del paso
+    assert pixel(100, 0) == AXIS
+    assert pixel(60, 60) == BACKGROUND
+    # Brida (z = 0 en y = 80): material simétrico a ambos lados del eje
+    filled = [x for x in range(image.width())
+              if x != 100 and pixel(x, 77) not in (BACKGROUND, AXIS)]
+    assert filled and min(filled) < 100 < max(filled)
+    assert min(filled) + max(filled) == pytest.approx(image.width(), abs=2)
+
+
+def test_render_rejects_tiny_image(manager):
+    with pytest.raises(ValueError):
+        render_section(manager.get_preset_by_size("gasket", 3.0), 10, 10)
+
+
+def test_default_preview_dir_is_per_user(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert preview.default_preview_dir() == tmp_path / "triptafittings" / "previews"
+
+
+def test_cache_renders_once_and_persists(tmp_path, manager, fake_render):
+    preset = manager.get_preset_by_size("gasket", 2.0)
+    calls = fake_render
+
+    cache = PreviewCache(tmp_path)
+    assert cache.peek_png(preset) is None
+    png = cache.get_png(preset)
+    assert cache.get_png(preset) is png
+    assert cache.peek_png(preset) is png
+    assert len(calls) == 1
+    assert (tmp_path / (preview_key(preset, 320, 200) + ".png")).read_bytes() == png
+
+    # Otra instancia lee del disco sin dibujar
+    assert PreviewCache(tmp_path).get_png(preset) == png
+    assert len(calls) == 1
+    # Otro tamaño de imagen u otro preset son otras entradas
+    assert preview_key(preset, 100, 100) != preview_key(preset, 320, 200)
+    assert preview_key(manager.get_preset_by_size("gasket", 3.0), 320, 200) != \
+        preview_key(preset, 320, 200)
+
+
+def test_worker_emits_current_first(tmp_path, manager, fake_render):
+    presets = manager.get_all_presets("ferrule")[:3]
+    worker = PreviewWorker(presets, PreviewCache(tmp_path), 160, 100)
+    ready = []
+    worker.signals.ready.connect(lambda key, png: ready.append(key))
+
+    worker.run()
+
+    assert ready == [preview_key(p, 160, 100) for p in presets]
+
+
+@pytest.mark.skipif(dialog.PYSIDE2_AVAILABLE, reason="Usa el modo sin Qt")
+def test_dialog_prefetches_neighbor_sizes(tmp_path, fake_render):
+    dlg = TriptaFittingsDialog(preview_cache=PreviewCache(tmp_path))
+    index = dlg.data_manager.get_sorted_index("ferrule")
+    dlg.current_preset = dlg.data_manager.get_preset_by_size("ferrule", 3.0)
+    dlg._update_preview()
+
+    first = dlg.preview_label.pixmap.data
+    assert first == dlg.preview_cache.peek_png(dlg.current_preset)
+    # Solo el seleccionado y sus vecinos, no todo el catálogo
+    neighbors = index.neighbors(3.0, dialog.PREVIEW_NEIGHBORS)
+    assert [args[0] for args in fake_render] == [dlg.current_preset] + neighbors
+    assert len(fake_render) < len(dlg.data_manager.get_presets_by_type("ferrule"))
+
+    # Pasar al tamaño vecino no vuelve a dibujarlo
+    del fake_render[:]
+    dlg.current_preset = neighbors[0]
+    dlg._update_preview()
+    assert dlg.preview_label.pixmap.data != first
+    assert neighbors[0] not in [args[0] for args in fake_render]
+
+    # Un resultado tardío de otro preset no reemplaza al actual
+    dlg._on_preview_ready("otra", b"png")
+    assert dlg.preview_label.pixmap.data != b"png"
+
+
+@pytest.mark.skipif(dialog.PYSIDE2_AVAILABLE, reason="Usa el modo sin Qt")
+def test_selection_change_cancels_prefetch(tmp_path, monkeypatch, fake_render):
+    dlg = TriptaFittingsDialog(preview_cache=PreviewCache(tmp_path))
+    started = []
+    monkeypatch.setattr(dlg._thread_pool, "start", started.append)
+    dlg.current_preset = dlg.data_manager.get_preset_by_size("ferrule", 2.0)
+    dlg._update_preview()
+    dlg.current_preset = dlg.data_manager.get_preset_by_size("ferrule", 6.0)
+    dlg._update_preview()
+
+    stale, current = started
+    stale.run()
+    assert fake_render == []
+    assert current.presets[0] == dlg.current_preset
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Tests unitarios para los perfiles DIN 32676 y los sólidos revolucionados."""
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.data.preset import Preset
+from triptafittings.generators import profiles
+from triptafittings.generators.factory import build_solid
+from triptafittings.generators.profiles import (
+    PROFILES, ProfileTemplate, check_profile, get_profile_template,
+)
+
+
+def _mock_freecad():
+    """Módulos FreeCAD/Part simulados; Vector retorna tuplas."""
+    freecad = MagicMock(name='FreeCAD')
+    freecad.Vector.side_effect = lambda x, y, z: (x, y, z)
+    part = MagicMock(name='Part')
+    # Cada LineSegment es un objeto distinto, como en FreeCAD
+    part.LineSegment.side_effect = lambda: MagicMock(name='LineSegment')
+    return {'FreeCAD': freecad, 'Part': part}
+
+
+class TestProfiles(unittest.TestCase):
+    def setUp(self):
+        self.data_manager = DataManager()
+        self.ferrule = self.data_manager.get_preset_by_size('ferrule', 3.0)
+        self.gasket = self.data_manager.get_preset_by_size('gasket', 3.0)
+
+    def test_catalog_profiles_are_valid(self):
+        """Todos los presets del catálogo producen polígonos simples"""
+        for component in ('ferrule', 'gasket'):
+            for preset in self.data_manager.get_all_presets(component):
+                points = get_profile_template(component, preset.standard).dimension(preset)
+                self.assertEqual(len(points), len(PROFILES[component](preset)))
+
+    def test_ferrule_dimensions(self):
+        """Las cotas del perfil salen del preset"""
+        points = get_profile_template('ferrule', self.ferrule.standard).dimension(self.ferrule)
+        radii = [r for r, _ in points]
+        heights = [z for _, z in points]
+
+        self.assertEqual(min(radii), self.ferrule.passage_dia_mm / 2)
+        self.assertEqual(max(radii), self.ferrule.flange_od_mm / 2)
+        self.assertEqual(max(heights), self.ferrule.height_tube_mm)
+
+    def test_template_is_shared_per_standard(self):
+        """La plantilla se crea una vez por componente y estándar"""
+        template = get_profile_template('gasket', 'DIN 32676 A')
+        self.assertIs(get_profile_template('gasket', 'DIN 32676 A'), template)
+        self.assertIsNot(get_profile_template('gasket', 'ISO 2852'), template)
+
+    def test_template_rejects_other_component(self):
+        with self.assertRaises(ValueError):
+            get_profile_template('ferrule', self.gasket.standard).dimension(self.gasket)
+
+    def test_check_profile_detects_problems(self):
+        check_profile([(0, 0), (1, 0), (1, 1), (0, 1)])
+        with self.assertRaisesRegex(ValueError, 'se cruzan'):
+            check_profile([(0, 0), (1, 1), (1, 0), (0, 1)])
+        with self.assertRaisesRegex(ValueError, 'radio negativo'):
+            check_profile([(-1, 0), (1, 0), (1, 1)])
+        with self.assertRaisesRegex(ValueError, 'coinciden'):
+            check_profile([(0, 0), (0, 0), (1, 1)])
+
+    def test_build_solid_revolves_closed_profile(self):
+        """build_solid cierra el contorno y lo revoluciona 360° sobre Z"""
+        modules = _mock_freecad()
+        template = ProfileTemplate('ferrule', 'DIN 32676 A', PROFILES['ferrule'])
+        with patch.dict(sys.modules, modules):
+            solid = template.build_solid(self.ferrule)
+
+        part = modules['Part']
+        vectors = [(r, 0.0, z) for r, z in template.dimension(self.ferrule)]
+        segments = template._segments
+        self.assertEqual([(s.StartPoint, s.EndPoint) for s in segments],
+                         list(zip(vectors, vectors[1:] + vectors[:1])))
+        part.Wire.assert_called_once_with([s.toShape.return_value for s in segments])
+        part.Face.assert_called_once_with(part.Wire.return_value)
+        part.Face.return_value.revolve.assert_called_once_with((0, 0, 0), (0, 0, 1), 360.0)
+        self.assertIs(solid, part.Face.return_value.revolve.return_value)
+
+    def test_build_solid_reuses_unchanged_segments(self):
+        """Otro tamaño solo rehace las aristas cuyos extremos cambiaron"""
+        modules = _mock_freecad()
+        template = ProfileTemplate('ferrule', 'DIN 32676 A', PROFILES['ferrule'])
+        parameters = self.ferrule.get_parameters_dict()
+        parameters['HeightTube_mm'] += 10.0
+        taller = Preset.from_values('ferrule', self.ferrule.size, self.ferrule.dn,
+                                    self.ferrule.standard, parameters)
+        with patch.dict(sys.modules, modules):
+            template.build_solid(self.ferrule)
+            segments = list(template._segments)
+            template.build_solid(self.ferrule)
+            template.build_solid(taller)
+
+        self.assertEqual(modules['Part'].LineSegment.call_count, len(segments))
+        self.assertEqual(template._segments, segments)
+        # HeightTube solo mueve los vértices 8 y 9: aristas 7, 8 y 9
+        self.assertEqual([s.toShape.call_count for s in segments], [1] * 7 + [2] * 3)
+
+    def test_generators_build_solid(self):
+        """Los generadores delegan en la plantilla compartida"""
+        modules = _mock_freecad()
+        with patch.dict(sys.modules, modules), patch.dict(profiles._templates, clear=True):
+            build_solid(self.ferrule)
+            build_solid(self.data_manager.get_preset_by_size('ferrule', 6.0))
+            build_solid(self.gasket)
+
+        self.assertEqual(modules['Part'].Face.return_value.revolve.call_count, 3)
+
+    def test_build_solid_without_freecad(self):
+        template = ProfileTemplate('gasket', 'DIN 32676 A', PROFILES['gasket'])
+        with patch.dict(sys.modules, {'FreeCAD': None, 'Part': None}):
+            with self.assertRaisesRegex(ImportError, 'FreeCAD'):
+                template.build_solid(self.gasket)
+
+
+if __name__ == '__main__':
+    unittest.main()
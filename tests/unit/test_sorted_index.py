@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitarios para el índice ordenado y las búsquedas aproximadas
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.data import sorted_index
+from triptafittings.data.sorted_index import SortedIndex
+
+
+class TestSortedIndex(unittest.TestCase):
+    """Tests para SortedIndex"""
+
+    def setUp(self):
+        self.index = SortedIndex([(3.0, 'c'), (1.5, 'a'), (2.0, 'b'), (6.0, 'd')])
+
+    def test_nearest(self):
+        """Valor más cercano, con empates a favor de la clave menor"""
+        self.assertEqual(self.index.nearest(2.4), 'b')
+        self.assertEqual(self.index.nearest(2.5), 'b')
+        self.assertEqual(self.index.nearest(-1.0), 'a')
+        self.assertEqual(self.index.nearest(100.0), 'd')
+        self.assertIsNone(self.index.nearest(4.0, tolerance=0.5))
+        self.assertIsNone(SortedIndex([]).nearest(1.0))
+
+    def test_floor_and_ceiling(self):
+        """Piso y techo"""
+        self.assertEqual(self.index.floor(2.9), 'b')
+        self.assertEqual(self.index.floor(3.0), 'c')
+        self.assertIsNone(self.index.floor(1.0))
+        self.assertEqual(self.index.ceiling(3.1), 'd')
+        self.assertIsNone(self.index.ceiling(7.0))
+
+    def test_within_and_range(self):
+        """Consultas por tolerancia y rango"""
+        self.assertEqual(self.index.within(2.5, 0.5), ['b', 'c'])
+        self.assertEqual(self.index.range(1.5, 2.0), ['a', 'b'])
+
+    def test_neighbors(self):
+        """Valores vecinos a cada lado, del más cercano al más lejano"""
+        self.assertEqual(self.index.neighbors(2.0), ['a', 'c'])
+        self.assertEqual(self.index.neighbors(2.0, count=2), ['a', 'c', 'd'])
+        self.assertEqual(self.index.neighbors(1.5, count=2), ['b', 'c'])
+        self.assertEqual(self.index.neighbors(6.0), ['c'])
+        self.assertEqual(self.index.neighbors(2.5), ['b', 'c'])
+        self.assertEqual(SortedIndex([]).neighbors(1.0), [])
+
+    def test_nearest_many(self):
+        """Búsqueda en bloque, con y sin NumPy"""
+        values = [1.4, 2.5, 5.0, 9.0]
+        expected = ['a', 'b', 'd', None]
+        self.assertEqual(self.index.nearest_many(values, tolerance=1.5), expected)
+        with patch.object(sorted_index, 'np', None):
+            self.assertEqual(self.index.nearest_many(values, tolerance=1.5), expected)
+
+
+class TestDataManagerNearestLookup(unittest.TestCase):
+    """Tests para las búsquedas aproximadas de DataManager"""
+
+    def setUp(self):
+        self.data_manager = DataManager()
+
+    def test_size_lookup_tolerates_rounding(self):
+        """get_preset_by_size acepta diferencias de redondeo"""
+        preset = self.data_manager.get_preset_by_size('ferrule', 1.5000001)
+        self.assertEqual(preset.dn, 'DN40')
+        self.assertIsNone(self.data_manager.get_preset_by_size('ferrule', 1.6))
+
+    def test_snap_measured_tube_id(self):
+        """Un diámetro medido se asigna al preset más cercano"""
+        preset = self.data_manager.find_nearest_preset('ferrule', 80.0, 'TubeID_mm')
+        self.assertEqual(preset.dn, 'DN80')
+
+        index = self.data_manager.get_sorted_index('gasket', 'FlangeOD_mm')
+        self.assertEqual(index.ceiling(100.0).dn, 'DN80')
+
+    def test_match_presets(self):
+        """Asignación en bloque de diámetros medidos"""
+        matches = self.data_manager.match_presets('ferrule', [38.0, 150.0, 500.0], tolerance=1.0)
+        self.assertEqual([m.dn if m else None for m in matches], ['DN40', 'DN150', None])
+
+    def test_unknown_column(self):
+        """Una columna inexistente produce ValueError"""
+        with self.assertRaises(ValueError):
+            self.data_manager.get_sorted_index('ferrule', 'GasketID_mm')
+
+
+if __name__ == '__main__':
+    unittest.main()
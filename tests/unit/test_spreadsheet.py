@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Tests unitarios para los modelos enlazados a hojas de cálculo."""
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Añadir ruta raíz para importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.generators.ferrule import FerruleGenerator
+from triptafittings.generators.spreadsheet import (
+    SpreadsheetBinding, diff_presets, parameter_layout, profile_expressions,
+)
+
+
+class FakeSheet:
+    """Hoja mínima que registra las celdas escritas"""
+
+    def __init__(self, name):
+        self.Name = name
+        self.cells = {}
+        self.aliases = {}
+        self.writes = []
+
+    def set(self, cell, content):
+        self.cells[cell] = content
+        self.writes.append(cell)
+
+    def setAlias(self, cell, alias):
+        self.aliases[cell] = alias
+
+
+class FakeDocument:
+    def __init__(self):
+        self.objects = {}
+        self.recomputes = 0
+
+    def addObject(self, kind, name):
+        obj = FakeSheet(name.replace('.', '_')) if kind == 'Spreadsheet::Sheet' else MagicMock()
+        self.objects[kind] = obj
+        return obj
+
+    def recompute(self):
+        self.recomputes += 1
+
+
+def _freecad_modules():
+    freecad = MagicMock(name='FreeCAD')
+    freecad.Vector.side_effect = lambda x, y, z: SimpleNamespace(x=x, y=y, z=z)
+    return {'FreeCAD': freecad, 'Part': MagicMock(name='Part'),
+            'Sketcher': MagicMock(name='Sketcher')}
+
+
+class TestSpreadsheetBinding(unittest.TestCase):
+    def setUp(self):
+        self.data_manager = DataManager()
+        self.ferrule_2 = self.data_manager.get_preset_by_size('ferrule', 2.0)
+        self.ferrule_25 = self.data_manager.get_preset_by_size('ferrule', 2.5)
+        self.ferrule_3 = self.data_manager.get_preset_by_size('ferrule', 3.0)
+
+    def test_diff_presets(self):
+        """Solo se reportan los parámetros que cambian"""
+        changes = diff_presets(self.ferrule_25, self.ferrule_3)
+        self.assertNotIn('HeightTube_mm', changes)      # 24.0 en ambos
+        self.assertNotIn('HeightProfile_mm', changes)
+        self.assertEqual(changes['FlangeOD_mm'], 106.0)
+        self.assertEqual(diff_presets(self.ferrule_3, self.ferrule_3), {})
+        self.assertEqual(diff_presets(None, self.ferrule_3), self.ferrule_3.get_parameters_dict())
+
+    def test_profile_expressions_use_sheet_aliases(self):
+        expressions = profile_expressions('ferrule', 'Params')
+        self.assertEqual(expressions[1], ('Params.C2_mm / 2 - Params.SeatLipWidth_mm', '0'))
+        self.assertEqual(expressions[-1][1], 'Params.HeightTube_mm')
+
+    def test_create_binds_constraints_to_sheet(self):
+        document = FakeDocument()
+        with patch.dict(sys.modules, _freecad_modules()):
+            binding = SpreadsheetBinding.create(document, self.ferrule_3)
+
+        sheet = binding.sheet
+        layout = parameter_layout('ferrule')
+        self.assertEqual(sheet.aliases[layout['FlangeOD_mm']], 'FlangeOD_mm')
+        self.assertEqual(sheet.cells[layout['FlangeOD_mm']], '106.0')
+        self.assertEqual(sheet.cells[layout['DN']], "'DN80")
+
+        expressions = dict(call.args for call in binding.sketch.setExpression.call_args_list)
+        self.assertEqual(expressions['Constraints.r4'], f'{sheet.Name}.FlangeOD_mm / 2')
+        self.assertEqual(binding.solid.Angle, 360.0)
+        self.assertEqual(document.recomputes, 1)
+
+    def test_apply_preset_touches_only_changed_cells(self):
+        document = FakeDocument()
+        with patch.dict(sys.modules, _freecad_modules()):
+            binding = SpreadsheetBinding.create(document, self.ferrule_25)
+        sheet = binding.sheet
+        sheet.writes.clear()
+
+        changes = binding.apply_preset(self.ferrule_3)
+
+        layout = parameter_layout('ferrule')
+        self.assertEqual(sorted(sheet.writes), sorted(layout[key] for key in changes))
+        self.assertNotIn(layout['HeightTube_mm'], sheet.writes)
+        self.assertEqual(document.recomputes, 2)
+
+        # Mismo preset: ni escrituras ni recompute
+        sheet.writes.clear()
+        self.assertEqual(binding.apply_preset(self.ferrule_3), {})
+        self.assertEqual(sheet.writes, [])
+        self.assertEqual(document.recomputes, 2)
+
+        gasket = self.data_manager.get_preset_by_size('gasket', 3.0)
+        with self.assertRaises(ValueError):
+            binding.apply_preset(gasket)
+
+    def test_generator_update_spreadsheet_with_previous(self):
+        sheet = {}
+        written = FerruleGenerator(self.ferrule_3).update_spreadsheet(sheet, previous=self.ferrule_25)
+
+        self.assertEqual(sheet, written)
+        self.assertNotIn('HeightTube_mm', sheet)
+
+
+if __name__ == '__main__':
+    unittest.main()
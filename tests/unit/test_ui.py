@@ -6,9 +6,17 @@ import sys
 # Añadir la ruta raíz para importaciones
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
 
+from triptafittings.core.data_manager import DataManager
 from triptafittings.ui.interface import UserInterface
 
 
+def test_construccion_no_carga_catalogo():
+    ui = UserInterface(data_manager=DataManager())
+    assert ui.data_manager.is_loaded is False
+    assert 3.0 in ui.list_available_sizes('ferrule')
+    assert ui.data_manager.is_loaded is True
+
+
 def test_listar_tamanos_y_dns():
     ui = UserInterface()
     tamanos = ui.list_available_sizes('ferrule')
@@ -40,3 +48,35 @@ def test_error_tamano_inexistente():
     with pytest.raises(ValueError):
         ui.generate_model('ferrule', 999)
 
+
+
+def test_generar_lote_con_hilos():
+    ui = UserInterface()
+    requests = [('ferrule', 1.5), ('gasket', 3.0), ('ferrule', 999), ('clamp', 3.0)]
+    report = ui.generate_models(requests, workers=2)
+
+    assert report['total'] == 4
+    assert [m['name'] for m in report['models']] == ['Ferrule_1.5in_DN40', 'Gasket_3.0in_DN80']
+    assert [(f['component'], f['size']) for f in report['failures']] == [('ferrule', 999), ('clamp', 3.0)]
+    # Los modelos generados quedan registrados
+    assert len(ui.list_generated_models()) == 2
+
+
+def test_generar_lote_con_procesos():
+    ui = UserInterface()
+    sizes = ui.list_available_sizes('gasket')
+    report = ui.generate_models([('gasket', s) for s in sizes], workers=2, use_processes=True)
+
+    assert report['failures'] == []
+    assert len(report['models']) == len(sizes)
+    assert len(ui.list_generated_models('gasket')) == len(sizes)
+
+
+def test_lote_en_streaming():
+    ui = UserInterface()
+    results = ui.iter_generate_models([('ferrule', 2.0), ('ferrule', 3.0)], workers=1)
+    first = next(results)
+    assert first.ok and first.model['component'] == 'ferrule'
+    # Al abandonar la iteración se registra lo ya generado
+    results.close()
+    assert len(ui.list_generated_models()) == 1
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitarios para el motor de validación por reglas
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
+
+from triptafittings.core.data_manager import DataManager
+from triptafittings.data import preset_table, validation
+from triptafittings.data.csv_loader import CSVLoader
+from triptafittings.data.preset_table import PresetTable
+from triptafittings.data.validation import (
+    ROW_RULES, partner_rows, validate_catalog, validate_table,
+)
+
+PRESETS_DIR = os.path.join(os.path.dirname(__file__), '../..', 'src',
+                           'triptafittings', 'data', 'presets')
+
+
+def _ferrules(sizes, dns, flange_od, tube_id, c2=None, standards=None):
+    """Tabla de Ferrule con las columnas relevantes para las reglas"""
+    rows = len(sizes)
+    return PresetTable('ferrule', sizes, dns, standards or ['DIN 32676 A'] * rows, {
+        'FlangeOD_mm': flange_od, 'C2_mm': c2 or [f - 5.0 for f in flange_od],
+        'TubeID_mm': tube_id, 'PassageDia_mm': [t - 0.2 for t in tube_id],
+        'HeightTube_mm': [20.0] * rows, 'HeightProfile_mm': [4.3] * rows,
+        'SeatLipWidth_mm': [1.0] * rows,
+    })
+
+
+def _gaskets(sizes, dns, flange_od, gasket_id, bead_c2=None, standards=None):
+    """Tabla de Gasket con FlangeOD == GasketOD"""
+    rows = len(sizes)
+    return PresetTable('gasket', sizes, dns, standards or ['DIN 32676 A'] * rows, {
+        'FlangeOD_mm': flange_od, 'GasketOD_mm': flange_od, 'GasketID_mm': gasket_id,
+        'BeadC2_mm': bead_c2 or [f - 5.0 for f in flange_od],
+        'ProfileH_mm': [4.3] * rows, 'SeatLipWidth_mm': [1.0] * rows,
+    })
+
+
+class TestValidationEngine(unittest.TestCase):
+    """Tests de las reglas con el backend disponible"""
+
+    def test_real_catalog_is_valid(self):
+        """El catálogo incluido cumple todas las reglas"""
+        reports = DataManager().validate_catalog()
+
+        self.assertEqual(set(reports), {'ferrule', 'gasket'})
+        for report in reports.values():
+            self.assertTrue(report.is_valid(), report.to_dict())
+            self.assertEqual(report.skipped, [])
+            self.assertEqual(report.rows, 9)
+
+    def test_report_per_row_and_rule(self):
+        """Una fila con varios problemas los reporta todos"""
+        table = _ferrules([1.0, 2.0, 3.0], ['DN1', 'DN2', 'DN3'],
+                          [50.0, 10.0, 60.0], [30.0, 20.0, 0.0])
+        report = validate_table(table)
+
+        self.assertEqual(report.failed_rows('flange_over_tube'), [1])
+        self.assertEqual(report.failed_rows('positive:TubeID_mm'), [2])
+        self.assertEqual(report.row_errors(), {
+            1: ["FlangeOD debe ser mayor que TubeID",
+                "FlangeOD debe crecer con el tamaño",
+                "TubeID debe crecer con el tamaño"],
+            2: ["TubeID debe ser mayor que 0",
+                "PassageDia debe ser mayor que 0",
+                "TubeID debe crecer con el tamaño"],
+        })
+        self.assertEqual(report.invalid_rows(), [1, 2])
+        self.assertFalse(report.is_valid())
+        # Sin la tabla de Gasket las reglas de emparejamiento no se evalúan
+        self.assertEqual(report.skipped, ['pairing', 'pairing:seat'])
+
+    def test_required_dn_and_standard(self):
+        """Una fila sin DN o sin estándar se reporta, con y sin NumPy"""
+        def report():
+            table = _ferrules([1.0, 2.0, 3.0], ['DN25', '', 'DN80'],
+                              [50.0, 64.0, 106.0], [22.0, 50.2, 81.2],
+                              standards=['DIN 32676 A', 'DIN 32676 A', '  '])
+            return validate_table(table, rules=ROW_RULES['ferrule'])
+
+        expected = report()
+        self.assertEqual(expected.row_errors(), {
+            1: ["DN es obligatorio"],
+            2: ["Standard es obligatorio"],
+        })
+        with patch.object(preset_table, 'np', None), patch.object(validation, 'np', None):
+            self.assertEqual(report().to_dict(), expected.to_dict())
+
+    def test_monotonic_is_per_standard_and_unordered(self):
+        """El crecimiento se evalúa por estándar, sin importar el orden de las filas"""
+        table = _ferrules([3.0, 1.0, 2.0, 1.0, 2.0], ['DN80', 'DN25', 'DN50', 'DN25', 'DN50'],
+                          [106.0, 50.5, 64.0, 90.0, 80.0], [81.2, 22.0, 50.2, 22.0, 40.0],
+                          standards=['A', 'A', 'A', 'B', 'B'])
+        report = validate_table(table)
+
+        self.assertEqual(report.failed_rows('monotonic:FlangeOD_mm'), [4])
+        self.assertEqual(report.failed_rows('monotonic:TubeID_mm'), [])
+
+    def test_pairing(self):
+        """Cada Ferrule necesita un Gasket del mismo tamaño, DN y estándar con el mismo asiento"""
+        ferrules = _ferrules([1.5, 2.0, 3.0, 4.0], ['DN40', 'DN50', 'DN80', 'DN100'],
+                             [50.5, 64.0, 106.0, 119.0], [38.2, 50.2, 81.2, 100.2])
+        gaskets = _gaskets([4.0, 3.0, 2.0, 2.5], ['DN100', 'DN80', 'DN55', 'DN65'],
+                           [119.0, 107.0, 64.0, 91.0], [100.2, 81.2, 50.2, 66.2])
+
+        self.assertEqual(list(partner_rows(ferrules, gaskets)), [-1, -1, 1, 0])
+        reports = validate_catalog(ferrules, gaskets)
+
+        self.assertEqual(reports['ferrule'].failed_rows('pairing'), [0, 1])
+        self.assertEqual(reports['ferrule'].failed_rows('pairing:seat'), [2])
+        self.assertEqual(reports['gasket'].failed_rows('pairing'), [2, 3])
+        self.assertEqual(reports['gasket'].failed_rows('pairing:seat'), [1])
+
+    def test_validate_keeps_row_rules_only(self):
+        """PresetTable.validate usa solo las reglas por fila"""
+        table = _ferrules([1.0, 2.0], ['DN1', 'DN2'], [50.0, 40.0], [30.0, 20.0])
+
+        self.assertTrue(table.is_valid())
+        self.assertFalse(table.report().is_valid())
+        self.assertEqual(
+            table.validate(),
+            validate_table(table, rules=ROW_RULES['ferrule']).failures())
+
+    def test_pure_python_backend_matches(self):
+        """Sin NumPy el reporte es el mismo"""
+        rng = random.Random(7)
+        rows = 300
+        sizes = [rng.choice([0.0, 1.0, 1.5, 2.0, 3.0, 4.0, 6.0]) for _ in range(rows)]
+        dns = [f"DN{int(s * 25)}" for s in sizes]
+        standards = [rng.choice(['A', 'B', 'C']) for _ in range(rows)]
+        flange = [rng.uniform(10, 200) for _ in range(rows)]
+        tube = [rng.uniform(-5, 150) for _ in range(rows)]
+        bore = [rng.choice([t, t + 1.0]) for t in tube]
+
+        def reports():
+            ferrules = _ferrules(sizes, dns, flange, tube, standards=standards)
+            gaskets = _gaskets(sizes[::-1], dns[::-1], flange[::-1], bore[::-1],
+                               standards=standards[::-1])
+            return {k: r.to_dict() for k, r in validate_catalog(ferrules, gaskets).items()}
+
+        expected = reports()
+        with patch.object(preset_table, 'np', None), patch.object(validation, 'np', None):
+            self.assertEqual(reports(), expected)
+        self.assertFalse(expected['ferrule']['valid'])
+
+
+class TestCSVValidation(unittest.TestCase):
+    """Validación columnar de los CSV sin excepciones por fila"""
+
+    def setUp(self):
+        """Copia los CSV reales a un directorio temporal"""
+        self.temp_dir = tempfile.mkdtemp()
+        shutil.copytree(PRESETS_DIR, os.path.join(self.temp_dir, 'presets'),
+                        ignore=shutil.ignore_patterns('*.cache'))
+        self.loader = CSVLoader(self.temp_dir, use_cache=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _edit(self, component, line, old, new):
+        """Reemplaza un valor en una línea del CSV"""
+        path = os.path.join(self.temp_dir, getattr(self.loader, f"{component}_csv"))
+        with open(path, encoding='utf-8') as file:
+            lines = file.read().split('\n')
+        lines[line - 1] = lines[line - 1].replace(old, new)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines))
+
+    def test_reports_all_rows_in_one_pass(self):
+        """Los errores de varias filas se reportan juntos en lugar de abortar"""
+        self._edit('ferrule', 3, ',50.2,', ',abc,')         # 2": TubeID ilegible
+        self._edit('gasket', 5, '106.0,106.0', '106.0,107.0')  # 3": GasketOD != FlangeOD
+
+        with self.assertRaises(ValueError):
+            self.loader.load_ferrule_data()
+
+        reports = self.loader.validate_files()
+        self.assertEqual(reports['ferrule'].row_errors(), {
+            1: ["TubeID debe ser mayor que 0", "FlangeOD debe ser mayor que TubeID"],
+        })
+        self.assertEqual(reports['gasket'].row_errors(), {
+            3: ["FlangeOD debe ser igual a GasketOD para Gasket"],
+        })
+
+    def test_load_table_matches_presets(self):
+        """La tabla leída del CSV tiene los mismos valores que los presets"""
+        table = self.loader.load_table('gasket')
+        expected = PresetTable.from_presets('gasket', self.loader.load_gasket_data())
+
+        self.assertEqual(len(table), 9)
+        for column in expected.columns:
+            self.assertEqual(list(table.column(column)), list(expected.column(column)))
+        self.assertEqual([table.dn(i) for i in range(9)], [expected.dn(i) for i in range(9)])
+
+
+if __name__ == '__main__':
+    unittest.main()
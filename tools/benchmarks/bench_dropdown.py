@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Microbenchmark de refrescos repetidos del dropdown de tamaños.
+
+Simula lo que hace ``TriptaFittingsDialog`` al cambiar de componente:
+consultar ``get_available_sizes``/``get_available_dns`` y el resumen de
+datos.  Tras la primera llamada de cada generación de carga el costo por
+refresco no depende del número de presets.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_catalog import write_catalog  # noqa: E402
+from triptafittings.core.data_manager import DataManager  # noqa: E402
+
+CATALOG_SIZES = [10, 1_000, 10_000, 50_000]
+REFRESHES = 10_000
+
+
+def measure(rows: int) -> tuple:
+    """Retorna (primer refresco, refresco promedio) en microsegundos."""
+    with tempfile.TemporaryDirectory() as tmp:
+        write_catalog(tmp, rows)
+        manager = DataManager(tmp)
+        manager.load_all_data()
+
+        start = time.perf_counter()
+        manager.get_available_sizes("ferrule")
+        manager.get_available_dns("ferrule")
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(REFRESHES):
+            component = "ferrule" if i % 2 else "gasket"
+            manager.get_available_sizes(component)
+            manager.get_available_dns(component)
+        repeated = (time.perf_counter() - start) / REFRESHES
+
+    return first * 1e6, repeated * 1e6
+
+
+def main():
+    """Función principal."""
+    print(f"{'Filas':>8} {'1er refresco (us)':>19} {'Refresco (us)':>15}")
+    for rows in CATALOG_SIZES:
+        first, repeated = measure(rows)
+        print(f"{rows:>8} {first:>19.1f} {repeated:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
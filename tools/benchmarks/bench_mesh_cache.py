@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Microbenchmark del cache de mallas por nivel de detalle.
+
+Para cada nivel (``preview``, ``standard``, ``export``) mide el tiempo de
+obtener las mallas de todo el catálogo: teselando, desde el archivo
+``.mesh`` mapeado en memoria (cache nuevo sobre el mismo directorio) y
+desde el nivel de memoria.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from triptafittings.core.data_manager import DataManager  # noqa: E402
+from triptafittings.generators.mesh_cache import LOD_PRESETS, MeshCache  # noqa: E402
+
+
+def measure(presets, cache, lod) -> float:
+    """Retorna milisegundos por malla."""
+    start = time.perf_counter()
+    for preset in presets:
+        cache.get_mesh(preset, lod)
+    return (time.perf_counter() - start) / len(presets) * 1e3
+
+
+def main():
+    """Función principal."""
+    manager = DataManager()
+    presets = manager.get_all_presets('ferrule') + manager.get_all_presets('gasket')
+    print(f"{'Nivel':>9} {'Triángulos':>11} {'Teselar (ms)':>13} "
+          f"{'mmap (ms)':>10} {'Memoria (ms)':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for lod in LOD_PRESETS:
+            cold = measure(presets, MeshCache(tmp), lod)
+            warm_cache = MeshCache(tmp)
+            mapped = measure(presets, warm_cache, lod)
+            memory = measure(presets, warm_cache, lod)
+            triangles = warm_cache.get_mesh(presets[-1], lod).triangle_count
+            print(f"{lod:>9} {triangles:>11} {cold:>13.2f} {mapped:>10.3f} {memory:>13.4f}")
+
+
+if __name__ == "__main__":
+    main()
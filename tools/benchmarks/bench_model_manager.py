@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Microbenchmark del registro de modelos generados.
+
+Registra 100 000 modelos en ``ModelManager`` y compara los listados
+filtrados y la limpieza por componente contra un recorrido completo del
+registro (el comportamiento anterior a los índices secundarios).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import synthetic_catalog  # noqa: E402,F401  (configura sys.path hacia src)
+from triptafittings.core.model_manager import ModelManager  # noqa: E402
+
+MODELS = 100_000
+# Pocos modelos de un componente raro entre muchos de los comunes
+RARE_EVERY = 1_000
+SIZES = [0.5 + 0.25 * i for i in range(40)]
+
+
+def make_models(count: int) -> list:
+    """Modelos con la misma estructura que ``generate_geometry``."""
+    models = []
+    for i in range(count):
+        component = "clamp" if i % RARE_EVERY == 0 else ("ferrule" if i % 2 else "gasket")
+        size = SIZES[i % len(SIZES)]
+        models.append({
+            "name": f"{component}_{i}",
+            "component": component,
+            "parameters": {"Size": size, "DN": f"DN{int(size * 25)}",
+                           "Standard": "DIN 32676 A"},
+        })
+    return models
+
+
+def timed(func, repeat: int = 1) -> float:
+    """Tiempo promedio en milisegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    """Función principal."""
+    models = make_models(MODELS)
+    manager = ModelManager()
+    add_ms = timed(lambda: manager.add_models(models))
+    print(f"Registro de {MODELS} modelos: {add_ms:.1f} ms")
+
+    registry = manager._models
+
+    def scan(component):
+        return [m for m in registry.values() if m.get("component") == component]
+
+    rows = [
+        ("list_models('clamp')", lambda: manager.list_models("clamp"),
+         lambda: scan("clamp")),
+        ("list_models(size=3.0, dn='DN75')",
+         lambda: manager.list_models(size=3.0, dn="DN75"),
+         lambda: [m for m in registry.values()
+                  if m["parameters"]["Size"] == 3.0 and m["parameters"]["DN"] == "DN75"]),
+    ]
+    print(f"{'Consulta':<34} {'Índice (ms)':>12} {'Recorrido (ms)':>15}")
+    for label, indexed, full_scan in rows:
+        assert indexed() == full_scan()
+        print(f"{label:<34} {timed(indexed, 50):>12.3f} {timed(full_scan, 50):>15.3f}")
+
+    clear_ms = timed(lambda: manager.clear("clamp"))
+    print(f"clear('clamp') ({MODELS // RARE_EVERY} modelos): {clear_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark de memoria por preset.
+
+Compara el ``Preset`` basado en ``__slots__`` con una representación
+equivalente basada en ``__dict__`` por instancia (la forma anterior de la
+clase), midiendo con ``tracemalloc`` el costo de mantener N presets vivos.
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import synthetic_catalog  # noqa: E402,F401  (configura sys.path)
+from triptafittings.data.preset import Preset, FERRULE_FIELDS  # noqa: E402
+
+PRESETS = 100_000
+
+
+class DictPreset:
+    """Preset de referencia con ``__dict__`` por instancia."""
+
+    def __init__(self, row: dict) -> None:
+        self.component_type = "ferrule"
+        self.size = float(row["Size"].rstrip('"'))
+        # Cadenas nuevas por instancia, como al leerlas de un CSV sin internar
+        self.dn = "".join(row["DN"])
+        self.standard = "".join(row["Standard"])
+        for column, attribute in FERRULE_FIELDS:
+            setattr(self, attribute, float(row[column]))
+
+
+def make_rows(count: int) -> list:
+    """Filas de datos tal como las entrega ``CSVLoader``."""
+    rows = []
+    for i in range(count):
+        size = round(0.5 + i * 0.01, 2)
+        tube_id = size * 25.0
+        rows.append({
+            "Size": f'{size}"', "DN": f"DN{i % 400}", "FlangeOD_mm": tube_id + 15.0,
+            "C2_mm": tube_id + 8.0, "TubeID_mm": tube_id, "PassageDia_mm": tube_id - 0.2,
+            "HeightTube_mm": 20.0, "HeightProfile_mm": 4.3, "SeatLipWidth_mm": 1.0,
+            "Standard": "".join("DIN 32676 A"),
+        })
+    return rows
+
+
+def measure(factory) -> tuple:
+    """Retorna (bytes por objeto, segundos de construcción)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = factory()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(objects), elapsed
+
+
+def main():
+    """Función principal."""
+    rows = make_rows(PRESETS)
+    reference = [Preset("ferrule", row) for row in rows]
+
+    slots_bytes, slots_time = measure(lambda: [Preset("ferrule", row) for row in rows])
+    dict_bytes, _ = measure(lambda: [DictPreset(row) for row in rows])
+
+    print(f"Presets: {PRESETS}")
+    print(f"__dict__ por instancia: {dict_bytes:8.1f} bytes/preset")
+    print(f"__slots__ (Preset):     {slots_bytes:8.1f} bytes/preset "
+          f"({100 * (1 - slots_bytes / dict_bytes):.0f}% menos)")
+    print(f"Construcción: {slots_time / PRESETS * 1e6:.2f} us/preset")
+
+    start = time.perf_counter()
+    for preset in reference:
+        preset.get_parameters_dict()
+    print(f"get_parameters_dict (cacheado): "
+          f"{(time.perf_counter() - start) / PRESETS * 1e6:.2f} us/llamada (1ra)")
+    start = time.perf_counter()
+    for preset in reference:
+        preset.get_parameters_dict()
+    print(f"get_parameters_dict (cacheado): "
+          f"{(time.perf_counter() - start) / PRESETS * 1e6:.2f} us/llamada (siguientes)")
+
+
+if __name__ == "__main__":
+    main()
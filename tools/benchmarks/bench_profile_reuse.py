@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Microbenchmark de construcción de sólidos con y sin reutilizar plantillas.
+
+Compara ``get_profile_template(...).build_solid`` (segmentos del contorno
+creados una vez por estándar; por tamaño solo se rehacen las aristas que
+cambian) contra la construcción directa de cada sólido: vértices ->
+``Part.makePolygon`` -> ``Part.Face`` -> ``revolve``.  Con FreeCAD
+instalado se miden sólidos reales; sin FreeCAD se usan sustitutos mínimos
+de ``FreeCAD.Vector`` y ``Part``, de modo que solo se mide el costo propio
+del plugin.
+"""
+
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_catalog import write_catalog  # noqa: E402
+from triptafittings.core.data_manager import DataManager  # noqa: E402
+from triptafittings.generators.profiles import (  # noqa: E402
+    PROFILES, check_profile, get_profile_template,
+)
+
+ROWS = 2_000
+
+
+def install_stand_ins() -> bool:
+    """Registra FreeCAD/Part mínimos si FreeCAD no está disponible."""
+    try:
+        import FreeCAD  # noqa: F401
+        import Part  # noqa: F401
+        return False
+    except ImportError:
+        pass
+
+    class LineSegment:
+        def __init__(self):
+            self.StartPoint = self.EndPoint = None
+
+        def toShape(self):
+            return (self.StartPoint, self.EndPoint)
+
+    class Face:
+        def __init__(self, wire):
+            self.wire = wire
+
+        def revolve(self, origin, axis, angle):
+            return (self.wire, origin, axis, angle)
+
+    freecad = types.ModuleType("FreeCAD")
+    freecad.Vector = lambda x, y, z: (x, y, z)
+    part = types.ModuleType("Part")
+    part.makePolygon = list
+    part.LineSegment = LineSegment
+    part.Wire = list
+    part.Face = Face
+    sys.modules["FreeCAD"] = freecad
+    sys.modules["Part"] = part
+    return True
+
+
+def build_from_scratch(preset):
+    """Construcción directa: un polígono, una cara y una revolución nuevos."""
+    import FreeCAD
+    import Part
+
+    points = [(float(r), float(z)) for r, z in PROFILES[preset.component_type](preset)]
+    check_profile(points, preset.get_name())
+    vectors = [FreeCAD.Vector(r, 0.0, z) for r, z in points]
+    vectors.append(vectors[0])
+    face = Part.Face(Part.makePolygon(vectors))
+    return face.revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360.0)
+
+
+def measure(presets) -> tuple:
+    """Retorna (reutilizando, desde cero) en microsegundos por sólido."""
+    start = time.perf_counter()
+    for preset in presets:
+        get_profile_template(preset.component_type, preset.standard).build_solid(preset)
+    reuse = (time.perf_counter() - start) / len(presets)
+
+    start = time.perf_counter()
+    for preset in presets:
+        build_from_scratch(preset)
+    scratch = (time.perf_counter() - start) / len(presets)
+    return reuse * 1e6, scratch * 1e6
+
+
+def main():
+    """Función principal."""
+    stand_ins = install_stand_ins()
+    print("Backend:", "sustitutos sin FreeCAD" if stand_ins else "FreeCAD Part")
+    with tempfile.TemporaryDirectory() as tmp:
+        write_catalog(tmp, ROWS)
+        manager = DataManager(tmp)
+        manager.load_all_data()
+        print(f"{'Componente':>10} {'Plantilla (us)':>15} {'Desde cero (us)':>16}")
+        for component in ("ferrule", "gasket"):
+            reuse, scratch = measure(manager.get_presets_by_type(component))
+            print(f"{component:>10} {reuse:>15.1f} {scratch:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark del costo de arranque del workbench frente al tamaño del catálogo.
+
+Mide, para catálogos sintéticos de distinto tamaño, el tiempo de lo que
+ocurre al registrar el workbench (crear ``UserInterface`` para cada
+comando) y el de la primera consulta, que es cuando realmente se parsean
+los CSV.  El costo de registro debe mantenerse constante.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_catalog import write_catalog  # noqa: E402
+from triptafittings.core.data_manager import DataManager  # noqa: E402
+from triptafittings.ui.interface import UserInterface  # noqa: E402
+
+CATALOG_SIZES = [10, 1_000, 10_000, 50_000]
+
+
+def measure(rows: int) -> tuple:
+    """Retorna (tiempo de registro, tiempo de primera consulta) en ms."""
+    with tempfile.TemporaryDirectory() as tmp:
+        write_catalog(tmp, rows)
+
+        start = time.perf_counter()
+        # Equivalente a instanciar los comandos de ``COMMANDS``
+        interfaces = [UserInterface(data_manager=DataManager(tmp)) for _ in range(3)]
+        registration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        interfaces[0].list_available_sizes("ferrule")
+        first_query = time.perf_counter() - start
+
+    return registration * 1000, first_query * 1000
+
+
+def main():
+    """Función principal."""
+    start = time.perf_counter()
+    import triptafittings.workbench.init_gui  # noqa: F401
+    import_time = (time.perf_counter() - start) * 1000
+    print(f"Importación del workbench: {import_time:.2f} ms")
+
+    print(f"{'Filas':>8} {'Registro (ms)':>15} {'1ra consulta (ms)':>19}")
+    for rows in CATALOG_SIZES:
+        registration, first_query = measure(rows)
+        print(f"{rows:>8} {registration:>15.3f} {first_query:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Microbenchmark de la validación de catálogos grandes.
+
+Compara, sobre un catálogo sintético de Ferrule/Gasket, la carga fila a
+fila con ``Preset`` (una excepción por fila inválida) con la lectura
+columnar (``CSVLoader.load_table``) y la evaluación de todas las reglas
+de ``data.validation`` en una pasada.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_catalog import write_catalog  # noqa: E402
+from triptafittings.data.csv_loader import CSVLoader  # noqa: E402
+from triptafittings.data.validation import validate_catalog  # noqa: E402
+
+
+def timed(function):
+    """Retorna (resultado, milisegundos)."""
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main(rows: int = 50_000):
+    """Función principal."""
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = CSVLoader(str(write_catalog(tmp, rows)), use_cache=False)
+        _, per_row = timed(lambda: (loader.load_ferrule_data(), loader.load_gasket_data()))
+        tables, parse = timed(lambda: (loader.load_table('ferrule'), loader.load_table('gasket')))
+        reports, rules = timed(lambda: validate_catalog(*tables))
+
+    print(f"Filas por componente: {rows}")
+    print(f"Carga con Preset (fila a fila):  {per_row:8.1f} ms")
+    print(f"Lectura columnar:                {parse:8.1f} ms")
+    print(f"Todas las reglas (2 tablas):     {rules:8.1f} ms")
+    for component, report in reports.items():
+        print(f"  {component}: {len(report.rules)} reglas, "
+              f"{len(report.invalid_rows())} filas inválidas")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
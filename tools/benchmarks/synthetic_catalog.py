@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Generación de catálogos sintéticos para los benchmarks.
+
+Escribe CSV de Ferrule y Gasket con la misma estructura que los presets
+reales pero con tantas filas como se necesite, respetando las reglas de
+coherencia de ``Preset``.
+"""
+
+import csv
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from triptafittings.data.csv_loader import CSVLoader  # noqa: E402
+
+FERRULE_HEADERS = [
+    "Size", "DN", "FlangeOD_mm", "C2_mm", "TubeID_mm", "PassageDia_mm",
+    "HeightTube_mm", "HeightProfile_mm", "SeatLipWidth_mm", "Standard",
+]
+GASKET_HEADERS = [
+    "Size", "DN", "FlangeOD_mm", "GasketOD_mm", "GasketID_mm",
+    "BeadC2_mm", "ProfileH_mm", "SeatLipWidth_mm", "Standard",
+]
+
+
+def write_catalog(directory: str, rows: int, standard: str = "DIN 32676 A") -> Path:
+    """Escribe un catálogo sintético de ``rows`` filas por componente.
+
+    Returns
+    -------
+    Path
+        Directorio de datos utilizable con ``CSVLoader``/``DataManager``.
+    """
+    loader = CSVLoader(directory, use_cache=False)
+    data_dir = Path(directory)
+    ferrule_path = data_dir / loader.ferrule_csv
+    gasket_path = data_dir / loader.gasket_csv
+    ferrule_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(ferrule_path, "w", newline="", encoding="utf-8") as ferrule_file, \
+            open(gasket_path, "w", newline="", encoding="utf-8") as gasket_file:
+        ferrules = csv.writer(ferrule_file)
+        gaskets = csv.writer(gasket_file)
+        ferrules.writerow(FERRULE_HEADERS)
+        gaskets.writerow(GASKET_HEADERS)
+        for i in range(rows):
+            size = round(0.5 + i * 0.01, 2)
+            tube_id = round(size * 25.0, 2)
+            flange_od = round(tube_id + 15.0, 2)
+            c2 = round(tube_id + 8.0, 2)
+            dn = f"DN{i + 1}"
+            ferrules.writerow([
+                f'{size}"', dn, flange_od, c2, tube_id, round(tube_id - 0.2, 2),
+                20.0, 4.3, 1.0, standard,
+            ])
+            gaskets.writerow([
+                f'{size}"', dn, flange_od, flange_od, tube_id, c2,
+                4.3, 1.0, standard,
+            ])
+    return data_dir
+
+
+def remove_caches(directory: str) -> None:
+    """Elimina las instantáneas binarias de un catálogo sintético."""
+    for path in Path(directory).rglob("*.cache"):
+        os.unlink(path)